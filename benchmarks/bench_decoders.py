@@ -0,0 +1,84 @@
+"""Compares the fused decoders with the previous multi-pass conversion.
+
+Usage: python -m benchmarks.bench_decoders
+"""
+import time
+from copy import deepcopy
+
+from .payloads import make_heartbeat_list, make_monitor_list
+
+from uptime_kuma_api import AuthMethod, MonitorStatus, MonitorType
+from uptime_kuma_api.decoders import decode_heartbeats, decode_list, decode_monitor
+
+
+# the conversion helpers that the decoders replaced, one pass per key
+def int_to_bool(data, keys):
+    if isinstance(data, list):
+        for d in data:
+            int_to_bool(d, keys)
+    else:
+        for key in keys:
+            if key in data:
+                data[key] = True if data[key] == 1 else False
+
+
+def parse_value(data, key, type_, default=None):
+    if not data:
+        return
+    if isinstance(data, list):
+        for d in data:
+            parse_value(d, key, type_, default)
+    else:
+        if key in data:
+            if data[key] is not None:
+                try:
+                    data[key] = type_(data[key])
+                except ValueError:
+                    pass
+            elif default is not None:
+                data[key] = default
+
+
+def multi_pass_monitors(monitors):
+    for monitor in monitors:
+        if isinstance(monitor["notificationIDList"], dict):
+            monitor["notificationIDList"] = [int(i) for i in monitor["notificationIDList"].keys()]
+    int_to_bool(monitors, ["active"])
+    parse_value(monitors, "type", MonitorType)
+    parse_value(monitors, "authMethod", AuthMethod, AuthMethod.NONE)
+    return monitors
+
+
+def multi_pass_heartbeats(heartbeats):
+    for i in heartbeats:
+        int_to_bool(heartbeats[i], ["important"])
+        parse_value(heartbeats[i], "status", MonitorStatus)
+    return heartbeats
+
+
+def measure(func, make_input, repeat=5):
+    timings = []
+    for _ in range(repeat):
+        data = make_input()
+        start = time.perf_counter()
+        func(data)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    monitors = list(make_monitor_list(10_000).values())
+    heartbeats = {i: make_heartbeat_list(i, 100, i * 100) for i in range(1, 1001)}
+
+    cases = [
+        ("10k monitors", monitors, multi_pass_monitors, lambda r: decode_list(decode_monitor, r)),
+        ("100k heartbeats", heartbeats, multi_pass_heartbeats, decode_heartbeats),
+    ]
+    for name, data, old, new in cases:
+        t_old = measure(old, lambda: deepcopy(data))
+        t_new = measure(new, lambda: deepcopy(data))
+        print(f"{name:<16} multi-pass {t_old * 1000:8.1f} ms   fused {t_new * 1000:8.1f} ms   x{t_old / t_new:.1f}")
+
+
+if __name__ == "__main__":
+    main()
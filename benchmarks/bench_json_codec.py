@@ -0,0 +1,69 @@
+"""Compares the JSON codecs on large monitorList and heartbeatList frames.
+
+The frames are decoded the same way python-socketio decodes them. Recorded frames can be passed as files
+that contain one Socket.IO packet per line (e.g. ``42["monitorList",{...}]``), otherwise synthetic frames
+with 10k monitors and 1k heartbeat lists are used.
+
+Usage: python -m benchmarks.bench_json_codec [FRAME_FILE ...]
+"""
+import sys
+import time
+
+from socketio import packet
+
+from uptime_kuma_api.json_codec import get_json_codec, orjson_codec
+
+from .payloads import make_heartbeat_list, make_monitor_list
+
+
+def synthetic_frames():
+    codec = get_json_codec("json")
+    monitor_list = codec.dumps(["monitorList", make_monitor_list(10_000)], separators=(",", ":"))
+    heartbeat_lists = [
+        codec.dumps(["heartbeatList", i, make_heartbeat_list(i, 100), True], separators=(",", ":"))
+        for i in range(1, 1001)
+    ]
+    return [
+        ("monitorList (10k monitors)", ["42" + monitor_list]),
+        ("heartbeatList (1k x 100 beats)", ["42" + i for i in heartbeat_lists]),
+    ]
+
+
+def recorded_frames(paths):
+    frames = []
+    for path in paths:
+        with open(path) as f:
+            frames.append((path, [line.rstrip("\n") for line in f if line.strip()]))
+    return frames
+
+
+def measure(codec, encoded_packets, repeat=5):
+    packet.Packet.json = codec
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for encoded_packet in encoded_packets:
+            packet.Packet(encoded_packet=encoded_packet)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    frames = recorded_frames(sys.argv[1:]) if sys.argv[1:] else synthetic_frames()
+    codecs = [get_json_codec("json")]
+    if orjson_codec is not None:
+        codecs.append(orjson_codec)
+    original_json = packet.Packet.json
+    try:
+        for name, encoded_packets in frames:
+            size = sum(len(i) for i in encoded_packets) / 1024 / 1024
+            results = "   ".join(
+                f"{codec.name} {measure(codec, encoded_packets) * 1000:8.1f} ms" for codec in codecs
+            )
+            print(f"{name:<32} {size:6.1f} MiB   {results}")
+    finally:
+        packet.Packet.json = original_json
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,258 @@
+"""Pushes heartbeat and statistics event storms to one client and reports how well it keeps up.
+
+The fake server sends ``heartbeat``, ``heartbeatList``, ``importantHeartbeatList``, ``uptime`` and ``avgPing``
+events of random monitors at fixed rates. The client registers event listeners that count the handled events,
+so the listeners run after the client has stored the event data. Every ``--interval`` seconds it reports:
+
+- the sent and handled events per second
+- the backlog (sent but not yet handled events), it grows if the client cannot keep up
+- the median and 99th percentile handler latency of the heartbeat events (time from sending until the handler has
+  finished, heartbeats carry their send time in the field ``sentAt``)
+- the size of ``_event_data`` in bytes
+
+The client and the server run in the same process, so the server threads compete with the client for the GIL.
+The rates are therefore a lower bound of what a client can ingest from a real server.
+
+Usage: python -m benchmarks.load_generator [--monitors 1000] [--heartbeat-rate 1000] [--list-rate 10]
+                                           [--stats-rate 100] [--duration 30] [--interval 1] [--output FILE]
+"""
+import argparse
+import itertools
+import json
+import random
+import statistics
+import sys
+import threading
+import time
+
+from uptime_kuma_api import Event, UptimeKumaApi
+from uptime_kuma_api.fake_server import FakeUptimeKumaServer, make_heartbeat
+
+events = [Event.HEARTBEAT, Event.HEARTBEAT_LIST, Event.IMPORTANT_HEARTBEAT_LIST, Event.UPTIME, Event.AVG_PING]
+
+
+def deep_sizeof(obj, seen=None):
+    # approximate memory of nested dicts and lists in bytes, shared objects are counted once
+    if seen is None:
+        seen = set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        for key, value in list(obj.items()):
+            size += deep_sizeof(key, seen) + deep_sizeof(value, seen)
+    elif isinstance(obj, (list, tuple)):
+        for value in list(obj):
+            size += deep_sizeof(value, seen)
+    return size
+
+
+def event_data_size(api):
+    # the handlers change the data while it is measured
+    while True:
+        try:
+            return deep_sizeof(api._event_data)
+        except RuntimeError:
+            pass
+
+
+def percentile(values, p):
+    if not values:
+        return None
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))]
+
+
+class Counter(object):
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.counts = {event: 0 for event in events}
+        self.latencies = []
+
+    def add(self, event, count=1, latency=None):
+        with self.lock:
+            self.counts[event] += count
+            if latency is not None:
+                self.latencies.append(latency)
+
+    def total(self):
+        with self.lock:
+            return sum(self.counts.values())
+
+    def take_latencies(self):
+        with self.lock:
+            latencies, self.latencies = self.latencies, []
+        return latencies
+
+
+class LoadGenerator(object):
+    def __init__(self, server, args):
+        self.server = server
+        self.args = args
+        self.sent = Counter()
+        self.stopped = threading.Event()
+        self.random = random.Random(0)
+        self.heartbeat_ids = itertools.count(1)
+
+    def heartbeat(self, monitor_id):
+        important = self.random.random() < self.args.important_ratio
+        heartbeat = make_heartbeat(monitor_id, next(self.heartbeat_ids), important, status=int(important) ^ 1)
+        return {**heartbeat, "monitorID": monitor_id}
+
+    def emit(self, event, *data):
+        self.server.sio.emit(event.value, data if len(data) > 1 else data[0], to="users")
+
+    def send_heartbeat(self):
+        heartbeat = self.heartbeat(self.random.randint(1, self.args.monitors))
+        heartbeat["sentAt"] = time.perf_counter()
+        self.emit(Event.HEARTBEAT, heartbeat)
+        self.sent.add(Event.HEARTBEAT)
+
+    def send_lists(self):
+        monitor_id = self.random.randint(1, self.args.monitors)
+        heartbeats = [self.heartbeat(monitor_id) for _ in range(self.args.list_size)]
+        heartbeats[-1]["sentAt"] = time.perf_counter()
+        self.emit(Event.HEARTBEAT_LIST, monitor_id, heartbeats, True)
+        important = [i for i in heartbeats if i["important"]] or heartbeats[-1:]
+        self.emit(Event.IMPORTANT_HEARTBEAT_LIST, monitor_id, important, True)
+        self.sent.add(Event.HEARTBEAT_LIST)
+        self.sent.add(Event.IMPORTANT_HEARTBEAT_LIST)
+
+    def send_stats(self):
+        monitor_id = self.random.randint(1, self.args.monitors)
+        self.emit(Event.AVG_PING, monitor_id, self.random.randint(5, 50))
+        self.emit(Event.UPTIME, monitor_id, 24, self.random.random())
+        self.sent.add(Event.AVG_PING)
+        self.sent.add(Event.UPTIME)
+
+    def run(self, send, rate):
+        # sends at a fixed rate, falls behind instead of dropping events if sending is too slow
+        start = time.perf_counter()
+        sent = 0
+        while not self.stopped.is_set():
+            due = int((time.perf_counter() - start) * rate)
+            if sent >= due:
+                time.sleep(max(0.0, min(0.01, (sent + 1) / rate - (time.perf_counter() - start))))
+                continue
+            send()
+            sent += 1
+
+    def start(self):
+        threads = []
+        for send, rate in [
+            (self.send_heartbeat, self.args.heartbeat_rate),
+            (self.send_lists, self.args.list_rate),
+            (self.send_stats, self.args.stats_rate),
+        ]:
+            if rate > 0:
+                thread = threading.Thread(target=self.run, args=(send, rate), daemon=True)
+                thread.start()
+                threads.append(thread)
+        return threads
+
+
+def register_listeners(api, handled):
+    def on_heartbeat(data):
+        handled.add(Event.HEARTBEAT, latency=time.perf_counter() - data["sentAt"])
+
+    def on_heartbeat_list(monitor_id, data, overwrite):
+        handled.add(Event.HEARTBEAT_LIST, latency=time.perf_counter() - data[-1]["sentAt"])
+
+    api.add_event_listener(Event.HEARTBEAT, on_heartbeat)
+    api.add_event_listener(Event.HEARTBEAT_LIST, on_heartbeat_list)
+    for event in [Event.IMPORTANT_HEARTBEAT_LIST, Event.UPTIME, Event.AVG_PING]:
+        api.add_event_listener(event, lambda *args, event=event: handled.add(event))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.load_generator", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--monitors", type=int, default=1000, help="number of monitors")
+    parser.add_argument("--heartbeat-rate", type=float, default=1000, help="heartbeat events per second")
+    parser.add_argument("--list-rate", type=float, default=10,
+                        help="heartbeatList and importantHeartbeatList event pairs per second")
+    parser.add_argument("--list-size", type=int, default=100, help="heartbeats per heartbeatList event")
+    parser.add_argument("--stats-rate", type=float, default=100, help="uptime and avgPing event pairs per second")
+    parser.add_argument("--important-ratio", type=float, default=0.01, help="share of important heartbeats")
+    parser.add_argument("--duration", type=float, default=30, help="seconds")
+    parser.add_argument("--interval", type=float, default=1, help="seconds between reports")
+    parser.add_argument("--output", help="write the timeline as JSON to this file")
+    args = parser.parse_args(argv)
+
+    timeline = []
+    with FakeUptimeKumaServer(monitors=args.monitors) as server:
+        with UptimeKumaApi(server.url, wait_events=0) as api:
+            api.login(server.username, server.password)
+            api.get_monitors()
+            api.get_heartbeats()  # the initial heartbeat data has been received
+
+            handled = Counter()
+            register_listeners(api, handled)
+            generator = LoadGenerator(server, args)
+
+            print(f"{'time':>6} {'sent/s':>9} {'handled/s':>9} {'backlog':>8} {'p50 ms':>8} {'p99 ms':>8} "
+                  f"{'event_data MB':>13}")
+            start = time.perf_counter()
+            threads = generator.start()
+            last_sent = last_handled = 0
+            last = start
+            while True:
+                time.sleep(max(0.0, start + (len(timeline) + 1) * args.interval - time.perf_counter()))
+                now = time.perf_counter()
+                finished = now - start >= args.duration
+                if finished:
+                    generator.stopped.set()
+                    for thread in threads:
+                        thread.join()
+                sent, total = generator.sent.total(), handled.total()
+                latencies = handled.take_latencies()
+                p50 = statistics.median(latencies) if latencies else None
+                p99 = percentile(latencies, 0.99)
+                sample = {
+                    "time": round(now - start, 3),
+                    "sent_per_second": (sent - last_sent) / (now - last),
+                    "handled_per_second": (total - last_handled) / (now - last),
+                    "backlog": sent - total,
+                    "latency_p50": p50,
+                    "latency_p99": p99,
+                    "event_data_bytes": event_data_size(api),
+                }
+                timeline.append(sample)
+                print(
+                    f"{sample['time']:6.1f} {sample['sent_per_second']:9.0f} {sample['handled_per_second']:9.0f} "
+                    f"{sample['backlog']:8d} {p50 * 1000 if p50 is not None else float('nan'):8.2f} "
+                    f"{p99 * 1000 if p99 is not None else float('nan'):8.2f} "
+                    f"{sample['event_data_bytes'] / 1e6:13.2f}"
+                )
+                last_sent, last_handled, last = sent, total, now
+                if finished:
+                    break
+
+            # drain the backlog to get the total ingest rate
+            drain_start = time.perf_counter()
+            while handled.total() < generator.sent.total() and time.perf_counter() - drain_start < 60:
+                time.sleep(0.05)
+            elapsed = time.perf_counter() - start
+            summary = {
+                "sent": generator.sent.counts,
+                "handled": handled.counts,
+                "ingest_rate": handled.total() / elapsed,
+                "drain_seconds": time.perf_counter() - drain_start,
+            }
+
+    print(f"ingested {handled.total()} of {generator.sent.total()} events, {summary['ingest_rate']:.0f} events/s, "
+          f"drained the backlog in {summary['drain_seconds']:.2f}s")
+    if args.output:
+        report = {
+            "arguments": vars(args),
+            "summary": {**summary, "sent": {k.value: v for k, v in summary["sent"].items()},
+                        "handled": {k.value: v for k, v in summary["handled"].items()}},
+            "timeline": timeline,
+        }
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,14 @@
+"""Synthetic server payloads shaped like the ones sent by Uptime Kuma 1.23."""
+
+from uptime_kuma_api.fake_server import make_heartbeat, make_monitor
+
+
+def make_monitor_list(count):
+    return {str(i): make_monitor(i) for i in range(1, count + 1)}
+
+
+def make_heartbeat_list(monitor_id, count, first_id=1):
+    return [
+        make_heartbeat(monitor_id, first_id + i, important=(i == 0))
+        for i in range(count)
+    ]
@@ -0,0 +1,199 @@
+"""Benchmarks the hot paths of the client against the in-process fake server.
+
+Cases:
+
+- ``connect_login``: creating a connected instance and logging in (100 monitors)
+- ``get_monitors_<n>``: ``get_monitors()`` with n monitors
+- ``add_monitor`` / ``edit_monitor``: sequential throughput
+- ``get_heartbeats_live``: ``get_heartbeats()`` while the server pushes heartbeats of 1k monitors
+- ``get_status_page``: a status page with 100 monitors
+- ``heartbeat_ingest``: rate of the ``heartbeat`` event handler
+
+``wait_events`` is ``0`` so that the getters measure the client and not the fixed wait for further events.
+
+The results are written as JSON. With ``--baseline`` the results are compared with a stored run and the
+exit code is 1 if a case is slower than the baseline by more than ``--threshold``. Baselines depend on the
+machine, create them with ``--save-baseline`` on the machine that runs the comparison.
+
+Usage: python -m benchmarks.suite [--output FILE] [--save-baseline FILE] [--baseline FILE] [--threshold 0.2]
+                                  [--sizes 100,1000,10000] [--repeat 5] [--case NAME ...]
+"""
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+
+from uptime_kuma_api import MonitorType, UptimeKumaApi
+from uptime_kuma_api.fake_server import FakeUptimeKumaServer, make_heartbeat
+
+
+def connect(server, **kwargs):
+    api = UptimeKumaApi(server.url, wait_events=0, timeout=30, **kwargs)
+    api.login(server.username, server.password)
+    return api
+
+
+def timed(func, repeat):
+    # median duration of repeated calls in seconds
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    return statistics.median(durations)
+
+
+def result(value, unit):
+    return {"value": value, "unit": unit, "lower_is_better": unit == "s"}
+
+
+def bench_connect_login(args):
+    with FakeUptimeKumaServer(monitors=100) as server:
+        def run():
+            connect(server).disconnect()
+
+        return {"connect_login": result(timed(run, args.repeat), "s")}
+
+
+def bench_get_monitors(args):
+    results = {}
+    for size in args.sizes:
+        with FakeUptimeKumaServer(monitors=size) as server:
+            with connect(server) as api:
+                api.get_monitors()  # wait for the monitor list
+                results[f"get_monitors_{size}"] = result(timed(api.get_monitors, args.repeat), "s")
+    return results
+
+
+def bench_add_edit_monitor(args):
+    count = 20 * args.repeat
+    with FakeUptimeKumaServer() as server:
+        with connect(server) as api:
+            start = time.perf_counter()
+            monitor_ids = [
+                api.add_monitor(type=MonitorType.HTTP, name=f"monitor {i}", url="http://127.0.0.1")["monitorID"]
+                for i in range(count)
+            ]
+            add_rate = count / (time.perf_counter() - start)
+
+            start = time.perf_counter()
+            for monitor_id in monitor_ids:
+                api.edit_monitor(monitor_id, interval=30)
+            edit_rate = count / (time.perf_counter() - start)
+    return {"add_monitor": result(add_rate, "ops/s"), "edit_monitor": result(edit_rate, "ops/s")}
+
+
+def bench_get_heartbeats_live(args):
+    with FakeUptimeKumaServer(monitors=1000, heartbeats=100, heartbeat_interval=0.05) as server:
+        with connect(server) as api:
+            api.get_heartbeats()
+            return {"get_heartbeats_live": result(timed(api.get_heartbeats, args.repeat), "s")}
+
+
+def bench_get_status_page(args):
+    with FakeUptimeKumaServer(monitors=100) as server:
+        with connect(server) as api:
+            api.add_status_page("bench", "bench")
+            api.save_status_page("bench", publicGroupList=[
+                {"name": "Services", "monitorList": [{"id": i} for i in range(1, 101)]},
+            ])
+
+            def run():
+                api.get_status_page("bench")
+
+            return {"get_status_page": result(timed(run, args.repeat), "s")}
+
+
+def bench_heartbeat_ingest(args):
+    count = 100_000
+    with FakeUptimeKumaServer(monitors=1000) as server:
+        with connect(server) as api:
+            api.get_monitors()
+            heartbeats = [
+                {**make_heartbeat(i % 1000 + 1, i, important=(i % 100 == 0)), "monitorID": i % 1000 + 1}
+                for i in range(count)
+            ]
+
+            def run():
+                for heartbeat in heartbeats:
+                    api._event_heartbeat(heartbeat)
+
+            return {"heartbeat_ingest": result(count / timed(run, args.repeat), "events/s")}
+
+
+cases = {
+    "connect_login": bench_connect_login,
+    "get_monitors": bench_get_monitors,
+    "add_edit_monitor": bench_add_edit_monitor,
+    "get_heartbeats_live": bench_get_heartbeats_live,
+    "get_status_page": bench_get_status_page,
+    "heartbeat_ingest": bench_heartbeat_ingest,
+}
+
+
+def compare(results, baseline, threshold):
+    # returns the names of the cases that regressed by more than threshold
+    regressions = []
+    for name, current in sorted(results.items()):
+        previous = baseline.get(name)
+        if previous is None:
+            print(f"{name:<24} {current['value']:12.6g} {current['unit']:<8} (no baseline)")
+            continue
+        if current["lower_is_better"]:
+            change = current["value"] / previous["value"] - 1
+        else:
+            change = previous["value"] / current["value"] - 1
+        regressed = change > threshold
+        if regressed:
+            regressions.append(name)
+        print(
+            f"{name:<24} {current['value']:12.6g} {current['unit']:<8} "
+            f"baseline {previous['value']:12.6g}  slowdown {change * 100:+6.1f}%{'  REGRESSION' if regressed else ''}"
+        )
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.suite", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--output", help="write the results to this file instead of stdout")
+    parser.add_argument("--save-baseline", metavar="FILE", help="store the results as baseline")
+    parser.add_argument("--baseline", metavar="FILE", help="compare the results with this baseline")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed slowdown, defaults to 0.2 (20%%)")
+    parser.add_argument("--sizes", default="100,1000,10000", help="monitor counts of get_monitors")
+    parser.add_argument("--repeat", type=int, default=5, help="repetitions of each measurement")
+    parser.add_argument("--case", action="append", choices=sorted(cases), help="run only these cases")
+    args = parser.parse_args(argv)
+    args.sizes = [int(i) for i in args.sizes.split(",")]
+
+    results = {}
+    for name in args.case or cases:
+        print(f"running {name}...", file=sys.stderr)
+        results.update(cases[name](args))
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "results": results,
+    }
+    encoded = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(encoded + "\n")
+    elif not args.baseline:
+        print(encoded)
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            f.write(encoded + "\n")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+        if compare(results, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,13 @@
 #!/bin/sh
 
 version="$1"
+if [ "$version" = "fake" ]
+then
+  echo "Running tests against the fake server..."
+  UPTIME_KUMA_TEST_SERVER=fake python -m unittest discover -s tests
+  exit
+fi
+
 if [ $version ]
 then
   versions=("$version")
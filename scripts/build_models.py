@@ -1,6 +1,7 @@
 import re
 
-from utils import deduplicate_list, diff
+from uptime_kuma_api import MonitorType
+from utils import deduplicate_list, diff, write_to_file
 
 
 def parse_json_keys(data):
@@ -113,6 +114,15 @@ def parse_status_page(root):
     return all_keys
 
 
+def parse_maintenance(root):
+    with open(f'{root}/server/model/maintenance.js') as f:
+        content = f.read()
+    match = re.search(r'toJSON\(\) {[\s\S]+?let obj = {([^}]+)}', content)
+    data = match.group(1)
+    keys = parse_json_keys(data)
+    return keys
+
+
 def parse_tag(root):
     with open(f'{root}/server/model/tag.js') as f:
         content = f.read()
@@ -122,6 +132,37 @@ def parse_tag(root):
     return keys
 
 
+# keys that are not part of the toJSON methods
+model_extra_keys = {
+    # database rows returned by getMonitorBeats
+    "heartbeat": ["id", "monitor_id", "down_count"],
+    # the provider options are stored in the notification config
+    "notification": ["id", "name", "active", "userId", "isDefault", "applyExisting", "type"],
+}
+
+
+def build_models(root):
+    models = []
+    for name, title, func in [
+        ["Monitor", "Monitor", parse_monitor],
+        ["Heartbeat", "Heartbeat", parse_heartbeat],
+        ["Notification", "Notification", None],
+        ["Maintenance", "Maintenance", parse_maintenance],
+    ]:
+        keys = func(root) if func else []
+        keys = deduplicate_list(keys + model_extra_keys.get(name.lower(), []))
+        models.append({
+            "name": name,
+            "title": title,
+            "keys": keys,
+        })
+    write_to_file(
+        "models.py.j2", "./../uptime_kuma_api/models.py",
+        models=models,
+        monitor_types=list(MonitorType)
+    )
+
+
 if __name__ == "__main__":
     root_old = "uptime-kuma-old"
     root_new = "uptime-kuma"
@@ -129,6 +170,7 @@ if __name__ == "__main__":
     for name, func in [
         ["heartbeat", parse_heartbeat],
         ["incident", parse_incident],
+        ["maintenance", parse_maintenance],
         ["monitor", parse_monitor],
         ["proxy", parse_proxy],
         ["status page", parse_status_page],
@@ -139,6 +181,8 @@ if __name__ == "__main__":
         print(f"{name}:")
         diff(keys_old, keys_new)
 
+    build_models(root_new)
+
 
 # TODO:
 # https://github.com/louislam/uptime-kuma/blob/2adb142ae25984ecebfa4b51c739fec5e492763a/server/proxy.js#L20
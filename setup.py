@@ -34,6 +34,15 @@ setup(
         "python-socketio[client]>=5.0.0",
         "packaging"
     ],
+    extras_require={
+        "orjson": ["orjson"],
+        "opentelemetry": ["opentelemetry-api"],
+    },
+    entry_points={
+        "console_scripts": [
+            "uptime-kuma-exporter = uptime_kuma_api.exporter:main",
+        ],
+    },
     classifiers=[
         "Development Status :: 5 - Production/Stable",
         "Environment :: Web Environment",
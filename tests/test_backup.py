@@ -0,0 +1,113 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from uptime_kuma_api import MonitorType, UptimeKumaApi, iter_backup, rewrite_backup, write_backup
+from uptime_kuma_api.fake_server import FakeUptimeKumaServer
+
+
+def monitor(id_, name, parent=None, tags=(), notifications=(), proxy_id=None):
+    return {
+        "id": id_,
+        "name": name,
+        "type": "group" if name.startswith("group") else "http",
+        "parent": parent,
+        "proxyId": proxy_id,
+        "notificationIDList": {str(i): True for i in notifications},
+        "tags": [{"name": tag, "value": ""} for tag in tags],
+    }
+
+
+class TestBackup(unittest.TestCase):
+    def setUp(self):
+        self.notifications = [
+            {"id": 1, "name": "notification 1", "config": "{}"},
+            {"id": 2, "name": "notification 2", "config": "{}"},
+        ]
+        self.monitors = [
+            monitor(1, "group 1"),
+            monitor(2, "monitor ä 2", parent=1, tags=["production"], notifications=[2], proxy_id=1),
+            monitor(3, "monitor 3", tags=["staging"], notifications=[1]),
+        ]
+        self.proxies = [{"id": 1, "host": "127.0.0.1", "port": 8080, "protocol": "http"}]
+
+    def write(self):
+        fp = io.StringIO()
+        counts = write_backup(fp, "1.23.0", self.notifications, iter(self.monitors), self.proxies)
+        self.assertEqual(counts, {"notifications": 2, "monitors": len(self.monitors), "proxies": 1})
+        return fp.getvalue()
+
+    def test_write_and_read(self):
+        data = self.write()
+        self.assertEqual(json.loads(data), {
+            "version": "1.23.0",
+            "notificationList": self.notifications,
+            "monitorList": self.monitors,
+            "proxyList": self.proxies,
+        })
+
+        # small chunks split values, numbers and multi-byte characters
+        for fp in [io.StringIO(data), io.BytesIO(data.encode())]:
+            items = list(iter_backup(fp, chunk_size=3))
+            self.assertEqual(items[0], ("version", "1.23.0"))
+            self.assertEqual([i for key, i in items if key == "monitorList"], self.monitors)
+
+        self.assertEqual(list(iter_backup(io.StringIO('{"version": "1.0", "monitorList": []}'))), [("version", "1.0")])
+        for data in ['{"monitorList": [{"id": 1}', '{"monitorList": [1 2]}', '[]']:
+            with self.assertRaises(ValueError):
+                list(iter_backup(io.StringIO(data)))
+
+    def test_rewrite(self):
+        src = io.StringIO(self.write())
+        dst = io.StringIO()
+        counts = rewrite_backup(src, dst, tags=["production"], notification_ids={2: 5}, monitor_ids={1: 10})
+        self.assertEqual(counts, {"notifications": 1, "monitors": 2, "proxies": 1, "skipped": 2})
+        backup = json.loads(dst.getvalue())
+        self.assertEqual(backup["version"], "1.23.0")
+        self.assertEqual([i["id"] for i in backup["notificationList"]], [5])
+        self.assertEqual([(i["id"], i["parent"]) for i in backup["monitorList"]], [(10, None), (2, 10)])
+        self.assertEqual(backup["monitorList"][1]["notificationIDList"], {"5": True})
+        self.assertEqual(backup["proxyList"], self.proxies)
+
+    def test_validate(self):
+        self.monitors.append(monitor(3, "duplicate"))
+        self.monitors.append(monitor(4, "monitor 4", parent=20, notifications=[30]))
+        with self.assertRaisesRegex(ValueError, "id 3 more than once") as cm:
+            rewrite_backup(io.StringIO(self.write()), io.StringIO())
+        self.assertNotIn("referenced id", str(cm.exception))
+
+        del self.monitors[3]
+        with self.assertRaisesRegex(ValueError, "monitorList does not contain the referenced id 20"):
+            rewrite_backup(io.StringIO(self.write()), io.StringIO())
+        rewrite_backup(io.StringIO(self.write()), io.StringIO(), validate=False)
+
+    def test_api(self):
+        with FakeUptimeKumaServer() as server:
+            with UptimeKumaApi(server.url, wait_events=0.01) as api:
+                api.login(server.username, server.password)
+                tag = api.add_tag(name="production", color="#ffffff")
+                for i in range(3):
+                    monitor_id = api.add_monitor(type=MonitorType.HTTP, name=f"monitor {i}", url="http://127.0.0.1")[
+                        "monitorID"
+                    ]
+                    if i < 2:
+                        api.add_monitor_tag(tag["id"], monitor_id)
+
+                with tempfile.TemporaryDirectory() as directory:
+                    path = os.path.join(directory, "backup.json")
+                    counts = api.export_backup(path)
+                    self.assertEqual(counts["monitors"], 3)
+
+                    r = api.restore_backup(path, import_handle="overwrite", tags=["production"])
+                    self.assertEqual(r["msg"], "Backup successfully restored.")
+                    monitors = api.get_monitors()
+                    self.assertEqual(sorted(i["name"] for i in monitors), ["monitor 0", "monitor 1"])
+
+                with self.assertRaises(ValueError):
+                    api.restore_backup(io.StringIO("{}"), import_handle="unknown")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+import time
+import unittest
+
+from uptime_kuma_api import TTLCache, UptimeKumaApi, UptimeKumaException
+from uptime_kuma_api.cache import STATUS_PAGE_CONFIG, invalidated_entries
+from uptime_kuma_api.fake_server import FakeUptimeKumaServer
+
+
+class TestCache(unittest.TestCase):
+    def test_ttl(self):
+        cache = TTLCache(ttls={"getTags": 0.05, "getSettings": 0})
+        self.assertFalse(cache.cacheable("getSettings"))
+        self.assertFalse(cache.cacheable("getMonitor"))
+
+        cache.put("getTags", None, {"tags": []})
+        found, r = cache.get("getTags")
+        self.assertTrue(found)
+        r["tags"].append({"id": 1})
+        self.assertEqual(cache.get("getTags"), (True, {"tags": []}))
+
+        time.sleep(0.06)
+        self.assertEqual(cache.get("getTags"), (False, None))
+
+        cache.put("getSettings", None, {"data": {}})
+        self.assertEqual(cache.get("getSettings"), (False, None))
+
+    def test_invalidation(self):
+        cache = TTLCache()
+        cache.put("getMonitorMaintenance", 1, {"monitors": [{"id": 1}]})
+        cache.put("getMonitorMaintenance", 2, {"monitors": [{"id": 2}]})
+        cache.put("getTags", None, {"tags": []})
+
+        cache.invalidate_for("addMonitorMaintenance", (1, []))
+        self.assertFalse(cache.get("getMonitorMaintenance", 1)[0])
+        self.assertTrue(cache.get("getMonitorMaintenance", 2)[0])
+        self.assertTrue(cache.get("getTags")[0])
+
+        # a read that was sent before a write is not stored
+        generation = cache.generation("getTags")
+        cache.invalidate_for("addTag", {})
+        cache.put("getTags", None, {"tags": []}, generation)
+        self.assertFalse(cache.get("getTags")[0])
+
+        cache.invalidate_for("logout")
+        self.assertEqual(cache.snapshot()["size"], 0)
+
+        snapshot = cache.snapshot()
+        self.assertEqual(snapshot["events"]["getMonitorMaintenance"], {"hits": 1, "misses": 1, "invalidations": 1})
+
+        # the status page configs of the api share the rules but are not part of the cache
+        self.assertEqual(invalidated_entries("saveStatusPage", ("slug1", {}, "", [])), [
+            ("/api/status-page/heartbeat", "slug1", False), (STATUS_PAGE_CONFIG, "slug1", False)
+        ])
+        self.assertEqual(invalidated_entries("login"), "*")
+        self.assertIsNone(invalidated_entries("getTags"))
+        cache.invalidate_for("deleteMonitor", 1)
+        self.assertNotIn(STATUS_PAGE_CONFIG, cache.snapshot()["events"])
+
+        # changed monitors change the heartbeats of all status pages
+        for event in ["editMonitor", "pauseMonitor", "resumeMonitor", "deleteMonitor"]:
+            cache.put("/api/status-page/heartbeat", "slug1", {"heartbeatList": {}})
+            cache.put("/api/status-page/heartbeat", "slug2", {"heartbeatList": {}})
+            cache.invalidate_for(event, 1)
+            self.assertFalse(cache.get("/api/status-page/heartbeat", "slug1")[0], event)
+            self.assertFalse(cache.get("/api/status-page/heartbeat", "slug2")[0], event)
+
+    def test_max_entries(self):
+        cache = TTLCache(max_entries=10)
+        for i in range(25):
+            cache.put("getMonitorMaintenance", i, {"monitors": []})
+        self.assertLessEqual(cache.snapshot()["size"], 10)
+        self.assertTrue(cache.get("getMonitorMaintenance", 24)[0])
+
+    def test_api(self):
+        with FakeUptimeKumaServer() as server:
+            with UptimeKumaApi(server.url, wait_events=0.01, cache=True) as api:
+                api.login(server.username, server.password)
+                api.add_tag(name="tag 1", color="#ffffff")
+                tag = api.add_tag(name="tag 2", color="#000000")
+
+                self.assertEqual(len(api.get_tags()), 2)
+                self.assertEqual(api.get_tag(tag["id"])["name"], "tag 2")
+                with self.assertRaisesRegex(UptimeKumaException, "tag does not exist"):
+                    api.get_tag(100)
+                stats = api.cache.snapshot()["events"]["getTags"]
+                self.assertEqual((stats["hits"], stats["misses"]), (2, 1))
+
+                api.edit_tag(tag["id"], name="tag 2 new")
+                self.assertEqual(api.get_tag(tag["id"])["name"], "tag 2 new")
+
+                api.delete_tag(tag["id"])
+                self.assertEqual(len(api.get_tags()), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import json
+import unittest
+
+from uptime_kuma_api.cert_info import CertInfoStore
+
+
+def cert_info(valid_to=None, days_remaining=None, valid=True):
+    return json.dumps({
+        "valid": valid,
+        "certInfo": {
+            "validTo": valid_to,
+            "daysRemaining": days_remaining
+        }
+    })
+
+
+class TestCertInfo(unittest.TestCase):
+    def test_lazy_parsing(self):
+        calls = []
+
+        def loads(data):
+            calls.append(data)
+            return json.loads(data)
+
+        store = CertInfoStore(loads)
+        store.set(1, cert_info("2023-05-12T23:59:59.000Z", 10))
+        self.assertEqual(calls, [])
+        self.assertEqual(store.get(1)["certInfo"]["daysRemaining"], 10)
+        self.assertEqual(store.to_dict()[1]["certInfo"]["daysRemaining"], 10)
+        self.assertEqual(len(calls), 1)
+
+        # the index and to_dict share the parsed certificate infos, only changed ones are parsed again
+        store.set(2, cert_info("2023-05-12T23:59:59.000Z"))
+        store.expiring_within(10, 1683072000)
+        store.to_dict()
+        store.set(1, cert_info("2023-06-12T23:59:59.000Z"))
+        store.to_dict()
+        store.expiring_within(10, 1683072000)
+        self.assertEqual(len(calls), 3)
+
+    def test_expiring_within(self):
+        store = CertInfoStore(json.loads)
+        now = 1683072000  # 2023-05-03 00:00:00 UTC
+        store.set(1, cert_info("2023-05-12T23:59:59.000Z"))
+        store.set(2, cert_info("2023-08-01T00:00:00.000Z"))
+        store.set(3, cert_info("2023-05-01T00:00:00.000Z"))
+        store.set(4, cert_info(valid=False))
+        store.set(5, cert_info(days_remaining=20))
+        self.assertEqual([i for i, _ in store.expiring_within(10, now)], [3, 1])
+
+        # updated certificates are moved in the index
+        store.set(1, cert_info("2023-09-01T00:00:00.000Z"))
+        self.assertEqual([i for i, _ in store.expiring_within(10, now)], [3])
+        self.assertEqual([i for i, _ in store.expiring_within(365, now)], [3, 2, 1])
+
+
+if __name__ == '__main__':
+    unittest.main()
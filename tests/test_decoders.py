@@ -0,0 +1,61 @@
+import unittest
+
+from uptime_kuma_api import AuthMethod, MonitorStatus, MonitorType
+from uptime_kuma_api.decoders import (
+    decode_heartbeats, decode_monitor, decode_notification, decode_status_page_heartbeats
+)
+
+
+class TestDecoders(unittest.TestCase):
+    def test_decode_monitor(self):
+        monitor = decode_monitor({
+            "id": 1,
+            "active": 1,
+            "type": "http",
+            "authMethod": None,
+            "notificationIDList": {"1": True, "2": True}
+        })
+        self.assertEqual(monitor, {
+            "id": 1,
+            "active": True,
+            "type": MonitorType.HTTP,
+            "authMethod": AuthMethod.NONE,
+            "notificationIDList": [1, 2]
+        })
+        self.assertTrue(type(monitor["type"]) == MonitorType)
+
+        # unknown values are kept
+        monitor = decode_monitor({"type": "unknown", "notificationIDList": []})
+        self.assertEqual(monitor["type"], "unknown")
+
+    def test_decode_heartbeats(self):
+        heartbeats = decode_heartbeats({
+            1: [
+                {"status": 1, "important": 1},
+                {"status": 0, "important": 0}
+            ]
+        })
+        self.assertEqual(heartbeats[1][0]["status"], MonitorStatus.UP)
+        self.assertTrue(type(heartbeats[1][1]["status"]) == MonitorStatus)
+        self.assertEqual([i["important"] for i in heartbeats[1]], [True, False])
+
+    def test_decode_status_page_heartbeats(self):
+        r = decode_status_page_heartbeats({
+            "heartbeatList": {
+                "1": [{"status": 1, "time": "2023-05-01 17:22:20.289", "msg": "", "ping": 10}]
+            },
+            "uptimeList": {"1_24": 0.5, "1_720": 0.9}
+        })
+        self.assertEqual(r["heartbeatList"][1][0]["status"], MonitorStatus.UP)
+        self.assertEqual(r["uptimeList"], {1: {24: 0.5, 720: 0.9}})
+
+    def test_decode_notification(self):
+        raw = {"id": 1, "type": "telegram", "config": '{"telegramChatID": "123"}'}
+        notification = decode_notification(raw)
+        self.assertEqual(notification["telegramChatID"], "123")
+        self.assertNotIn("config", notification)
+        self.assertIn("config", raw)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import threading
+import time
+import unittest
+import urllib.request
+
+from uptime_kuma_api import MonitorType, UptimeKumaApi
+from uptime_kuma_api.exporter import UptimeKumaExporter
+from uptime_kuma_api.fake_server import FakeUptimeKumaServer
+
+
+class TestExporter(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeUptimeKumaServer()
+        self.server.start()
+        self.api = UptimeKumaApi(self.server.url, wait_events=0.01)
+        self.api.login(self.server.username, self.server.password)
+
+    def tearDown(self):
+        self.api.disconnect()
+        self.server.stop()
+
+    def wait_for_metrics(self, registry, expected, unexpected=()):
+        # the events are handled in the thread of the Socket.IO client
+        deadline = time.monotonic() + 5
+        while True:
+            metrics = registry.render().decode()
+            if all(i in metrics for i in expected) and not any(i in metrics for i in unexpected):
+                return metrics
+            if time.monotonic() > deadline:
+                self.fail(f"metrics not received: {expected}, {unexpected}\n{metrics}")
+            time.sleep(0.01)
+
+    def test_events(self):
+        exporter = UptimeKumaExporter(self.api)
+        registry = exporter.registry
+        monitor_id = self.api.add_monitor(type=MonitorType.HTTP, name="a", url="https://example.com")["monitorID"]
+
+        self.server._beat(monitor_id, status=1, ping=25)
+        pings = [i["ping"] for i in self.server.heartbeats[monitor_id]]
+        labels = (
+            f'monitor_id="{monitor_id}",monitor_name="a",monitor_type="http",monitor_url="https://example.com",'
+            f'monitor_hostname=""'
+        )
+        metrics = self.wait_for_metrics(registry, [
+            f"monitor_status{{{labels}}} 1\n",
+            f"monitor_response_time{{{labels}}} 25\n",
+            f"monitor_avg_response_time{{{labels}}} {round(sum(pings) / len(pings))}\n",
+            f'monitor_uptime_ratio{{{labels},window="24"}} 1.0\n',
+            f"monitor_cert_is_valid{{{labels}}} 1\n",
+            f"monitor_cert_days_remaining{{{labels}}} 60\n",
+            # adding the monitor sends the first heartbeat
+            f'uptime_kuma_exporter_events_total{{event="heartbeat"}} {len(pings)}\n',
+        ])
+        self.assertEqual(metrics.count("# TYPE monitor_status gauge"), 1)
+
+        # the output is cached until a value changes
+        self.assertIs(registry.render(), registry.render())
+
+        # renamed and deleted monitors
+        self.api.edit_monitor(monitor_id, name="b\"")
+        self.wait_for_metrics(registry, ['monitor_name="b\\""'])
+        self.api.delete_monitor(monitor_id)
+        self.wait_for_metrics(registry, [], ["monitor_status"])
+
+        # data that was received before is loaded
+        monitor_id = self.api.add_monitor(type=MonitorType.HTTP, name="c", url="http://127.0.0.1")["monitorID"]
+        self.server._beat(monitor_id, status=0)
+        series = f'monitor_status{{monitor_id="{monitor_id}",monitor_name="c"'
+        self.wait_for_metrics(registry, [series])
+        exporter.close()
+        exporter = UptimeKumaExporter(self.api)
+        self.assertIn(series, exporter.registry.render().decode())
+
+        exporter.close()
+        self.assertEqual([i for i in self.api._event_listeners.values() if i], [])
+
+    def test_server(self):
+        exporter = UptimeKumaExporter(self.api)
+        exporter.registry.set("monitor_status", 42, 0)
+        server = exporter.make_server("127.0.0.1", 0)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+            with urllib.request.urlopen(url) as r:
+                self.assertIn(b'monitor_status{monitor_id="42"} 0', r.read())
+        finally:
+            server.shutdown()
+            server.server_close()
+            exporter.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+import time
+import unittest
+
+from uptime_kuma_api import UptimeKumaApi, UptimeKumaException, MonitorType, MonitorStatus
+from uptime_kuma_api.fake_server import FakeUptimeKumaServer
+
+
+class TestFakeServer(unittest.TestCase):
+    def test_scale(self):
+        with FakeUptimeKumaServer(monitors=20, heartbeats=3) as server:
+            with UptimeKumaApi(server.url, wait_events=0.05) as api:
+                api.login(server.username, server.password)
+                self.assertEqual(len(api.get_monitors()), 20)
+                heartbeats = api.get_heartbeats()
+                self.assertEqual(len(heartbeats), 20)
+                self.assertEqual(len(heartbeats[1]), 3)
+                self.assertEqual(len(api.cert_info()), 20)
+
+                server.push_heartbeats(status=0)
+                time.sleep(0.2)
+                self.assertEqual(api.get_heartbeats()[1][-1]["status"], MonitorStatus.DOWN)
+
+    def test_monitor(self):
+        with FakeUptimeKumaServer() as server:
+            with UptimeKumaApi(server.url, wait_events=0.01) as api:
+                with self.assertRaisesRegex(UptimeKumaException, "Incorrect username or password."):
+                    api.login(server.username, "wrong")
+                api.login(server.username, server.password)
+
+                r = api.add_monitor(type=MonitorType.HTTP, name="monitor 1", url="http://127.0.0.1")
+                monitor_id = r["monitorID"]
+                api.edit_monitor(monitor_id, interval=30)
+                monitor = api.get_monitor(monitor_id)
+                self.assertEqual(monitor["interval"], 30)
+                self.assertEqual(monitor["type"], MonitorType.HTTP)
+
+                with self.assertRaisesRegex(UptimeKumaException, "is not supported by the fake server"):
+                    api._call("unknownEvent")
+
+    def test_latency(self):
+        with FakeUptimeKumaServer(latency=0.05, jitter=0.01, seed=1) as server:
+            with UptimeKumaApi(server.url, wait_events=0.01) as api:
+                start = time.perf_counter()
+                api.need_setup()
+                self.assertGreaterEqual(time.perf_counter() - start, 0.05)
+
+
+if __name__ == '__main__':
+    unittest.main()
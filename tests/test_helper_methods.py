@@ -10,6 +10,26 @@ class TestHelperMethods(UptimeKumaTestCase):
         status = self.api.get_monitor_status(monitor_id)
         self.assertTrue(type(status) == MonitorStatus)
 
+    def test_purge(self):
+        monitor_ids = [self.add_monitor(name=f"monitor {i}") for i in range(3)]
+        self.add_tag()
+        self.add_notification()
+
+        r = self.api.purge(kinds=["monitors"], filter=lambda kind, obj: obj["name"] != "monitor 0")
+        self.assertEqual(sorted(r["monitors"]), monitor_ids[1:])
+        self.assertEqual([i["id"] for i in self.api.get_monitors()], monitor_ids[:1])
+
+        r = self.api.purge()
+        self.assertEqual(r["monitors"], monitor_ids[:1])
+        self.assertEqual(len(r["tags"]), 1)
+        self.assertEqual(len(r["notifications"]), 1)
+        self.assertEqual(self.api.get_monitors(), [])
+        self.assertEqual(self.api.get_tags(), [])
+        self.assertEqual(self.api.get_notifications(), [])
+
+        with self.assertRaises(ValueError):
+            self.api.purge(kinds=["unknown"])
+
 
 if __name__ == '__main__':
     unittest.main()
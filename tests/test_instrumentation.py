@@ -0,0 +1,42 @@
+import unittest
+
+from uptime_kuma_api import Event, Instrumentation
+
+
+class TestInstrumentation(unittest.TestCase):
+    def test_observe(self):
+        instrumentation = Instrumentation(buckets=(0.1, 1))
+        instrumentation.observe("call", "getMonitor", 0.05)
+        instrumentation.observe("call", "getMonitor", 0.5, "error")
+        instrumentation.observe("call", "getMonitor", 5, "timeout")
+        instrumentation.observe("wait", Event.MONITOR_LIST, 0.2)
+
+        snapshot = instrumentation.snapshot()
+        call = snapshot["call"]["getMonitor"]
+        self.assertEqual(call["count"], 3)
+        self.assertEqual(call["errors"], 1)
+        self.assertEqual(call["timeouts"], 1)
+        self.assertEqual(call["min"], 0.05)
+        self.assertEqual(call["max"], 5)
+        self.assertEqual(call["buckets"], [(0.1, 1), (1, 2), (float("inf"), 3)])
+        self.assertEqual(snapshot["wait"]["monitorList"]["count"], 1)
+
+        instrumentation.reset()
+        self.assertEqual(instrumentation.snapshot(), {})
+
+    def test_hooks(self):
+        instrumentation = Instrumentation()
+        measurements = []
+
+        def hook(*args):
+            measurements.append(args)
+
+        instrumentation.add_hook(hook)
+        instrumentation.observe("http", "/api/status-page", 0.1)
+        instrumentation.remove_hook(hook)
+        instrumentation.observe("http", "/api/status-page", 0.1)
+        self.assertEqual(measurements, [("http", "/api/status-page", 0.1, "ok")])
+
+
+if __name__ == '__main__':
+    unittest.main()
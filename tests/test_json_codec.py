@@ -0,0 +1,53 @@
+import json
+import unittest
+
+from socketio import packet
+
+from uptime_kuma_api import MonitorType, UptimeKumaApi
+from uptime_kuma_api.fake_server import FakeUptimeKumaServer
+from uptime_kuma_api.json_codec import JsonCodec, get_json_codec, orjson_codec
+
+
+class TestJsonCodec(unittest.TestCase):
+    def test_get_json_codec(self):
+        self.assertEqual(get_json_codec("json").name, "json")
+        self.assertIn(get_json_codec("auto").name, ["json", "orjson"])
+        codec = JsonCodec("custom", json.loads, json.dumps)
+        self.assertIs(get_json_codec(codec), codec)
+        with self.assertRaises(ValueError):
+            get_json_codec("unknown")
+
+    @unittest.skipIf(orjson_codec is None, "orjson is not installed")
+    def test_orjson(self):
+        data = {"type": MonitorType.HTTP, "notificationIDList": {1: True}}
+        encoded = orjson_codec.dumps(data, separators=(",", ":"))
+        self.assertTrue(type(encoded) == str)
+        self.assertEqual(orjson_codec.loads(encoded), json.loads(json.dumps(data)))
+        # falls back to the standard library for values that orjson does not support
+        self.assertEqual(orjson_codec.dumps({"value": 2 ** 70}), '{"value": 1180591620717411303424}')
+
+    @unittest.skipIf(orjson_codec is None, "orjson is not installed")
+    def test_orjson_api(self):
+        default_codec = packet.Packet.json
+        try:
+            with FakeUptimeKumaServer() as server:
+                with UptimeKumaApi(server.url, wait_events=0.01, json_codec="orjson") as api:
+                    self.assertIs(packet.Packet.json, orjson_codec)
+                    api.login(server.username, server.password)
+                    monitor_id = api.add_monitor(type=MonitorType.HTTP, name="monitor ä", url="http://127.0.0.1")[
+                        "monitorID"
+                    ]
+                    self.assertEqual(api.get_monitor(monitor_id)["name"], "monitor ä")
+                    self.assertEqual(api.get_monitors()[0]["type"], MonitorType.HTTP)
+
+                    # a later client with the standard library leaves the codec of the process unchanged
+                    with UptimeKumaApi(server.url, wait_events=0.01, json_codec="json") as api2:
+                        self.assertIs(packet.Packet.json, orjson_codec)
+                        api2.login(server.username, server.password)
+                        self.assertEqual(api2.get_monitor(monitor_id)["name"], "monitor ä")
+        finally:
+            packet.Packet.json = default_codec
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,7 @@
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 
-from uptime_kuma_api import UptimeKumaException, MaintenanceStrategy
+from uptime_kuma_api import UptimeKumaApi, UptimeKumaException, MaintenanceStrategy
 from uptime_kuma_test_case import UptimeKumaTestCase
 
 
@@ -92,6 +93,70 @@ class TestMaintenance(UptimeKumaTestCase):
         with self.assertRaises(UptimeKumaException):
             self.api.get_maintenance(maintenance_id)
 
+    def test_update_maintenance_members(self):
+        maintenance_ids = [
+            self.api.add_maintenance(title=f"maintenance {i}", strategy=MaintenanceStrategy.MANUAL)["maintenanceID"]
+            for i in range(2)
+        ]
+        monitor_ids = [self.add_monitor(f"monitor {i}") for i in range(3)]
+        self.api.add_monitor_maintenance(maintenance_ids[0], [{"id": monitor_ids[0]}])
+
+        r = self.api.update_maintenance_monitors(maintenance_ids[0], add=monitor_ids[1:], remove=[monitor_ids[0]])
+        self.assertEqual(r, {"added": monitor_ids[1:], "removed": [monitor_ids[0]]})
+        self.assertEqual([i["id"] for i in self.api.get_monitor_maintenance(maintenance_ids[0])], monitor_ids[1:])
+
+        r = self.api.update_maintenances_monitors({
+            maintenance_ids[0]: {"add": [monitor_ids[1]]},
+            maintenance_ids[1]: {"add": [{"id": monitor_ids[2]}]},
+        })
+        self.assertEqual(r, {
+            maintenance_ids[0]: {"added": [], "removed": []},
+            maintenance_ids[1]: {"added": [monitor_ids[2]], "removed": []},
+        })
+        self.assertEqual([i["id"] for i in self.api.get_monitor_maintenance(maintenance_ids[1])], [monitor_ids[2]])
+
+        # deleted monitors are removed from the known members
+        self.api.delete_monitor(monitor_ids[2])
+        r = self.api.update_maintenance_monitors(maintenance_ids[1], add=[monitor_ids[0]])
+        self.assertEqual(r, {"added": [monitor_ids[0]], "removed": []})
+        self.assertEqual([i["id"] for i in self.api.get_monitor_maintenance(maintenance_ids[1])], [monitor_ids[0]])
+
+        status_page_id = self.add_status_page()
+        r = self.api.update_maintenances_status_pages({i: {"add": [status_page_id]} for i in maintenance_ids})
+        self.assertEqual(r, {i: {"added": [status_page_id], "removed": []} for i in maintenance_ids})
+        r = self.api.update_maintenance_status_pages(maintenance_ids[0], remove=[status_page_id], refresh=True)
+        self.assertEqual(r, {"added": [], "removed": [status_page_id]})
+        self.assertEqual(self.api.get_status_page_maintenance(maintenance_ids[0]), [])
+
+    def test_update_maintenance_members_cached(self):
+        maintenance_id = self.api.add_maintenance(title="maintenance", strategy=MaintenanceStrategy.MANUAL)[
+            "maintenanceID"
+        ]
+        monitor_ids = [self.add_monitor(f"monitor {i}") for i in range(4)]
+        with UptimeKumaApi(self.url, cache=True, wait_events=0.01) as api:
+            api.login(self.username, self.password)
+            self.assertEqual(api.get_monitor_maintenance(maintenance_id), [])
+
+            # the cached monitors are used unless refresh is set
+            self.api.add_monitor_maintenance(maintenance_id, [{"id": monitor_ids[0]}])
+            r = api.update_maintenance_monitors(maintenance_id, remove=[monitor_ids[0]])
+            self.assertEqual(r, {"added": [], "removed": []})
+            r = api.update_maintenance_monitors(maintenance_id, remove=[monitor_ids[0]], refresh=True)
+            self.assertEqual(r, {"added": [], "removed": [monitor_ids[0]]})
+            self.assertEqual(self.api.get_monitor_maintenance(maintenance_id), [])
+
+            # concurrent updates of the same maintenance are not lost
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                list(executor.map(lambda i: api.update_maintenance_monitors(maintenance_id, add=[i]), monitor_ids[1:]))
+            self.assertEqual(sorted(i["id"] for i in self.api.get_monitor_maintenance(maintenance_id)), monitor_ids[1:])
+
+            # the sent monitors are cached
+            misses = api.cache.snapshot()["misses"]
+            monitors = api.get_monitor_maintenance(maintenance_id)
+            self.assertEqual(api.cache.snapshot()["misses"], misses)
+            self.assertEqual(sorted(i["id"] for i in monitors), monitor_ids[1:])
+            self.assertEqual(monitors[0]["name"], self.find_by_id(api.get_monitors(), monitors[0]["id"])["name"])
+
     def test_maintenance_strategy_manual(self):
         expected_maintenance = {
             "title": "test",
@@ -0,0 +1,132 @@
+import datetime
+import unittest
+
+from uptime_kuma_api import MaintenanceSchedule, MaintenanceStrategy, MonitorType, UptimeKumaApi
+from uptime_kuma_api.fake_server import FakeUptimeKumaServer
+
+utc = datetime.timezone.utc
+
+
+def dt(*args):
+    return datetime.datetime(*args, tzinfo=utc)
+
+
+def maintenance(id_, strategy, **kwargs):
+    return {
+        "id": id_,
+        "strategy": strategy,
+        "active": True,
+        "intervalDay": 1,
+        "dateRange": [],
+        "timeRange": [{"hours": 2, "minutes": 0}, {"hours": 3, "minutes": 0}],
+        "weekdays": [],
+        "daysOfMonth": [],
+        "cron": "",
+        "durationMinutes": 0,
+        "timezoneOption": "UTC",
+        **kwargs,
+    }
+
+
+class TestMaintenanceSchedule(unittest.TestCase):
+    def schedule(self, *maintenances, monitors=None):
+        return MaintenanceSchedule(list(maintenances), monitors, start=dt(2023, 3, 1), end=dt(2023, 4, 1))
+
+    def starts(self, schedule, start, end):
+        return [i[0] for i in schedule.windows(start, end)]
+
+    def test_single(self):
+        schedule = self.schedule(maintenance(
+            1, MaintenanceStrategy.SINGLE, dateRange=["2023-03-10 10:00:00", "2023-03-12 10:00:00"],
+            timezoneOption="America/New_York"
+        ), monitors={1: [{"id": 1}, {"id": 2}]})
+        self.assertEqual(schedule.windows(dt(2023, 3, 1), dt(2023, 4, 1)), [
+            (dt(2023, 3, 10, 15), dt(2023, 3, 12, 14), 1)
+        ])
+        self.assertEqual(schedule.monitors_at(dt(2023, 3, 12, 13, 59)), {1, 2})
+        self.assertEqual(schedule.monitors_at(dt(2023, 3, 12, 14)), set())
+
+    def test_weekday_timezone(self):
+        # 02:00 in Berlin is 01:00 UTC, on 2023-03-26 it does not exist because daylight saving time starts
+        schedule = self.schedule(maintenance(
+            1, MaintenanceStrategy.RECURRING_WEEKDAY, weekdays=[0, 6], timezoneOption="Europe/Berlin",
+            dateRange=["2023-03-01 00:00:00", "2023-04-01 00:00:00"]
+        ))
+        self.assertEqual(self.starts(schedule, dt(2023, 3, 17), dt(2023, 3, 27)), [
+            dt(2023, 3, 18, 1), dt(2023, 3, 19, 1), dt(2023, 3, 25, 1), dt(2023, 3, 26, 1)
+        ])
+        self.assertEqual(self.starts(schedule, dt(2023, 3, 31), dt(2023, 4, 1)), [])
+
+    def test_day_of_month_and_interval(self):
+        schedule = self.schedule(
+            maintenance(1, MaintenanceStrategy.RECURRING_DAY_OF_MONTH, daysOfMonth=[1, 15, "lastDay1"]),
+            maintenance(2, MaintenanceStrategy.RECURRING_INTERVAL, intervalDay=10, dateRange=["2023-03-05 00:00:00"],
+                        timeRange=[{"hours": 23, "minutes": 0}, {"hours": 1, "minutes": 0}]),
+        )
+        self.assertEqual([(i[0], i[2]) for i in schedule.windows(dt(2023, 3, 1), dt(2023, 4, 1))], [
+            (dt(2023, 3, 1, 2), 1),
+            (dt(2023, 3, 5, 23), 2),
+            (dt(2023, 3, 15, 2), 1),
+            (dt(2023, 3, 15, 23), 2),
+            (dt(2023, 3, 25, 23), 2),
+            (dt(2023, 3, 31, 2), 1),
+        ])
+        # the interval window ends on the next day
+        self.assertEqual(schedule.maintenances_at(dt(2023, 3, 16, 0, 30)), {2})
+
+    def test_cron_and_manual(self):
+        schedule = self.schedule(
+            maintenance(1, MaintenanceStrategy.CRON, cron="30 */12 * * mon-fri", durationMinutes=30),
+            maintenance(2, MaintenanceStrategy.MANUAL),
+            maintenance(3, MaintenanceStrategy.MANUAL, active=False),
+            monitors={1: [1], 2: [2], 3: [3]},
+        )
+        # 2023-03-03 is a friday
+        self.assertEqual(self.starts(schedule, dt(2023, 3, 3), dt(2023, 3, 6, 1)), [
+            None, dt(2023, 3, 3, 0, 30), dt(2023, 3, 3, 12, 30), dt(2023, 3, 6, 0, 30)
+        ])
+        self.assertEqual(schedule.monitors_at(dt(2023, 3, 3, 12, 45)), {1, 2})
+        self.assertTrue(schedule.is_under_maintenance(2, dt(2023, 3, 4)))
+        self.assertFalse(schedule.is_under_maintenance(1, dt(2023, 3, 4)))
+        self.assertFalse(schedule.is_under_maintenance(3, dt(2023, 3, 4)))
+        self.assertEqual(sorted(schedule.monitors_between(dt(2023, 3, 3, 12), dt(2023, 3, 3, 13))), [1, 2])
+
+        with self.assertRaises(ValueError):
+            schedule.monitors_at(dt(2023, 5, 1))
+        with self.assertRaises(ValueError):
+            self.schedule(maintenance(1, MaintenanceStrategy.CRON, cron="* *", durationMinutes=1))
+
+    def test_cron_merged_windows(self):
+        schedule = self.schedule(
+            maintenance(1, MaintenanceStrategy.CRON, cron="* * * * * *", durationMinutes=1,
+                        dateRange=["2023-03-10 00:00:00", "2023-03-12 12:00:00"]),
+            maintenance(2, MaintenanceStrategy.CRON, cron="* 2 * * *", durationMinutes=1),
+            maintenance(3, MaintenanceStrategy.CRON, cron="*/5 2 * * *", durationMinutes=1),
+        )
+        # windows that overlap or touch each other are merged, also across midnight
+        self.assertIn((dt(2023, 3, 1, 2), dt(2023, 3, 1, 3), 2), schedule.windows(dt(2023, 3, 1), dt(2023, 3, 2)))
+        self.assertEqual([i for i in schedule.windows(dt(2023, 3, 1), dt(2023, 4, 1)) if i[2] == 1], [
+            (dt(2023, 3, 10), dt(2023, 3, 12, 12, 1), 1)
+        ])
+        self.assertEqual(len(schedule.windows(dt(2023, 3, 1), dt(2023, 3, 2))), 1 + 12)
+        self.assertEqual(schedule.maintenances_at(dt(2023, 3, 11, 15, 30, 10)), {1})
+        self.assertEqual(schedule.maintenances_at(dt(2023, 3, 12, 2, 5, 30)), {1, 2, 3})
+        self.assertEqual(schedule.maintenances_at(dt(2023, 3, 12, 2, 6, 30)), {1, 2})
+
+    def test_api(self):
+        with FakeUptimeKumaServer() as server:
+            with UptimeKumaApi(server.url, wait_events=0.01) as api:
+                api.login(server.username, server.password)
+                monitor_id = api.add_monitor(type=MonitorType.HTTP, name="monitor", url="http://127.0.0.1")[
+                    "monitorID"
+                ]
+                maintenance_id = api.add_maintenance(
+                    title="manual", strategy=MaintenanceStrategy.MANUAL, active=True, dateRange=[]
+                )["maintenanceID"]
+                api.add_monitor_maintenance(maintenance_id, [{"id": monitor_id}])
+                schedule = api.get_maintenance_schedule()
+                self.assertEqual(schedule.monitors_at(datetime.datetime.now(utc)), {monitor_id})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import copy
+import pickle
+import unittest
+
+from uptime_kuma_api import (
+    Heartbeat, Maintenance, MaintenanceStrategy, Monitor, MonitorType, Notification, UptimeKumaApi, monitor_models
+)
+from uptime_kuma_api.fake_server import FakeUptimeKumaServer
+from uptime_kuma_api.models import HttpMonitor, monitor_from_dict
+
+
+class TestModels(unittest.TestCase):
+    def test_monitor(self):
+        data = {
+            "id": 1,
+            "name": "monitor 1",
+            "type": MonitorType.HTTP,
+            "url": "http://127.0.0.1",
+            "newKey": "value"
+        }
+        monitor = monitor_from_dict(data)
+        self.assertTrue(type(monitor) == HttpMonitor)
+        self.assertTrue(isinstance(monitor, Monitor))
+        self.assertEqual(monitor_models[MonitorType.HTTP], HttpMonitor)
+
+        # attribute and item access
+        self.assertEqual(monitor.name, "monitor 1")
+        self.assertEqual(monitor["url"], "http://127.0.0.1")
+        self.assertEqual(monitor.newKey, "value")
+        self.assertIsNone(monitor.hostname)
+        self.assertNotIn("hostname", monitor)
+        self.assertIsNone(monitor.get("hostname"))
+        with self.assertRaises(KeyError):
+            monitor["hostname"]
+        with self.assertRaises(AttributeError):
+            monitor.unknownKey
+
+        # slotted
+        self.assertFalse(hasattr(monitor, "__dict__"))
+
+        # round trip
+        self.assertEqual(monitor.to_dict(), data)
+        self.assertEqual(monitor_from_dict(monitor.to_dict()), monitor)
+
+    def test_copy_and_pickle(self):
+        monitor = monitor_from_dict({"id": 1, "type": MonitorType.HTTP, "name": "monitor 1", "newKey": ["value"]})
+        for copied in [copy.copy(monitor), copy.deepcopy(monitor), pickle.loads(pickle.dumps(monitor))]:
+            self.assertTrue(type(copied) == HttpMonitor)
+            self.assertEqual(copied, monitor)
+            self.assertIsNone(copied.hostname)
+            self.assertNotIn("hostname", copied)
+        self.assertIs(copy.copy(monitor).newKey, monitor.newKey)
+        self.assertIsNot(copy.deepcopy(monitor).newKey, monitor.newKey)
+
+    def test_heartbeat(self):
+        heartbeat = Heartbeat.from_dict({"id": 1, "monitor_id": 1, "status": 1})
+        self.assertEqual(heartbeat.status, 1)
+        self.assertEqual(heartbeat.to_dict(), {"id": 1, "monitor_id": 1, "status": 1})
+
+
+class TestTypedApi(unittest.TestCase):
+    def test_getters(self):
+        with FakeUptimeKumaServer() as server:
+            with UptimeKumaApi(server.url, wait_events=0.01, model_mode="typed") as api:
+                api.login(server.username, server.password)
+                monitor_id = api.add_monitor(type=MonitorType.HTTP, name="monitor 1", url="http://127.0.0.1")[
+                    "monitorID"
+                ]
+                api.add_notification(name="notification 1", type="PushByTechulus", pushAPIKey="123456789")
+                maintenance_id = api.add_maintenance(title="maintenance 1", strategy=MaintenanceStrategy.MANUAL)[
+                    "maintenanceID"
+                ]
+
+                monitors = api.get_monitors()
+                self.assertTrue(type(monitors[0]) == HttpMonitor)
+                monitor = api.get_monitor(monitor_id)
+                self.assertTrue(type(monitor) == HttpMonitor)
+                self.assertEqual((monitor.name, monitor.type), ("monitor 1", MonitorType.HTTP))
+
+                notifications = api.get_notifications()
+                self.assertTrue(isinstance(notifications[0], Notification))
+                self.assertEqual(notifications[0].name, "notification 1")
+
+                self.assertTrue(isinstance(api.get_maintenances()[0], Maintenance))
+                maintenance = api.get_maintenance(maintenance_id)
+                self.assertTrue(isinstance(maintenance, Maintenance))
+                self.assertEqual(maintenance.strategy, MaintenanceStrategy.MANUAL)
+
+                for heartbeats in [api.get_heartbeats(), api.get_important_heartbeats()]:
+                    self.assertTrue(heartbeats[monitor_id])
+                    self.assertTrue(all(isinstance(i, Heartbeat) for i in heartbeats[monitor_id]))
+                    self.assertEqual(heartbeats[monitor_id][0].monitor_id, monitor_id)
+                beats = api.get_monitor_beats(monitor_id, 1)
+                self.assertTrue(beats)
+                self.assertTrue(all(isinstance(i, Heartbeat) for i in beats))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -19,8 +19,10 @@ class TestNotification(UptimeKumaTestCase):
         }
 
         # test notification
-        with self.assertRaisesRegex(UptimeKumaException, r'Not Found'):
-            self.api.test_notification(**expected_notification)
+        if not self.fake_server:
+            # the fake server does not send notifications
+            with self.assertRaisesRegex(UptimeKumaException, r'Not Found'):
+                self.api.test_notification(**expected_notification)
 
         # add notification
         r = self.api.add_notification(**expected_notification)
@@ -41,7 +43,7 @@ class TestNotification(UptimeKumaTestCase):
 
         # edit notification
         expected_notification["name"] = "notification 1 new"
-        expected_notification["default"] = False
+        expected_notification["isDefault"] = False
         expected_notification["applyExisting"] = False
         expected_notification["type"] = NotificationType.PUSHDEER
         expected_notification["pushdeerKey"] = "987654321"
@@ -0,0 +1,96 @@
+import unittest
+
+from uptime_kuma_api import NotificationType, notification_validators, validate_notifications
+
+
+class TestNotificationValidator(unittest.TestCase):
+    def test_validate(self):
+        validator = notification_validators[NotificationType.TELEGRAM]
+        validator.validate({
+            "name": "notification 1",
+            "type": NotificationType.TELEGRAM,
+            "telegramChatID": "123456789",
+            "telegramBotToken": "987654321"
+        })
+        with self.assertRaisesRegex(TypeError, r"'telegramBotToken'"):
+            validator.validate({
+                "name": "notification 1",
+                "type": NotificationType.TELEGRAM,
+                "telegramChatID": "123456789"
+            })
+        # options of other providers and misspelled options are rejected
+        for key in ["smtpPort", "telegramChatId"]:
+            with self.assertRaisesRegex(TypeError, f"'{key}'"):
+                validator.validate({
+                    "name": "notification 1",
+                    "type": NotificationType.TELEGRAM,
+                    "telegramChatID": "123456789",
+                    "telegramBotToken": "987654321",
+                    "isDefault": True,
+                    key: 1
+                })
+        validator.validate({
+            "name": "notification 1",
+            "type": NotificationType.TELEGRAM,
+            "telegramChatID": "123456789",
+            "telegramBotToken": "987654321",
+            "smtpPort": 25
+        }, ignore={"smtpPort"})
+        with self.assertRaises(ValueError):
+            notification_validators[NotificationType.SMTP].validate({
+                "name": "notification 1",
+                "type": NotificationType.SMTP,
+                "smtpHost": "127.0.0.1",
+                "smtpFrom": "uptime-kuma@example.com",
+                "smtpPort": 65536
+            })
+
+    def test_strip(self):
+        notification = {
+            "id": 1,
+            "name": "notification 1",
+            "type": NotificationType.TELEGRAM,
+            "telegramChatID": "123456789",
+            "telegramBotToken": "987654321",
+            "pushdeerKey": "987654321"
+        }
+        notification_validators[NotificationType.PUSHDEER].strip(notification)
+        self.assertEqual(notification, {
+            "id": 1,
+            "name": "notification 1",
+            "type": NotificationType.TELEGRAM,
+            "pushdeerKey": "987654321"
+        })
+
+    def test_validate_notifications(self):
+        errors = validate_notifications([
+            {
+                "name": "notification 1",
+                "type": NotificationType.PUSHBYTECHULUS,
+                "pushAPIKey": "123456789"
+            },
+            {
+                "name": "notification 2",
+                "type": NotificationType.PUSHBYTECHULUS
+            },
+            {
+                "name": "notification 3",
+                "type": "unknown"
+            },
+            {
+                "name": "notification 4"
+            },
+            {
+                "name": "notification 5",
+                "type": NotificationType.PUSHBYTECHULUS,
+                "pushApiKey": "123456789"
+            }
+        ])
+        self.assertEqual([i for i, _ in errors], [1, 2, 3, 4])
+        self.assertTrue(type(errors[0][1]) == TypeError)
+        self.assertTrue(type(errors[1][1]) == ValueError)
+        self.assertRegex(str(errors[3][1]), "unknown argument 'pushApiKey'")
+
+
+if __name__ == '__main__':
+    unittest.main()
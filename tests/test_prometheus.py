@@ -0,0 +1,70 @@
+import unittest
+
+from uptime_kuma_api import MonitorStatus, MonitorType, UptimeKumaApi, UptimeKumaException, parse_metrics
+from uptime_kuma_api.fake_server import FakeUptimeKumaServer
+from uptime_kuma_api.prometheus import map_monitor_ids
+
+
+class TestPrometheus(unittest.TestCase):
+    def test_parse_metrics(self):
+        lines = [
+            b"# HELP monitor_status Monitor Status (1 = UP, 0= DOWN, 2= PENDING, 3= MAINTENANCE)",
+            b"# TYPE monitor_status gauge",
+            b'monitor_status{monitor_name="a \\"quoted\\" name, with comma",monitor_port="null"} 1',
+            b'monitor_response_time{monitor_name="back\\\\slash"} 12.5 1700000000000',
+            "process_cpu_seconds_total 0.5",
+            "",
+        ]
+        self.assertEqual(list(parse_metrics(lines)), [
+            ("monitor_status", {"monitor_name": 'a "quoted" name, with comma', "monitor_port": "null"}, 1.0),
+            ("monitor_response_time", {"monitor_name": "back\\slash"}, 12.5),
+            ("process_cpu_seconds_total", {}, 0.5),
+        ])
+        self.assertEqual([i[0] for i in parse_metrics(lines, ["monitor_status"])], ["monitor_status"])
+        with self.assertRaises(ValueError):
+            list(parse_metrics(['monitor_status{monitor_name="a"}']))
+
+    def test_map_monitor_ids(self):
+        metrics = {
+            ("a", "port", None, "host", "80"): {"status": MonitorStatus.UP},
+            ("b", "http", "https://b", None, None): {"status": MonitorStatus.DOWN},
+        }
+        monitors = [
+            {"id": 1, "name": "a", "type": "port", "url": "", "hostname": "host", "port": 80},
+            {"id": 2, "name": "b", "type": "http", "url": "https://b", "hostname": None, "port": None},
+            {"id": 3, "name": "b", "type": "http", "url": "https://b", "hostname": None, "port": None},
+        ]
+        self.assertEqual(map_monitor_ids(metrics, monitors), {1: {"status": MonitorStatus.UP}})
+
+    def test_api(self):
+        with FakeUptimeKumaServer() as server:
+            with UptimeKumaApi(server.url, wait_events=0.01) as api:
+                api.login(server.username, server.password)
+                http_id = api.add_monitor(type=MonitorType.HTTP, name="http", url="https://127.0.0.1")["monitorID"]
+                port_id = api.add_monitor(
+                    type=MonitorType.PORT, name='port "1"', hostname="127.0.0.1", port=8080
+                )["monitorID"]
+                server._beat(http_id, status=1, ping=50)
+                server._beat(port_id, status=0, ping=None)
+
+                key = api.add_api_key(name="metrics", expires=None, active=True)["key"]
+                metrics = api.get_monitor_metrics(key)
+                self.assertEqual(metrics[http_id], {
+                    "status": MonitorStatus.UP,
+                    "response_time": 50.0,
+                    "cert_days_remaining": 60,
+                    "cert_is_valid": True,
+                })
+                self.assertEqual(metrics[port_id], {
+                    "status": MonitorStatus.DOWN,
+                    "response_time": None,
+                    "cert_days_remaining": None,
+                    "cert_is_valid": None,
+                })
+
+                with self.assertRaisesRegex(UptimeKumaException, "Invalid API key"):
+                    api.get_monitor_metrics("uk1_invalid")
+
+
+if __name__ == '__main__':
+    unittest.main()
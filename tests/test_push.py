@@ -0,0 +1,79 @@
+import asyncio
+import unittest
+
+from uptime_kuma_api import (
+    AsyncPushClient, MonitorStatus, MonitorType, PushClient, PushQueue, UptimeKumaApi, UptimeKumaException
+)
+from uptime_kuma_api.fake_server import FakeUptimeKumaServer
+
+
+class TestPush(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = FakeUptimeKumaServer()
+        cls.server.start()
+        with UptimeKumaApi(cls.server.url, wait_events=0.01) as api:
+            api.login(cls.server.username, cls.server.password)
+            cls.monitor_ids = [
+                api.add_monitor(type=MonitorType.PUSH, name=f"push {i}")["monitorID"] for i in range(3)
+            ]
+            cls.tokens = [api.get_monitor(i)["pushToken"] for i in cls.monitor_ids]
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def last_heartbeat(self, monitor_id):
+        return self.server.heartbeats[monitor_id][-1]
+
+    def test_push(self):
+        with PushClient(self.server.url) as client:
+            client.push(self.tokens[0], status=MonitorStatus.DOWN, msg="job failed", ping=12.5)
+            heartbeat = self.last_heartbeat(self.monitor_ids[0])
+            self.assertEqual((heartbeat["status"], heartbeat["msg"], heartbeat["ping"]), (0, "job failed", 12.5))
+
+            with self.assertRaisesRegex(UptimeKumaException, "Monitor not found or not active."):
+                client.push("unknown")
+            with self.assertRaises(ValueError):
+                client.push(self.tokens[0], status="unknown")
+
+            r = client.push_many([self.tokens[0], (self.tokens[1], "down", "error"), "unknown"], return_exceptions=True)
+            self.assertEqual(r[:2], [{}, {}])
+            self.assertIsInstance(r[2], UptimeKumaException)
+            self.assertEqual(self.last_heartbeat(self.monitor_ids[1])["msg"], "error")
+
+            snapshot = client.snapshot()
+            self.assertEqual(snapshot["sent"], 5)
+            self.assertEqual(snapshot["errors"], 2)
+
+    def test_async(self):
+        async def run():
+            async with AsyncPushClient(self.server.url) as client:
+                await client.push(self.tokens[2], msg="async")
+                return await client.push_many([self.tokens[0], self.tokens[1]])
+
+        self.assertEqual(asyncio.run(run()), [{}, {}])
+        self.assertEqual(self.last_heartbeat(self.monitor_ids[2])["msg"], "async")
+
+    def test_queue(self):
+        client = PushClient(self.server.url)
+        with PushQueue(client, flush_interval=10) as queue:
+            for i in range(5):
+                queue.put(self.tokens[0], msg=f"push {i}")
+            queue.put(self.tokens[1], status="down")
+            self.assertEqual(queue.snapshot()["queued"], 6)
+            self.assertTrue(queue.flush(timeout=5))
+            snapshot = queue.snapshot()
+            self.assertEqual(snapshot["sent"], 2)
+            self.assertEqual(snapshot["coalesced"], 4)
+            self.assertEqual(self.last_heartbeat(self.monitor_ids[0])["msg"], "push 4")
+
+            queue.put(self.tokens[2], msg="on close")
+        self.assertEqual(self.last_heartbeat(self.monitor_ids[2])["msg"], "on close")
+        with self.assertRaises(UptimeKumaException):
+            queue.put(self.tokens[2])
+        client.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+import json
+import time
+import unittest
+
+from uptime_kuma_api import Event, MonitorType, ReadOnlyDict, ReadOnlyList, UptimeKumaApi, json_default
+from uptime_kuma_api.fake_server import FakeUptimeKumaServer
+from uptime_kuma_api.readonly import freeze
+
+
+class TestReadOnly(unittest.TestCase):
+    def test_views(self):
+        data = {"1": {"id": 1, "tags": [{"name": "tag 1"}]}}
+        view = freeze(data)
+        self.assertTrue(type(view) == ReadOnlyDict)
+        self.assertTrue(type(view["1"]["tags"]) == ReadOnlyList)
+        self.assertEqual(view["1"]["tags"][0]["name"], "tag 1")
+        self.assertEqual(view, data)
+        self.assertEqual(list(view.keys()), ["1"])
+
+        with self.assertRaises(TypeError):
+            view["1"] = {}
+        with self.assertRaises(TypeError):
+            view["1"]["tags"][0]["name"] = "tag 2"
+        with self.assertRaises(AttributeError):
+            view["1"]["tags"].append({})
+
+        # views are not copies
+        data["1"]["id"] = 2
+        self.assertEqual(view["1"]["id"], 2)
+
+        # copies are mutable and independent
+        copy = view.copy()
+        copy["1"]["id"] = 3
+        self.assertEqual(data["1"]["id"], 2)
+
+    def test_iterate_while_changed(self):
+        data = {1: [{"id": 1}, {"id": 2}, {"id": 3}]}
+        view = freeze(data)
+        keys = []
+        for key in view:
+            data[key + 10] = []
+            keys.append(key)
+        self.assertEqual(keys, [1])
+
+        # removed items are not skipped
+        ids = []
+        for heartbeat in view[1]:
+            data[1].pop(0)
+            data[1].append({"id": 4})
+            ids.append(heartbeat["id"])
+        self.assertEqual(ids, [1, 2, 3])
+        self.assertEqual([i["id"] for i in reversed(view[1])], [4, 4, 4])
+        self.assertTrue(type(next(iter(view[1]))) == ReadOnlyDict)
+
+    def test_json_default(self):
+        data = {"1": {"id": 1, "tags": []}}
+        self.assertEqual(json.dumps(freeze(data), default=json_default), json.dumps(data))
+
+
+class TestRawApi(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeUptimeKumaServer(monitors=1, heartbeats=100)
+        self.server.start()
+        self.api = UptimeKumaApi(self.server.url, wait_events=0.01, model_mode="raw")
+        self.api.login(self.server.username, self.server.password)
+
+    def tearDown(self):
+        self.api.disconnect()
+        self.server.stop()
+
+    def wait_until(self, predicate):
+        # the events are handled in the thread of the Socket.IO client
+        deadline = time.monotonic() + 5
+        while not predicate():
+            self.assertLess(time.monotonic(), deadline)
+            time.sleep(0.01)
+
+    def test_views(self):
+        monitors = self.api.get_monitors()
+        self.assertTrue(type(monitors) == ReadOnlyList)
+        self.assertTrue(type(monitors[0]) == ReadOnlyDict)
+        # not parsed
+        self.assertTrue(type(monitors[0]["type"]) == str)
+        self.assertEqual(monitors[0]["active"], 1)
+
+        # not copied
+        heartbeats = self.api.get_heartbeats()
+        self.assertIs(heartbeats._data, self.api._event_data[Event.HEARTBEAT_LIST])
+        with self.assertRaises(TypeError):
+            heartbeats[1] = []
+
+    def test_iterate_while_events_arrive(self):
+        heartbeats = self.api.get_heartbeats()
+        live = self.api._event_data[Event.HEARTBEAT_LIST]
+
+        # a heartbeat of a new monitor adds a key
+        keys = []
+        for monitor_id in heartbeats:
+            if not keys:
+                monitor_id_2 = self.api.add_monitor(type=MonitorType.HTTP, name="monitor 2", url="http://127.0.0.1")[
+                    "monitorID"
+                ]
+                self.server._beat(monitor_id_2)
+                self.wait_until(lambda: monitor_id_2 in live)
+            keys.append(monitor_id)
+        self.assertEqual(keys, [1])
+
+        # the client keeps 150 heartbeats of a monitor, a new heartbeat removes the first one
+        for _ in range(49):
+            self.server._beat(1)
+        self.wait_until(lambda: len(live[1]) == 149)
+        ids = [i["id"] for i in live[1]]
+        received = []
+        for heartbeat in heartbeats[1]:
+            if not received:
+                self.server._beat(1)
+                self.wait_until(lambda: live[1][0]["id"] != ids[0])
+            received.append(heartbeat["id"])
+        self.assertEqual(received, ids)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+import time
+import unittest
+
+import socketio
+
+from uptime_kuma_api import Event, MonitorType, RetryPolicy, UptimeKumaApi, classify
+from uptime_kuma_api.fake_server import FakeUptimeKumaServer
+
+
+class FlakyCall(object):
+    # times out the first calls, optionally after executing them
+    def __init__(self, timeouts, event_data=None, created=None, response=None):
+        self.timeouts = timeouts
+        self.event_data = event_data
+        self.created = created
+        self.response = response
+        self.calls = 0
+
+    def __call__(self, event, data):
+        self.calls += 1
+        if self.created is not None and self.calls == 1:
+            self.event_data[Event.MONITOR_LIST][str(self.created["id"])] = self.created
+        if self.calls <= self.timeouts:
+            raise socketio.exceptions.TimeoutError()
+        return self.response or {"ok": True, "calls": self.calls}
+
+
+class TestRetry(unittest.TestCase):
+    def setUp(self):
+        self.policy = RetryPolicy(max_attempts=3, base_delay=0.001, seed=1, list_timeout=0.01)
+        self.event_data = {Event.MONITOR_LIST: {"1": {"id": 1, "type": "http", "name": "monitor 1"}}}
+
+    def test_classify(self):
+        self.assertEqual(classify("getMonitor", 1), "safe")
+        self.assertEqual(classify("editMonitor", {}), "conditional")
+        self.assertEqual(classify("addNotification", ({}, 1)), "conditional")
+        self.assertEqual(classify("addNotification", ({}, None)), "unsafe")
+        self.assertEqual(classify("add", {}), "unsafe")
+        self.assertEqual(classify("unknownEvent"), "unsafe")
+
+    def test_delay(self):
+        policy = RetryPolicy(base_delay=1, max_delay=3, seed=1)
+        for attempt in range(1, 10):
+            self.assertLessEqual(policy.delay(attempt), min(3, 2 ** (attempt - 1)))
+
+    def test_safe(self):
+        call = FlakyCall(timeouts=2)
+        self.assertEqual(self.policy.call(call, "getMonitor", 1, self.event_data)["calls"], 3)
+        self.assertEqual(self.policy.snapshot(), {"retries": 2, "recovered": 0, "exhausted": 0})
+
+        call = FlakyCall(timeouts=3)
+        with self.assertRaises(socketio.exceptions.TimeoutError):
+            self.policy.call(call, "editMonitor", {}, self.event_data)
+        self.assertEqual(call.calls, 3)
+        self.assertEqual(self.policy.snapshot()["exhausted"], 1)
+
+    def test_unsafe(self):
+        data = {"type": "http", "name": "monitor 2"}
+
+        # the server did not execute the call
+        call = FlakyCall(timeouts=1)
+        self.assertEqual(self.policy.call(call, "add", data, self.event_data)["calls"], 2)
+
+        # the server executed the call, the monitor is not added again
+        created = {"id": 3, "type": "http", "name": "monitor 2"}
+        call = FlakyCall(timeouts=1, event_data=self.event_data, created=created)
+        r = self.policy.call(call, "add", data, self.event_data)
+        self.assertEqual(r, {"ok": True, "msg": "Added Successfully.", "monitorID": 3})
+        self.assertEqual(call.calls, 1)
+        self.assertEqual(self.policy.snapshot()["recovered"], 1)
+
+        # unsafe calls whose outcome cannot be checked are sent once
+        call = FlakyCall(timeouts=1)
+        with self.assertRaises(socketio.exceptions.TimeoutError):
+            self.policy.call(call, "postIncident", ("slug", {}), self.event_data)
+        self.assertEqual(call.calls, 1)
+
+        policy = RetryPolicy(retry_unsafe=False)
+        call = FlakyCall(timeouts=1)
+        with self.assertRaises(socketio.exceptions.TimeoutError):
+            policy.call(call, "add", data, self.event_data)
+        self.assertEqual(call.calls, 1)
+
+
+    def test_delete(self):
+        # the first attempt deleted the monitor
+        call = FlakyCall(timeouts=1, response={"ok": False, "msg": "Monitor not found"})
+        self.assertEqual(self.policy.call(call, "deleteMonitor", 1, self.event_data), {
+            "ok": True, "msg": "Deleted Successfully."
+        })
+        self.assertEqual(call.calls, 2)
+
+        call = FlakyCall(timeouts=0, response={"ok": False, "msg": "Monitor not found"})
+        self.assertEqual(self.policy.call(call, "deleteMonitor", 1, self.event_data)["ok"], False)
+
+    def test_late_list(self):
+        with FakeUptimeKumaServer() as server:
+            policy = RetryPolicy(max_attempts=3, base_delay=0.001, seed=1)
+            with UptimeKumaApi(server.url, timeout=0.5, wait_events=0.01, retry_policy=policy) as api:
+                api.login(server.username, server.password)
+
+                # the server executes the first call after the client timed out, the repeated call in time
+                delays = []
+                server._delay = lambda: time.sleep(delays.pop(0) if delays else 0.4)
+
+                delays.append(0.8)
+                r = api.add_monitor(type=MonitorType.HTTP, name="monitor 1", url="http://127.0.0.1")
+                self.assertEqual(r["monitorID"], 1)
+                self.assertEqual(list(server.monitors), [1])
+
+                delays.append(0.8)
+                api.delete_monitor(1)
+                self.assertEqual(server.monitors, {})
+                self.assertEqual(policy.snapshot()["recovered"], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+import threading
+import time
+import unittest
+
+from uptime_kuma_api import (
+    AdaptiveConcurrencyLimiter, CallScheduler, MonitorType, Timeout, TokenBucket, UptimeKumaApi, UptimeKumaException
+)
+from uptime_kuma_api.fake_server import FakeUptimeKumaServer
+
+
+class TestScheduler(unittest.TestCase):
+    def test_token_bucket(self):
+        bucket = TokenBucket(rate=100, burst=2)
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertAlmostEqual(bucket.reserve(), 0.01, places=3)
+        self.assertAlmostEqual(bucket.reserve(), 0.02, places=3)
+
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=0)
+
+    def test_aimd(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=4, latency_threshold=1)
+        for _ in range(8):
+            limiter.release(limiter.acquire())
+        self.assertEqual(limiter.limit, 4)
+
+        # concurrent timeouts of one round decrease the limit once
+        starts = [limiter.acquire() for _ in range(4)]
+        for start in starts:
+            limiter.release(start, "timeout")
+        self.assertEqual(limiter.limit, 2)
+        self.assertEqual(limiter.decreases, 1)
+
+        limiter.release(limiter.acquire(), "error")
+        self.assertEqual(limiter.limit, 2)
+
+        # slow calls decrease the limit
+        start = limiter.acquire()
+        limiter.latency_threshold = 0.01
+        time.sleep(0.02)
+        limiter.release(start)
+        self.assertEqual(limiter.limit, 1)
+
+    def test_concurrency_limit(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+        start = limiter.acquire()
+        acquired = threading.Event()
+
+        def acquire():
+            limiter.acquire()
+            acquired.set()
+
+        threading.Thread(target=acquire, daemon=True).start()
+        self.assertFalse(acquired.wait(0.05))
+        limiter.release(start)
+        self.assertTrue(acquired.wait(1))
+
+    def test_slot(self):
+        scheduler = CallScheduler(initial_concurrency=2)
+        with scheduler.slot():
+            pass
+        with self.assertRaises(Timeout):
+            with scheduler.slot():
+                raise Timeout()
+        with self.assertRaises(UptimeKumaException):
+            with scheduler.slot():
+                raise UptimeKumaException()
+        snapshot = scheduler.snapshot()
+        self.assertEqual(snapshot["calls"], 3)
+        self.assertEqual(snapshot["timeouts"], 1)
+        self.assertEqual(snapshot["errors"], 1)
+        self.assertEqual(snapshot["limit"], 1.25)
+
+    def test_bulk(self):
+        scheduler = CallScheduler(max_concurrency=8)
+        with FakeUptimeKumaServer(latency=0.05) as server:
+            with UptimeKumaApi(server.url, wait_events=0.01, scheduler=scheduler) as api:
+                api.login(server.username, server.password)
+
+                start = time.perf_counter()
+                r = api.add_monitors([
+                    {"type": MonitorType.HTTP, "name": f"monitor {i}", "url": "http://127.0.0.1"} for i in range(20)
+                ])
+                # concurrent calls are faster than sequential calls
+                self.assertLess(time.perf_counter() - start, 20 * 0.05 * 0.75)
+                monitor_ids = [i["monitorID"] for i in r]
+                self.assertEqual(sorted(monitor_ids), list(range(1, 21)))
+
+                api.edit_monitors({monitor_id: {"interval": 30} for monitor_id in monitor_ids[:5]})
+                self.assertEqual(api.get_monitor(monitor_ids[0])["interval"], 30)
+
+                r = api.add_monitors([{"type": MonitorType.HTTP, "name": "invalid"}], return_exceptions=True)
+                self.assertIsInstance(r[0], TypeError)
+                self.assertGreater(scheduler.snapshot()["calls"], 25)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from uptime_kuma_api import SingleFlight, UptimeKumaApi, UptimeKumaException
+from uptime_kuma_api.fake_server import FakeUptimeKumaServer
+
+
+class TestSingleFlight(unittest.TestCase):
+    def test_coalesce(self):
+        single_flight = SingleFlight()
+        calls = []
+        started = threading.Event()
+        release = threading.Event()
+
+        def func():
+            calls.append(1)
+            started.set()
+            release.wait()
+            return {"monitor": {"id": 1}}
+
+        with ThreadPoolExecutor(4) as executor:
+            leader = executor.submit(single_flight.do, ("getMonitor", "1"), func, "getMonitor")
+            started.wait()
+            followers = [executor.submit(single_flight.do, ("getMonitor", "1"), func, "getMonitor") for _ in range(3)]
+            time.sleep(0.05)
+            release.set()
+            results = [leader.result()] + [i.result() for i in followers]
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [{"monitor": {"id": 1}}] * 4)
+        # every caller receives its own object
+        self.assertEqual(len({id(i) for i in results}), 4)
+
+        # a finished request is not reused
+        release.set()
+        single_flight.do(("getMonitor", "1"), func, "getMonitor")
+        self.assertEqual(len(calls), 2)
+
+        snapshot = single_flight.snapshot()
+        self.assertEqual(snapshot["calls"], 5)
+        self.assertEqual(snapshot["shared"], 3)
+        self.assertEqual(snapshot["hit_rate"], 0.6)
+        self.assertEqual(snapshot["events"]["getMonitor"], {"calls": 5, "shared": 3})
+
+        single_flight.reset()
+        self.assertEqual(single_flight.snapshot()["calls"], 0)
+
+    def test_error(self):
+        single_flight = SingleFlight()
+        started = threading.Event()
+
+        def func():
+            started.set()
+            time.sleep(0.05)
+            raise UptimeKumaException("error")
+
+        with ThreadPoolExecutor(2) as executor:
+            leader = executor.submit(single_flight.do, "key", func)
+            started.wait()
+            follower = executor.submit(single_flight.do, "key", func)
+            for future in [leader, follower]:
+                with self.assertRaises(UptimeKumaException):
+                    future.result()
+
+    def test_api(self):
+        with FakeUptimeKumaServer(monitors=1, latency=0.05) as server:
+            with UptimeKumaApi(server.url, wait_events=0.01, single_flight=True) as api:
+                api.login(server.username, server.password)
+                with ThreadPoolExecutor(8) as executor:
+                    monitors = list(executor.map(api.get_monitor, [1] * 8))
+                self.assertEqual([i["id"] for i in monitors], [1] * 8)
+                snapshot = api.single_flight.snapshot()["events"]
+                self.assertEqual(snapshot["getMonitor"]["calls"], 8)
+                self.assertGreater(snapshot["getMonitor"]["shared"], 0)
+                self.assertNotIn("login", snapshot)
+
+
+if __name__ == '__main__':
+    unittest.main()
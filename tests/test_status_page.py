@@ -1,6 +1,6 @@
 import unittest
 
-from uptime_kuma_api import UptimeKumaException, IncidentStyle
+from uptime_kuma_api import Instrumentation, UptimeKumaException, IncidentStyle
 from uptime_kuma_test_case import UptimeKumaTestCase
 
 
@@ -49,6 +49,12 @@ class TestStatusPage(UptimeKumaTestCase):
         status_page = self.api.get_status_page(slug)
         self.compare(status_page, expected_status_page)
 
+        # get status page heartbeats
+        heartbeats = self.api.get_status_page_heartbeats(slug)
+        self.assertIn(monitor_id, heartbeats["heartbeatList"])
+        heartbeats = self.api.get_status_pages_heartbeats([slug])
+        self.assertIn(monitor_id, heartbeats[slug]["heartbeatList"])
+
         # get status pages
         status_pages = self.api.get_status_pages()
         status_page = self.find_by_id(status_pages, slug, "slug")
@@ -91,6 +97,55 @@ class TestStatusPage(UptimeKumaTestCase):
         status_page = self.find_by_id(status_pages, slug, "slug")
         self.assertIsNone(status_page)
 
+    def test_save_status_page_patch(self):
+        monitor_id = self.add_monitor()
+        slugs = ["slug1", "slug2"]
+        for slug in slugs:
+            self.api.add_status_page(slug, f"status page {slug}")
+        self.api.save_status_page(slugs[0], publicGroupList=[{"name": "Services", "monitorList": [{"id": monitor_id}]}])
+
+        # the config of the previous save is used, the status page is not requested again
+        self.api.instrumentation = Instrumentation()
+        self.api.save_status_page(slugs[0], title="status page new")
+        self.api.post_incident(slugs[0], title="title 1", content="content 1")
+        self.assertEqual(sorted(self.api.instrumentation.snapshot()["call"]), ["postIncident", "saveStatusPage"])
+        self.assertNotIn("http", self.api.instrumentation.snapshot())
+
+        status_page = self.find_by_id(self.api.get_status_pages(), slugs[0], "slug")
+        self.assertEqual(status_page["title"], "status page new")
+        status_page = self.api.get_status_page(slugs[0])
+        self.assertEqual(status_page["title"], "status page new")
+        self.assertEqual(status_page["publicGroupList"][0]["monitorList"][0]["id"], monitor_id)
+
+        # deleting a monitor forgets the known configs
+        self.api.delete_monitor(monitor_id)
+        self.api.instrumentation = Instrumentation()
+        self.api.save_status_page(slugs[0], description="description")
+        self.assertEqual(sorted(self.api.instrumentation.snapshot()["call"]), ["getStatusPage", "saveStatusPage"])
+        self.assertEqual(self.api.get_status_page(slugs[0])["publicGroupList"][0]["monitorList"], [])
+
+        incidents = self.api.post_incidents(slugs, title="title 2", content="content 2", style=IncidentStyle.DANGER)
+        self.assertEqual(sorted(incidents), slugs)
+        for slug in slugs:
+            self.assertEqual(self.api.get_status_page(slug)["incident"]["title"], "title 2")
+
+        r = self.api.post_incidents(["slug1", "slug42"], title="title 3", content="content 3", return_exceptions=True)
+        self.assertIsInstance(r["slug42"], UptimeKumaException)
+
+    def test_save_status_page_after_raw_read(self):
+        slug = "slug1"
+        self.api.add_status_page(slug, "status page 1")
+        with self.api.raw():
+            status_page = self.api.get_status_page(slug)
+        self.assertEqual(status_page["title"], "status page 1")
+
+        # the raw config is decoded when it is saved, it is not requested again
+        self.api.instrumentation = Instrumentation()
+        self.api.save_status_page(slug, description="description")
+        self.assertEqual(sorted(self.api.instrumentation.snapshot()["call"]), ["saveStatusPage"])
+        self.assertEqual(self.api.get_status_page(slug)["description"], "description")
+        self.assertIsNone(status_page["description"])
+
     def test_delete_not_existing_status_page(self):
         with self.assertRaises(UptimeKumaException):
             self.api.delete_status_page("slug42")
@@ -0,0 +1,94 @@
+import unittest
+
+from uptime_kuma_api import GroupRule, Instrumentation, MonitorType, UptimeKumaApi, build_groups
+from uptime_kuma_api.fake_server import FakeUptimeKumaServer
+from uptime_kuma_api.status_page_groups import groups_changed
+
+
+def monitor(id_, name, type_="http", tags=()):
+    return {
+        "id": id_,
+        "name": name,
+        "type": type_,
+        "tags": [{"name": tag, "value": value} for tag, value in tags],
+    }
+
+
+class TestStatusPageGroups(unittest.TestCase):
+    def setUp(self):
+        self.monitors = [
+            monitor(1, "b", tags=[("env", "production")]),
+            monitor(2, "a", tags=[("env", "production"), ("env", "staging")]),
+            monitor(3, "c", type_="ping", tags=[("env", "staging")]),
+            monitor(4, "d", type_="ping"),
+        ]
+        self.rules = [
+            GroupRule("Production", tag="env", value="production"),
+            GroupRule("Staging", tag="env", value="staging", filter=lambda i: i["type"] == "ping"),
+            GroupRule("Ping", filter=lambda i: i["type"] == "ping", send_url=True),
+        ]
+
+    def members(self, groups):
+        return [(group["name"], [i["id"] for i in group["monitorList"]]) for group in groups]
+
+    def test_build(self):
+        groups = build_groups(self.rules, self.monitors)
+        self.assertEqual(self.members(groups), [("Production", [2, 1]), ("Staging", [3]), ("Ping", [3, 4])])
+        self.assertEqual(groups[2]["monitorList"][0], {"id": 3, "sendUrl": True})
+        self.assertTrue(groups_changed([], groups))
+
+        with self.assertRaises(ValueError):
+            GroupRule("Services")
+
+    def test_keep_current(self):
+        current = [
+            {"id": 7, "name": "Other", "monitorList": [{"id": 4}]},
+            {"id": 5, "name": "Production", "monitorList": [{"id": 1, "sendUrl": True}, {"id": 9}]},
+        ]
+        groups = build_groups(self.rules[:1], self.monitors, current)
+        # the existing group keeps its id and the order of its monitors, removed monitors are dropped
+        self.assertEqual(groups, [
+            {"id": 5, "name": "Production", "monitorList": [{"id": 1, "sendUrl": True}, {"id": 2, "sendUrl": False}]}
+        ])
+        self.assertTrue(groups_changed(current, groups))
+
+        groups = build_groups(self.rules[:1], self.monitors, current, keep_other_groups=True)
+        self.assertEqual(self.members(groups), [("Production", [1, 2]), ("Other", [4])])
+        self.assertFalse(groups_changed(groups, build_groups(self.rules[:1], self.monitors, groups, True)))
+
+    def test_api(self):
+        with FakeUptimeKumaServer() as server:
+            with UptimeKumaApi(server.url, wait_events=0.01) as api:
+                api.login(server.username, server.password)
+                tag = api.add_tag(name="env", color="#ffffff")
+                monitor_ids = []
+                for i in range(2):
+                    monitor_ids.append(api.add_monitor(
+                        type=MonitorType.HTTP, name=f"monitor {i}", url="http://127.0.0.1"
+                    )["monitorID"])
+                api.add_monitor_tag(tag["id"], monitor_ids[0], "production")
+                for slug in ["slug1", "slug2"]:
+                    api.add_status_page(slug, slug)
+
+                rules = {
+                    "slug1": [GroupRule("Production", tag="env", value="production")],
+                    "slug2": [GroupRule("Websites", filter=lambda i: i["type"] == "http")],
+                }
+                self.assertEqual(api.sync_status_page_groups(rules), {"slug1": True, "slug2": True})
+                groups = api.get_status_page("slug2")["publicGroupList"]
+                self.assertEqual(self.members(groups), [("Websites", monitor_ids)])
+
+                # unchanged status pages are not saved
+                api.add_monitor_tag(tag["id"], monitor_ids[1], "production")
+                api.instrumentation = Instrumentation()
+                self.assertEqual(api.sync_status_page_groups(rules), {"slug1": True, "slug2": False})
+                self.assertEqual(api.instrumentation.snapshot()["call"].get("saveStatusPage", {}).get("count"), 1)
+                groups = api.get_status_page("slug1")["publicGroupList"]
+                self.assertEqual(self.members(groups), [("Production", monitor_ids)])
+
+                r = api.sync_status_page_groups({"slug42": rules["slug1"]}, return_exceptions=True)
+                self.assertIsInstance(r["slug42"], Exception)
+
+
+if __name__ == '__main__':
+    unittest.main()
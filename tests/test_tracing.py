@@ -0,0 +1,82 @@
+import unittest
+
+from uptime_kuma_api import MonitorType, RecordingTracer, Tracer, UptimeKumaApi
+from uptime_kuma_api.fake_server import FakeUptimeKumaServer
+from uptime_kuma_api.tracing import trace_methods
+
+
+class Client(object):
+    def outer(self):
+        return self.inner() + 1
+
+    def inner(self):
+        with self.tracer.span("call", {"uptime_kuma.kind": "call"}) as span:
+            span.set_attribute("uptime_kuma.response_size", 2)
+        return 1
+
+    def fail(self):
+        raise ValueError("error")
+
+
+class TestTracing(unittest.TestCase):
+    def test_nested_spans(self):
+        client = Client()
+        client.tracer = RecordingTracer()
+        trace_methods(client, client.tracer)
+
+        self.assertEqual(client.outer(), 2)
+        self.assertEqual(len(client.tracer.spans), 1)
+        span = client.tracer.spans[0].to_dict()
+        self.assertEqual(span["name"], "outer")
+        self.assertEqual(span["children"][0]["name"], "inner")
+        call = span["children"][0]["children"][0]
+        self.assertEqual(call["attributes"], {"uptime_kuma.kind": "call", "uptime_kuma.response_size": 2})
+        self.assertIsNotNone(call["duration"])
+
+        # other instances are not traced
+        self.assertNotIn("outer", vars(Client()))
+
+    def test_error(self):
+        client = Client()
+        client.tracer = RecordingTracer(max_spans=1)
+        trace_methods(client, client.tracer)
+
+        with self.assertRaises(ValueError):
+            client.fail()
+        client.inner()
+        self.assertEqual([span.name for span in client.tracer.spans], ["inner"])
+        client.tracer.clear()
+        with self.assertRaises(ValueError):
+            client.fail()
+        self.assertIsInstance(client.tracer.spans[0].error, ValueError)
+
+    def test_noop_tracer(self):
+        tracer = Tracer()
+        with tracer.span("name") as span:
+            span.set_attribute("key", "value")
+        with tracer.attach(tracer.current()):
+            pass
+
+    def test_api(self):
+        tracer = RecordingTracer()
+        with FakeUptimeKumaServer() as server:
+            with UptimeKumaApi(server.url, wait_events=0.01, tracer=tracer) as api:
+                api.login(server.username, server.password)
+                tracer.clear()
+                monitors = [
+                    {"type": MonitorType.HTTP, "name": f"monitor {i}", "url": "http://127.0.0.1"}
+                    for i in range(3)
+                ]
+                api.add_monitors(monitors, max_workers=3)
+
+                # the spans of the worker threads are nested in the span of the bulk method
+                self.assertEqual([span.name for span in tracer.spans], ["add_monitors"])
+                children = tracer.spans[0].children
+                self.assertEqual([span.name for span in children], ["add_monitor"] * 3)
+                for span in children:
+                    calls = {i.name: i.attributes for i in span.children}
+                    self.assertEqual(calls["add"]["uptime_kuma.kind"], "call")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,10 @@
+import atexit
+import os
 import unittest
 import warnings
 
 from uptime_kuma_api import UptimeKumaApi, MonitorType, DockerType
+from uptime_kuma_api.fake_server import FakeUptimeKumaServer
 
 token = None
 
@@ -33,6 +36,17 @@ class UptimeKumaTestCase(unittest.TestCase):
     url = "http://127.0.0.1:3001"
     username = "admin"
     password = "secret123"
+    fake_server = None
+
+    @classmethod
+    def setUpClass(cls):
+        # UPTIME_KUMA_TEST_SERVER=fake runs the tests against an in-process fake server instead of a container
+        if os.environ.get("UPTIME_KUMA_TEST_SERVER") == "fake" and UptimeKumaTestCase.fake_server is None:
+            UptimeKumaTestCase.fake_server = FakeUptimeKumaServer(username=None)
+            UptimeKumaTestCase.fake_server.start()
+            UptimeKumaTestCase.url = UptimeKumaTestCase.fake_server.url
+            # the server is shared by all test modules, so it is stopped when the test run exits
+            atexit.register(UptimeKumaTestCase.fake_server.stop)
 
     def setUp(self):
         warnings.simplefilter("ignore", ResourceWarning)
@@ -48,45 +62,8 @@ class UptimeKumaTestCase(unittest.TestCase):
 
         self.api.login_by_token(token)
 
-        # delete monitors
-        monitors = self.api.get_monitors()
-        for monitor in monitors:
-            self.api.delete_monitor(monitor["id"])
-
-        # delete notifications
-        notifications = self.api.get_notifications()
-        for notification in notifications:
-            self.api.delete_notification(notification["id"])
-
-        # delete proxies
-        proxies = self.api.get_proxies()
-        for proxy in proxies:
-            self.api.delete_proxy(proxy["id"])
-
-        # delete tags
-        tags = self.api.get_tags()
-        for tag in tags:
-            self.api.delete_tag(tag["id"])
-
-        # delete status pages
-        status_pages = self.api.get_status_pages()
-        for status_page in status_pages:
-            self.api.delete_status_page(status_page["slug"])
-
-        # delete docker hosts
-        docker_hosts = self.api.get_docker_hosts()
-        for docker_host in docker_hosts:
-            self.api.delete_docker_host(docker_host["id"])
-
-        # delete maintenances
-        maintenances = self.api.get_maintenances()
-        for maintenance in maintenances:
-            self.api.delete_maintenance(maintenance["id"])
-
-        # delete api keys
-        api_keys = self.api.get_api_keys()
-        for api_key in api_keys:
-            self.api.delete_api_key(api_key["id"])
+        # delete monitors, notifications, proxies, tags, status pages, docker hosts, maintenances and api keys
+        self.api.purge()
 
         # login again to receive initial messages
         self.api.disconnect()
@@ -3,10 +3,26 @@ from .auth_method import AuthMethod
 from .monitor_status import MonitorStatus
 from .monitor_type import MonitorType
 from .notification_providers import NotificationType, notification_provider_options, notification_provider_conditions
+from .notification_validator import NotificationProviderValidator, notification_validators, validate_notifications
 from .proxy_protocol import ProxyProtocol
 from .incident_style import IncidentStyle
 from .docker_type import DockerType
 from .maintenance_strategy import MaintenanceStrategy
 from .exceptions import UptimeKumaException, Timeout
 from .event import Event
+from .base_model import BaseModel
+from .instrumentation import Instrumentation
+from .json_codec import JsonCodec
+from .scheduler import CallScheduler, TokenBucket, AdaptiveConcurrencyLimiter
+from .retry import RetryPolicy, classify
+from .singleflight import SingleFlight
+from .cache import TTLCache
+from .push import PushClient, AsyncPushClient, PushQueue
+from .prometheus import parse_metrics
+from .backup import iter_backup, write_backup, rewrite_backup
+from .maintenance_schedule import MaintenanceSchedule
+from .status_page_groups import GroupRule, build_groups
+from .readonly import ReadOnlyDict, ReadOnlyList, json_default
+from .tracing import Tracer, Span, RecordingTracer, RecordedSpan, OpenTelemetryTracer
+from .models import Monitor, Heartbeat, Notification, Maintenance, monitor_models
 from .api import UptimeKumaApi
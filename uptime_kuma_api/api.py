@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 import datetime
-import json
+import io
 import random
 import string
+import threading
 import time
-from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
 from copy import deepcopy
-from typing import Any
+from typing import Any, Callable, Optional, Union
 
 import requests
 import socketio
@@ -25,8 +27,6 @@ from . import (
     ProxyProtocol,
     Timeout,
     UptimeKumaException,
-    notification_provider_conditions,
-    notification_provider_options,
 )
 
 from .docstrings import (
@@ -38,72 +38,38 @@ from .docstrings import (
     proxy_docstring,
     tag_docstring,
 )
-
-
-def int_to_bool(data, keys) -> None:
-    if isinstance(data, list):
-        for d in data:
-            int_to_bool(d, keys)
-    else:
-        for key in keys:
-            if key in data:
-                data[key] = True if data[key] == 1 else False
-
-
-def parse_value(data, key, type_, default=None) -> None:
-    if not data:
-        return
-    if isinstance(data, list):
-        for d in data:
-            parse_value(d, key, type_, default)
-    else:
-        if key in data:
-            if data[key] is not None:
-                try:
-                    data[key] = type_(data[key])
-                except ValueError:
-                    # todo: add warning to logs
-                    pass
-            elif default is not None:
-                data[key] = default
-
-
-# monitor
-def parse_monitor_status(data) -> None:
-    parse_value(data, "status", MonitorStatus)
-
-
-def parse_monitor_type(data) -> None:
-    parse_value(data, "type", MonitorType)
-
-
-def parse_auth_method(data) -> None:
-    parse_value(data, "authMethod", AuthMethod, AuthMethod.NONE)
-
-
-# notification
-def parse_notification_type(data) -> None:
-    parse_value(data, "type", NotificationType)
-
-
-# docker host
-def parse_docker_type(data) -> None:
-    parse_value(data, "dockerType", DockerType)
-
-
-# status page
-def parse_incident_style(data) -> None:
-    parse_value(data, "style", IncidentStyle)
-
-
-# maintenance
-def parse_maintenance_strategy(data) -> None:
-    parse_value(data, "strategy", MaintenanceStrategy)
-
-
-# proxy
-def parse_proxy_protocol(data) -> None:
-    parse_value(data, "protocol", ProxyProtocol)
+from .cert_info import CertInfoStore
+from .decoders import (
+    decode_api_key,
+    decode_docker_host,
+    decode_heartbeat,
+    decode_heartbeats,
+    decode_incident,
+    decode_list,
+    decode_maintenance,
+    decode_monitor,
+    decode_proxy,
+    decode_status_page,
+    decode_status_page_heartbeats,
+    notification_decoder,
+)
+from .instrumentation import Instrumentation
+from .json_codec import get_json_codec
+from .models import Heartbeat, Maintenance, Notification, monitor_from_dict
+from .backup import rewrite_backup, write_backup
+from .maintenance_schedule import MaintenanceSchedule
+from .prometheus import fetch_monitor_metrics, map_monitor_ids
+from .readonly import freeze
+from .status_page_groups import build_groups, groups_changed, index_by_tag
+from .cache import STATUS_PAGE_CONFIG, TTLCache, invalidated_entries
+from .retry import RetryPolicy
+from .scheduler import CallScheduler
+from .singleflight import SingleFlight, coalesced_events
+from .tracing import Tracer, trace_methods
+from .notification_validator import (
+    check_notification_options,
+    get_notification_validator,
+)
 
 
 def gen_secret(length: int) -> str:
@@ -111,13 +77,6 @@ def gen_secret(length: int) -> str:
     return "".join(random.choice(chars) for _ in range(length))
 
 
-def _convert_monitor_return(monitor) -> None:
-    if isinstance(monitor["notificationIDList"], dict):
-        monitor["notificationIDList"] = [
-            int(i) for i in monitor["notificationIDList"].keys()
-        ]
-
-
 def _convert_monitor_input(kwargs) -> None:
     if not kwargs["accepted_statuscodes"]:
         kwargs["accepted_statuscodes"] = ["200-299"]
@@ -159,13 +118,7 @@ def _build_notification_data(
     applyExisting: bool = False,
     **kwargs,
 ) -> dict:
-    allowed_kwargs = []
-    for keys in notification_provider_options.values():
-        allowed_kwargs.extend(keys)
-
-    for key in kwargs.keys():
-        if key not in allowed_kwargs:
-            raise TypeError(f"unknown argument '{key}'")
+    check_notification_options(kwargs)
 
     data = {
         "name": name,
@@ -361,16 +314,12 @@ def _check_arguments_monitor(kwargs) -> None:
             )
 
 
-def _check_arguments_notification(kwargs) -> None:
+def _check_arguments_notification(kwargs, ignore=()) -> None:
     required_args = ["type", "name"]
     _check_missing_arguments(required_args, kwargs)
 
-    type_ = kwargs["type"]
-    required_args = [
-        i for i, j in notification_provider_options[type_].items() if j["required"]
-    ]
-    _check_missing_arguments(required_args, kwargs)
-    _check_argument_conditions(notification_provider_conditions, kwargs)
+    validator = get_notification_validator(kwargs["type"])
+    validator.validate(kwargs, ignore)
 
 
 def _check_arguments_proxy(kwargs) -> None:
@@ -415,6 +364,22 @@ def _check_arguments_tag(kwargs) -> None:
     _check_missing_arguments(required_args, kwargs)
 
 
+# the kinds of objects that purge deletes, objects are deleted after the objects that use them
+purge_stages = [
+    ["maintenances", "status_pages", "api_keys"],
+    ["monitors"],
+    ["notifications", "proxies", "docker_hosts", "tags"],
+]
+purge_kinds = [kind for stage in purge_stages for kind in stage]
+
+# read event of the maintenance members -> (write event, key of the members in the read response,
+# event of the member objects, key of the member name)
+membership_events = {
+    "getMonitorMaintenance": ("addMonitorMaintenance", "monitors", Event.MONITOR_LIST, "name"),
+    "getMaintenanceStatusPage": ("addMaintenanceStatusPage", "statusPages", Event.STATUS_PAGE_LIST, "title"),
+}
+
+
 class UptimeKumaApi(object):
     """This class is used to communicate with Uptime Kuma.
 
@@ -470,6 +435,32 @@ class UptimeKumaApi(object):
                               There is no way to determine when the last message of a certain type has arrived.
                               Therefore, a timeout is required. If no further message has arrived within this time,
                               it is assumed that it was the last message. Defaults is ``0.2``.
+    :param str model_mode: ``"dict"`` to return monitors, heartbeats, notifications and maintenances as dicts,
+                           ``"typed"`` to return them as slotted models (e.g. :class:`~.models.Monitor`) which need
+                           less memory and provide faster attribute access or ``"raw"`` to return all results as
+                           sent by the server without any conversion (see :meth:`raw`). Default is ``"dict"``.
+    :param json_codec: The JSON implementation that is used to decode and encode Socket.IO packets, REST responses
+                       and certificate infos. ``"json"`` for the standard library, ``"orjson"`` for orjson,
+                       ``"auto"`` for orjson if it is installed or a :class:`~.json_codec.JsonCodec` instance.
+                       python-socketio applies the codec to all Socket.IO clients of the process.
+                       Default is ``"json"``.
+    :param instrumentation: ``True`` or an :class:`~.instrumentation.Instrumentation` instance to measure the latency
+                            of calls, REST requests and event waits. The measurements are available with
+                            :attr:`instrumentation`. Default is ``None``.
+    :param tracer: A :class:`~.tracing.Tracer` that receives a span for each public method and each underlying
+                   socket call and HTTP request, e.g. :class:`~.tracing.RecordingTracer` or
+                   :class:`~.tracing.OpenTelemetryTracer`. Default is ``None``.
+    :param scheduler: A :class:`~.scheduler.CallScheduler` that limits the rate and the concurrency of the socket
+                      calls. Bulk methods like :meth:`add_monitors` adapt their concurrency to it.
+                      Default is ``None``.
+    :param retry_policy: A :class:`~.retry.RetryPolicy` that repeats socket calls which timed out if it is safe
+                         to do so. Default is ``None``.
+    :param single_flight: ``True`` or a :class:`~.singleflight.SingleFlight` instance to share the result of a read
+                          between threads that send the same read at the same time. The counters are available
+                          with :attr:`single_flight`. Default is ``None``.
+    :param cache: ``True`` or a :class:`~.cache.TTLCache` instance to cache the responses of reads that are not
+                  kept up to date by server events, e.g. :meth:`get_tags` and :meth:`get_settings`. The write methods
+                  of the instance invalidate the entries they change. Default is ``None``.
     :raises UptimeKumaException: When connection to server failed.
     """
 
@@ -480,12 +471,51 @@ class UptimeKumaApi(object):
         headers: dict = None,
         ssl_verify: bool = True,
         wait_events: float = 0.2,
+        model_mode: str = "dict",
+        json_codec: Any = "json",
+        instrumentation: Any = None,
+        tracer: Tracer = None,
+        scheduler: CallScheduler = None,
+        retry_policy: RetryPolicy = None,
+        single_flight: Any = None,
+        cache: Any = None,
     ) -> None:
+        if model_mode not in ["dict", "typed", "raw"]:
+            raise ValueError(f"Unknown model_mode value: {model_mode}")
+
         self.url = url.rstrip("/")
         self.timeout = timeout
         self.headers = headers
         self.wait_events = wait_events
-        self.sio = socketio.Client(ssl_verify=ssl_verify)
+        self.model_mode = model_mode
+        self._local = threading.local()
+        if instrumentation is True:
+            instrumentation = Instrumentation()
+        elif instrumentation is False:
+            instrumentation = None
+        self.instrumentation: Optional[Instrumentation] = instrumentation
+        self.tracer = tracer
+        self.scheduler = scheduler
+        self.retry_policy = retry_policy
+        if single_flight is True:
+            single_flight = SingleFlight()
+        elif single_flight is False:
+            single_flight = None
+        self.single_flight: Optional[SingleFlight] = single_flight
+        if cache is True:
+            cache = TTLCache()
+        elif cache is False:
+            cache = None
+        self.cache: Optional[TTLCache] = cache
+        if tracer is not None:
+            trace_methods(self, tracer)
+        self._json = get_json_codec(json_codec)
+        self._decode_notification = notification_decoder(self._json.loads)
+        self.sio = socketio.Client(
+            ssl_verify=ssl_verify,
+            # keep the default of python-socketio if the standard library is used
+            json=self._json if self._json.name != "json" else None,
+        )
 
         self._event_data: dict = {
             Event.MONITOR_LIST: None,
@@ -504,6 +534,21 @@ class UptimeKumaApi(object):
             Event.API_KEY_LIST: None,
         }
 
+        self._event_listeners: dict = {}
+        self._event_listeners_lock = threading.Lock()
+
+        self.http_pool_size = 16
+        self._http_session: Optional[requests.Session] = None
+        self._http_session_lock = threading.Lock()
+
+        # (read event, maintenance id) -> lock of the member updates, see update_maintenance_monitors
+        self._member_locks: dict = {}
+        self._member_locks_lock = threading.Lock()
+
+        # slug -> status page config without incident and maintenances, see save_status_page
+        self._status_page_configs: dict = {}
+        self._status_page_configs_lock = threading.Lock()
+
         self.sio.on(Event.CONNECT, self._event_connect)
         self.sio.on(Event.DISCONNECT, self._event_disconnect)
         self.sio.on(Event.MONITOR_LIST, self._event_monitor_list)
@@ -542,13 +587,19 @@ class UptimeKumaApi(object):
         except:
             raise
         else:
+            if self._event_data[event] is not None:
+                return
+            start = time.perf_counter()
             timestamp = time.time()
             while self._event_data[event] is None:
                 if time.time() - timestamp > self.timeout:
+                    self._observe("wait", event, start, "timeout")
                     raise Timeout(f"Timed out while waiting for event {event}")
                 time.sleep(0.01)
+            self._observe("wait", event, start)
 
-    def _get_event_data(self, event) -> Any:
+    def _wait_event_data(self, event) -> Any:
+        # returns the stored event data itself, callers must not modify it
         monitor_events = [
             Event.AVG_PING,
             Event.UPTIME,
@@ -557,44 +608,319 @@ class UptimeKumaApi(object):
             Event.CERT_INFO,
             Event.HEARTBEAT,
         ]
+        start = time.perf_counter()
         timestamp = time.time()
         while self._event_data[event] is None:
             if time.time() - timestamp > self.timeout:
+                self._observe("wait", event, start, "timeout")
                 raise Timeout(f"Timed out while waiting for event {event}")
             # do not wait for events that are not sent
             if self._event_data[Event.MONITOR_LIST] == {} and event in monitor_events:
+                self._observe("wait", event, start)
                 return []
             time.sleep(0.01)
+        self._observe("wait", event, start)
+        start = time.perf_counter()
         time.sleep(self.wait_events)  # wait for multiple messages
-        return deepcopy(self._event_data[event].copy())
+        self._observe("settle", event, start)
+        return self._event_data[event]
+
+    def _get_event_data(self, event) -> Any:
+        return deepcopy(self._wait_event_data(event).copy())
+
+    @property
+    def _model_mode(self) -> str:
+        return getattr(self._local, "model_mode", None) or self.model_mode
+
+    @property
+    def _raw(self) -> bool:
+        return self._model_mode == "raw"
+
+    @contextmanager
+    def _model_mode_override(self, model_mode: str) -> None:
+        # changes the model mode for the current thread
+        previous = getattr(self._local, "model_mode", None)
+        self._local.model_mode = model_mode
+        try:
+            yield
+        finally:
+            self._local.model_mode = previous
+
+    def _get_decoded(self, getter, *args) -> Any:
+        # internal callers always work on decoded dicts
+        with self._model_mode_override("dict"):
+            return getter(*args)
+
+    def _typed(self, from_dict, data) -> Any:
+        # converts decoded objects to models if the typed model mode is enabled
+        if self._model_mode != "typed":
+            return data
+        if isinstance(data, list):
+            return [from_dict(i) for i in data]
+        return from_dict(data)
+
+    def _typed_heartbeats(self, heartbeats: dict) -> dict:
+        if self._model_mode != "typed":
+            return heartbeats
+        return {
+            monitor_id: [Heartbeat.from_dict(i) for i in monitor_heartbeats]
+            for monitor_id, monitor_heartbeats in heartbeats.items()
+        }
+
+    def _observe(self, kind: str, name: str, start: float, outcome: str = "ok") -> None:
+        # records the duration since start if instrumentation is enabled
+        if self.instrumentation is not None:
+            self.instrumentation.observe(kind, name, time.perf_counter() - start, outcome)
+
+    def _span(self, name: str, attributes: dict) -> Any:
+        # opens a tracing span or does nothing if tracing is disabled
+        if self.tracer is None:
+            return nullcontext()
+        return self.tracer.span(name, attributes)
+
+    def _payload_size(self, data: Any) -> Optional[int]:
+        # size of the json encoded data for tracing spans
+        try:
+            return len(self._json.dumps(data, separators=(",", ":")))
+        except (TypeError, ValueError):
+            return None
+
+    def _http_get(self, path: str, name: str = None) -> Any:
+        # requests the REST api and decodes the json response,
+        # name is the path without parameters for the instrumentation
+        if self.single_flight is not None:
+            return self.single_flight.do(("GET", path), lambda: self._http_request(path, name), name or path)
+        return self._http_request(path, name)
+
+    def _http_request(self, path: str, name: str = None) -> Any:
+        url = f"{self.url}{path}"
+        with self._span(name or path, {"uptime_kuma.kind": "http", "http.url": url}) as span:
+            start = time.perf_counter()
+            try:
+                r = self._get_http_session().get(url, timeout=self.timeout)
+            except requests.exceptions.Timeout as e:
+                self._observe("http", name or path, start, "timeout")
+                raise Timeout(e)
+            except Exception:
+                self._observe("http", name or path, start, "error")
+                raise
+            self._observe("http", name or path, start, "ok" if r.ok else "error")
+            if span is not None:
+                span.set_attribute("http.status_code", r.status_code)
+                span.set_attribute("uptime_kuma.response_size", len(r.content))
+            return self._json.loads(r.content)
+
+    def _get_http_session(self) -> requests.Session:
+        # keep-alive connection pool for the REST requests, sized for concurrent bulk requests
+        with self._http_session_lock:
+            if self._http_session is None:
+                session = requests.Session()
+                adapter = requests.adapters.HTTPAdapter(pool_maxsize=self.http_pool_size)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._http_session = session
+            return self._http_session
+
+    def _sio_call(self, event, data=None) -> Any:
+        # sends the event and waits for the response
+        if self.instrumentation is None and self.tracer is None:
+            return self.sio.call(event, data, timeout=self.timeout)
+        attributes = None
+        if self.tracer is not None:
+            attributes = {"uptime_kuma.kind": "call", "uptime_kuma.event": event}
+            size = self._payload_size(data)
+            if size is not None:
+                attributes["uptime_kuma.request_size"] = size
+        with self._span(event, attributes) as span:
+            start = time.perf_counter()
+            try:
+                r = self.sio.call(event, data, timeout=self.timeout)
+            except socketio.exceptions.TimeoutError:
+                self._observe("call", event, start, "timeout")
+                raise
+            except Exception:
+                self._observe("call", event, start, "error")
+                raise
+            ok = not (isinstance(r, dict) and r.get("ok") is False)
+            self._observe("call", event, start, "ok" if ok else "error")
+            if span is not None:
+                size = self._payload_size(r)
+                if size is not None:
+                    span.set_attribute("uptime_kuma.response_size", size)
+            return r
+
+    def _scheduled_call(self, event, data=None) -> Any:
+        if self.scheduler is None:
+            return self._sio_call(event, data)
+        with self.scheduler.slot():
+            return self._sio_call(event, data)
+
+    def _retried_call(self, event, data=None) -> Any:
+        if self.retry_policy is None:
+            return self._scheduled_call(event, data)
+        return self.retry_policy.call(self._scheduled_call, event, data, self._event_data, self.wait_events)
 
     def _call(self, event, data=None) -> Any:
-        r = self.sio.call(event, data, timeout=self.timeout)
+        try:
+            if self.cache is not None:
+                return self._cached_call(event, data)
+            return self._uncached_call(event, data)
+        finally:
+            # a failed write may have been executed anyway
+            self._forget_status_page_configs(event, data)
+
+    def _forget_status_page_configs(self, event, data) -> None:
+        # removes the status page configs that the write changed, with the invalidation rules of the cache
+        entries = invalidated_entries(event, data)
+        if entries is None:
+            return
+        with self._status_page_configs_lock:
+            if entries == "*":
+                self._status_page_configs.clear()
+                return
+            for read_event, slug, all_data in entries:
+                if read_event != STATUS_PAGE_CONFIG:
+                    continue
+                if all_data:
+                    self._status_page_configs.clear()
+                else:
+                    self._status_page_configs.pop(slug, None)
+
+    def _remember_status_page_config(self, slug: str, status_page: dict, decoded: bool = True) -> None:
+        # raw responses are kept by reference and decoded when the config is needed, see _status_page_config
+        if decoded:
+            status_page = {key: deepcopy(value) for key, value in status_page.items()
+                           if key not in ["incident", "maintenanceList"]}
+        with self._status_page_configs_lock:
+            self._status_page_configs[slug] = (status_page, decoded)
+
+    def _status_page_config(self, slug: str) -> Optional[dict]:
+        # returns a decoded copy of the remembered config of a status page or None
+        with self._status_page_configs_lock:
+            entry = self._status_page_configs.get(slug)
+        if entry is None:
+            return None
+        config, decoded = entry
+        if not decoded:
+            config = decode_status_page({key: deepcopy(value) for key, value in config.items()
+                                         if key not in ["incident", "maintenanceList"]})
+            with self._status_page_configs_lock:
+                # a write may have removed the entry meanwhile
+                if self._status_page_configs.get(slug) is entry:
+                    self._status_page_configs[slug] = (config, True)
+        return deepcopy(config)
+
+    def _update_members(self, read_event: str, id_: int, add: list, remove: list, refresh: bool) -> dict:
+        # sends the changed member list of a maintenance, the current members are only reused with a cache
+        write_event, key, list_event, name_key = membership_events[read_event]
+        with self._member_locks_lock:
+            lock = self._member_locks.setdefault((read_event, id_), threading.Lock())
+        # concurrent updates of the same maintenance would start from the same members
+        with lock:
+            if refresh and self.cache is not None:
+                self.cache.invalidate(read_event, id_)
+            members = {i["id"]: i for i in self._call(read_event, id_)[key]}
+            add = [i["id"] if isinstance(i, dict) else i for i in add or []]
+            remove = {i["id"] if isinstance(i, dict) else i for i in remove or []}
+            new = [i for i in members if i not in remove]
+            added = [i for i in dict.fromkeys(add) if i not in new and i not in remove]
+            new += added
+            removed = [i for i in members if i in remove]
+            if added or removed:
+                self._call(write_event, (id_, [{"id": i} for i in new]))
+                if self.cache is not None:
+                    objects = self._event_data[list_event] or {}
+                    for i in added:
+                        obj = objects.get(str(i))
+                        members[i] = {"id": i, name_key: obj[name_key]} if obj else {"id": i}
+                    self.cache.put(read_event, id_, {key: [members[i] for i in new]})
+        return {"added": added, "removed": removed}
+
+    def _uncached_call(self, event, data=None) -> Any:
+        if self.single_flight is not None and event in coalesced_events:
+            r = self.single_flight.do((event, repr(data)), lambda: self._retried_call(event, data), event)
+        else:
+            r = self._retried_call(event, data)
         if isinstance(r, dict) and "ok" in r:
             if not r["ok"]:
                 raise UptimeKumaException(r.get("msg"))
             r.pop("ok")
         return r
 
+    def _cached_call(self, event, data=None) -> Any:
+        if not self.cache.cacheable(event):
+            try:
+                return self._uncached_call(event, data)
+            finally:
+                # a failed write may have been executed anyway
+                self.cache.invalidate_for(event, data)
+        found, r = self.cache.get(event, data)
+        if found:
+            return r
+        generation = self.cache.generation(event)
+        r = self._uncached_call(event, data)
+        self.cache.put(event, data, r, generation)
+        return r
+
+    def _run_bulk(self, func: Callable, items: list, max_workers: int = None, return_exceptions: bool = False) -> list:
+        # calls func for each item in a thread pool, the scheduler limits the concurrency of the calls
+        if max_workers is None:
+            max_workers = self.scheduler.max_concurrency if self.scheduler is not None else 4
+        max_workers = max(1, min(max_workers, len(items)))
+
+        def run(item):
+            try:
+                return func(item)
+            except Exception as e:
+                if return_exceptions:
+                    return e
+                raise
+
+        if max_workers == 1:
+            return [run(item) for item in items]
+
+        # the spans of the worker threads are nested in the span of the calling method
+        tracer = self.tracer
+        parent = tracer.current() if tracer is not None else None
+
+        def run_traced(item):
+            with tracer.attach(parent):
+                return run(item)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(run_traced if tracer is not None else run, item) for item in items]
+            return [future.result() for future in futures]
+
     # event handlers
 
+    def _notify(self, event: Event, *args) -> None:
+        # passes the event to the listeners registered with add_event_listener
+        listeners = self._event_listeners.get(event)
+        if listeners:
+            for listener in listeners:
+                listener(*args)
+
     def _event_connect(self) -> None:
-        pass
+        self._notify(Event.CONNECT)
 
     def _event_disconnect(self) -> None:
-        pass
+        self._notify(Event.DISCONNECT)
 
     def _event_monitor_list(self, data) -> None:
         self._event_data[Event.MONITOR_LIST] = data
+        self._notify(Event.MONITOR_LIST, data)
 
     def _event_notification_list(self, data) -> None:
         self._event_data[Event.NOTIFICATION_LIST] = data
+        self._notify(Event.NOTIFICATION_LIST, data)
 
     def _event_proxy_list(self, data) -> None:
         self._event_data[Event.PROXY_LIST] = data
+        self._notify(Event.PROXY_LIST, data)
 
     def _event_status_page_list(self, data) -> None:
         self._event_data[Event.STATUS_PAGE_LIST] = data
+        self._notify(Event.STATUS_PAGE_LIST, data)
 
     def _event_heartbeat_list(self, monitor_id, data, overwrite) -> None:
         monitor_id = int(monitor_id)
@@ -605,6 +931,7 @@ class UptimeKumaApi(object):
             self._event_data[Event.HEARTBEAT_LIST][monitor_id] = data
         else:
             self._event_data[Event.HEARTBEAT_LIST][monitor_id].append(data)
+        self._notify(Event.HEARTBEAT_LIST, monitor_id, data, overwrite)
 
     def _event_important_heartbeat_list(self, monitor_id, data, overwrite) -> None:
         monitor_id = int(monitor_id)
@@ -618,6 +945,7 @@ class UptimeKumaApi(object):
             self._event_data[Event.IMPORTANT_HEARTBEAT_LIST][monitor_id] = data
         else:
             self._event_data[Event.IMPORTANT_HEARTBEAT_LIST][monitor_id].append(data)
+        self._notify(Event.IMPORTANT_HEARTBEAT_LIST, monitor_id, data, overwrite)
 
     def _event_avg_ping(self, monitor_id, data) -> None:
         monitor_id = int(monitor_id)
@@ -625,6 +953,7 @@ class UptimeKumaApi(object):
         if self._event_data[Event.AVG_PING] is None:
             self._event_data[Event.AVG_PING] = {}
         self._event_data[Event.AVG_PING][monitor_id] = data
+        self._notify(Event.AVG_PING, monitor_id, data)
 
     def _event_uptime(self, monitor_id, type_, data) -> None:
         monitor_id = int(monitor_id)
@@ -634,6 +963,7 @@ class UptimeKumaApi(object):
         if monitor_id not in self._event_data[Event.UPTIME]:
             self._event_data[Event.UPTIME][monitor_id] = {}
         self._event_data[Event.UPTIME][monitor_id][type_] = data
+        self._notify(Event.UPTIME, monitor_id, type_, data)
 
     def _event_heartbeat(self, data) -> None:
         if self._event_data[Event.HEARTBEAT_LIST] is None:
@@ -654,34 +984,42 @@ class UptimeKumaApi(object):
             self._event_data[Event.IMPORTANT_HEARTBEAT_LIST][monitor_id] = [
                 data
             ] + self._event_data[Event.IMPORTANT_HEARTBEAT_LIST][monitor_id]
+        self._notify(Event.HEARTBEAT, data)
 
     def _event_info(self, data) -> None:
         if "version" not in data:
             # wait for the info event that is sent after login and contains the version
             return
         self._event_data[Event.INFO] = data
+        self._notify(Event.INFO, data)
 
     def _event_cert_info(self, monitor_id, data) -> None:
         monitor_id = int(monitor_id)
 
         if self._event_data[Event.CERT_INFO] is None:
-            self._event_data[Event.CERT_INFO] = {}
-        self._event_data[Event.CERT_INFO][monitor_id] = json.loads(data)
+            self._event_data[Event.CERT_INFO] = CertInfoStore(self._json.loads)
+        # parsed on first access
+        self._event_data[Event.CERT_INFO].set(monitor_id, data)
+        self._notify(Event.CERT_INFO, monitor_id, data)
 
     def _event_docker_host_list(self, data) -> None:
         self._event_data[Event.DOCKER_HOST_LIST] = data
+        self._notify(Event.DOCKER_HOST_LIST, data)
 
     def _event_auto_login(self) -> None:
         self._event_data[Event.AUTO_LOGIN] = True
+        self._notify(Event.AUTO_LOGIN)
 
     def _event_init_server_timezone(self) -> None:
-        pass
+        self._notify(Event.INIT_SERVER_TIMEZONE)
 
     def _event_maintenance_list(self, data) -> None:
         self._event_data[Event.MAINTENANCE_LIST] = data
+        self._notify(Event.MAINTENANCE_LIST, data)
 
     def _event_api_key_list(self, data) -> None:
         self._event_data[Event.API_KEY_LIST] = data
+        self._notify(Event.API_KEY_LIST, data)
 
     # connection
 
@@ -709,6 +1047,69 @@ class UptimeKumaApi(object):
         Needs to be called to prevent blocking the program.
         """
         self.sio.disconnect()
+        with self._http_session_lock:
+            if self._http_session is not None:
+                self._http_session.close()
+                self._http_session = None
+
+    def raw(self):
+        """
+        Returns the results of the getters as sent by the server for all calls inside the ``with`` block.
+
+        Enums, booleans and the ``notificationIDList`` are not converted and the notification ``config``
+        is not parsed. Results of server events (e.g. :meth:`get_monitors` or :meth:`get_heartbeats`) are
+        not copied. They are returned as read-only views (:class:`~.readonly.ReadOnlyDict` and
+        :class:`~.readonly.ReadOnlyList`) of the data received from the server, so the views of
+        continuously updated events like heartbeats reflect new data.
+        Use :func:`~.readonly.json_default` to serialize the views.
+
+        The mode only applies to the current thread.
+        To enable it for all calls, create the instance with ``model_mode="raw"``.
+
+        Example::
+
+            >>> with api.raw():
+            ...     monitors = api.get_monitors()
+            >>> monitors[0]["type"]
+            'http'
+        """
+        return self._model_mode_override("raw")
+
+    def add_event_listener(self, event: Event, listener: Callable) -> None:
+        """
+        Registers a function that is called for each server event of the given type.
+
+        The function is called with the event arguments after the client has stored the event data
+        (e.g. ``(data)`` for :attr:`~.Event.HEARTBEAT` and ``(monitor_id, data)`` for :attr:`~.Event.AVG_PING`).
+        It is called in the thread that receives the events, so it must return quickly, must not raise
+        exceptions and must not modify the data or call methods of the instance.
+
+        :param Event event: The event type.
+        :param callable listener: The function.
+
+        Example::
+
+            >>> def on_heartbeat(heartbeat):
+            ...     print(heartbeat["monitorID"], heartbeat["status"])
+            >>> api.add_event_listener(Event.HEARTBEAT, on_heartbeat)
+        """
+        with self._event_listeners_lock:
+            listeners = self._event_listeners.get(event, [])
+            self._event_listeners[event] = listeners + [listener]
+
+    def remove_event_listener(self, event: Event, listener: Callable) -> None:
+        """
+        Removes a function that was registered with :meth:`add_event_listener`.
+
+        :param Event event: The event type.
+        :param callable listener: The function.
+        """
+        with self._event_listeners_lock:
+            listeners = [i for i in self._event_listeners.get(event, []) if i != listener]
+            if listeners:
+                self._event_listeners[event] = listeners
+            else:
+                self._event_listeners.pop(event, None)
 
     # builder
 
@@ -1238,13 +1639,11 @@ class UptimeKumaApi(object):
 
         # TODO: replace with getMonitorList?
 
+        if self._raw:
+            return freeze(list(self._wait_event_data(Event.MONITOR_LIST).values()))
         r = list(self._get_event_data(Event.MONITOR_LIST).values())
-        for monitor in r:
-            _convert_monitor_return(monitor)
-        int_to_bool(r, ["active"])
-        parse_monitor_type(r)
-        parse_auth_method(r)
-        return r
+        r = decode_list(decode_monitor, r)
+        return self._typed(monitor_from_dict, r)
 
     def get_monitor(self, id_: int) -> dict:
         """
@@ -1345,11 +1744,10 @@ class UptimeKumaApi(object):
             }
         """
         r = self._call("getMonitor", id_)["monitor"]
-        _convert_monitor_return(r)
-        int_to_bool(r, ["active"])
-        parse_monitor_type(r)
-        parse_auth_method(r)
-        return r
+        if self._raw:
+            return r
+        r = decode_monitor(r)
+        return self._typed(monitor_from_dict, r)
 
     def pause_monitor(self, id_: int) -> dict:
         """
@@ -1448,9 +1846,10 @@ class UptimeKumaApi(object):
             ]
         """
         r = self._call("getMonitorBeats", (id_, hours))["data"]
-        int_to_bool(r, ["important"])
-        parse_monitor_status(r)
-        return r
+        if self._raw:
+            return r
+        r = decode_list(decode_heartbeat, r)
+        return self._typed(Heartbeat.from_dict, r)
 
     def get_game_list(self) -> list[dict]:
         """
@@ -1554,13 +1953,84 @@ class UptimeKumaApi(object):
                 'msg': 'Saved.'
             }
         """
-        data = self.get_monitor(id_)
+        data = self._get_decoded(self.get_monitor, id_)
         data.update(kwargs)
         _convert_monitor_input(data)
         _check_arguments_monitor(data)
         with self.wait_for_event(Event.MONITOR_LIST):
             return self._call("editMonitor", data)
 
+    def add_monitors(self, monitors: list[dict], max_workers: int = None, return_exceptions: bool = False) -> list:
+        """
+        Adds multiple monitors concurrently.
+
+        The concurrency is limited by ``max_workers`` and by the ``scheduler`` of the instance
+        (see :class:`~.scheduler.CallScheduler`), which adapts it to the latency of the server.
+
+        :param list monitors: The arguments of :meth:`add_monitor` for each monitor.
+        :param int, optional max_workers: Maximum number of concurrent calls, defaults to the maximum concurrency
+                                          of the scheduler or ``4`` without scheduler.
+        :param bool, optional return_exceptions: ``True`` to return the exception of a failed monitor in its place
+                                                 instead of raising it, defaults to False.
+        :return: The server responses in the order of the monitors.
+        :rtype: list
+        :raises UptimeKumaException: If the server returns an error and ``return_exceptions`` is False.
+
+        Example::
+
+            >>> api.add_monitors([
+            ...     {"type": MonitorType.HTTP, "name": "Google", "url": "https://google.com"},
+            ...     {"type": MonitorType.HTTP, "name": "GitHub", "url": "https://github.com"}
+            ... ])
+            [
+                {
+                    'msg': 'Added Successfully.',
+                    'monitorID': 1
+                },
+                {
+                    'msg': 'Added Successfully.',
+                    'monitorID': 2
+                }
+            ]
+        """
+        return self._run_bulk(lambda kwargs: self.add_monitor(**kwargs), monitors, max_workers, return_exceptions)
+
+    def edit_monitors(self, monitors: dict, max_workers: int = None, return_exceptions: bool = False) -> list:
+        """
+        Edits multiple monitors concurrently.
+
+        The concurrency is limited like in :meth:`add_monitors`.
+
+        :param dict monitors: The arguments of :meth:`edit_monitor` by monitor id.
+        :param int, optional max_workers: Maximum number of concurrent calls, defaults to the maximum concurrency
+                                          of the scheduler or ``4`` without scheduler.
+        :param bool, optional return_exceptions: ``True`` to return the exception of a failed monitor in its place
+                                                 instead of raising it, defaults to False.
+        :return: The server responses in the order of the monitor ids.
+        :rtype: list
+        :raises UptimeKumaException: If the server returns an error and ``return_exceptions`` is False.
+
+        Example::
+
+            >>> api.edit_monitors({
+            ...     1: {"interval": 30},
+            ...     2: {"interval": 60}
+            ... })
+            [
+                {
+                    'monitorID': 1,
+                    'msg': 'Saved.'
+                },
+                {
+                    'monitorID': 2,
+                    'msg': 'Saved.'
+                }
+            ]
+        """
+        return self._run_bulk(
+            lambda item: self.edit_monitor(item[0], **item[1]), list(monitors.items()), max_workers, return_exceptions
+        )
+
     # monitor tags
 
     def add_monitor_tag(self, tag_id: int, monitor_id: int, value: str = "") -> dict:
@@ -1587,9 +2057,9 @@ class UptimeKumaApi(object):
         """
         r = self._call("addMonitorTag", (tag_id, monitor_id, value))
         # the monitor list event does not send the updated tags
-        self._event_data[Event.MONITOR_LIST][str(monitor_id)] = self.get_monitor(
-            monitor_id
-        )
+        self._event_data[Event.MONITOR_LIST][str(monitor_id)] = self._call(
+            "getMonitor", monitor_id
+        )["monitor"]
         return r
 
     # editMonitorTag is unused in uptime-kuma
@@ -1632,9 +2102,9 @@ class UptimeKumaApi(object):
                 raise UptimeKumaException("monitor tag does not exist")
             r = self._call("deleteMonitorTag", (tag_id, monitor_id, value))
             # the monitor list event does not send the updated tags
-            self._event_data[Event.MONITOR_LIST][str(monitor_id)] = self.get_monitor(
-                monitor_id
-            )
+            self._event_data[Event.MONITOR_LIST][str(monitor_id)] = self._call(
+                "getMonitor", monitor_id
+            )["monitor"]
             return r
 
     # notification
@@ -1662,16 +2132,11 @@ class UptimeKumaApi(object):
                 }
             ]
         """
+        if self._raw:
+            return freeze(self._wait_event_data(Event.NOTIFICATION_LIST))
         notifications = self._get_event_data(Event.NOTIFICATION_LIST)
-        r = []
-        for notification_raw in notifications:
-            notification = notification_raw.copy()
-            config = json.loads(notification["config"])
-            del notification["config"]
-            notification.update(config)
-            r.append(notification)
-        parse_notification_type(r)
-        return r
+        r = decode_list(self._decode_notification, notifications)
+        return self._typed(Notification.from_dict, r)
 
     def get_notification(self, id_: int) -> dict:
         """
@@ -1710,6 +2175,8 @@ class UptimeKumaApi(object):
         :return: The server response.
         :rtype: dict
         :raises UptimeKumaException: If the server returns an error.
+        :raises TypeError: If a required argument is missing or an argument is not an option of the provider.
+        :raises ValueError: If the notification type is unknown or an argument is out of range.
 
         Example::
 
@@ -1738,6 +2205,8 @@ class UptimeKumaApi(object):
         :return: The server response.
         :rtype: dict
         :raises UptimeKumaException: If the server returns an error.
+        :raises TypeError: If a required argument is missing or an argument is not an option of the provider.
+        :raises ValueError: If the notification type is unknown or an argument is out of range.
 
         Example::
 
@@ -1768,6 +2237,8 @@ class UptimeKumaApi(object):
         :return: The server response.
         :rtype: dict
         :raises UptimeKumaException: If the server returns an error.
+        :raises TypeError: If a required argument is missing or an argument is not an option of the provider.
+        :raises ValueError: If the notification type is unknown or an argument is out of range.
 
         Example::
 
@@ -1783,19 +2254,16 @@ class UptimeKumaApi(object):
                 'msg': 'Saved'
             }
         """
-        notification = self.get_notification(id_)
+        notification = self._get_decoded(self.get_notification, id_)
 
         # remove old notification provider options from notification object
         if "type" in kwargs and kwargs["type"] != notification["type"]:
-            for provider in notification_provider_options:
-                provider_options = notification_provider_options[provider]
-                if provider != kwargs["type"]:
-                    for option in provider_options:
-                        if option in notification:
-                            del notification[option]
+            get_notification_validator(kwargs["type"]).strip(notification)
 
+        # settings of the server that are not known to this library are kept
+        ignore = set(notification) - set(kwargs)
         notification.update(kwargs)
-        _check_arguments_notification(notification)
+        _check_arguments_notification(notification, ignore)
         with self.wait_for_event(Event.NOTIFICATION_LIST):
             return self._call("addNotification", (notification, id_))
 
@@ -1863,10 +2331,10 @@ class UptimeKumaApi(object):
                 }
             ]
         """
+        if self._raw:
+            return freeze(self._wait_event_data(Event.PROXY_LIST))
         r = self._get_event_data(Event.PROXY_LIST)
-        int_to_bool(r, ["auth", "active", "default", "applyExisting"])
-        parse_proxy_protocol(r)
-        return r
+        return decode_list(decode_proxy, r)
 
     def get_proxy(self, id_: int) -> dict:
         """
@@ -1955,7 +2423,7 @@ class UptimeKumaApi(object):
                 'msg': 'Saved'
             }
         """
-        proxy = self.get_proxy(id_)
+        proxy = self._get_decoded(self.get_proxy, id_)
         proxy.update(kwargs)
         _check_arguments_proxy(proxy)
         with self.wait_for_event(Event.PROXY_LIST):
@@ -2012,6 +2480,8 @@ class UptimeKumaApi(object):
                 }
             ]
         """
+        if self._raw:
+            return freeze(list(self._wait_event_data(Event.STATUS_PAGE_LIST).values()))
         return list(self._get_event_data(Event.STATUS_PAGE_LIST).values())
 
     def get_status_page(self, slug: str) -> dict:
@@ -2069,12 +2539,7 @@ class UptimeKumaApi(object):
             }
         """
         r1 = self._call("getStatusPage", slug)
-        try:
-            r2 = requests.get(
-                f"{self.url}/api/status-page/{slug}", timeout=self.timeout
-            ).json()
-        except requests.exceptions.Timeout as e:
-            raise Timeout(e)
+        r2 = self._http_get(f"/api/status-page/{slug}", "/api/status-page")
 
         config = r1["config"]
         config.update(r2["config"])
@@ -2085,12 +2550,113 @@ class UptimeKumaApi(object):
             "publicGroupList": r2["publicGroupList"],
             "maintenanceList": r2["maintenanceList"],
         }
-        parse_incident_style(data["incident"])
-        # convert sendUrl from int to bool
-        for i in data["publicGroupList"]:
-            for j in i["monitorList"]:
-                int_to_bool(j, ["sendUrl"])
-        return data
+        if self._raw:
+            self._remember_status_page_config(slug, data, decoded=False)
+            return data
+        r = decode_status_page(data)
+        self._remember_status_page_config(slug, r)
+        return r
+
+    def get_status_page_heartbeats(self, slug: str) -> dict:
+        """
+        Get the heartbeats and the 24 hour uptime of the monitors of a status page.
+
+        The data is requested from the public endpoint that the status pages poll, it contains the last 100 heartbeats
+        of each monitor. If the instance was created with ``cache``, responses are cached per slug
+        (``/api/status-page/heartbeat`` in ``default_ttls`` of :class:`~.cache.TTLCache`, 30 seconds by default).
+
+        :param str slug: Slug
+        :return: The heartbeats for each monitor id (like :meth:`get_heartbeats`) and the uptime by hours for each
+                 monitor id.
+        :rtype: dict
+        :raises UptimeKumaException: If the status page does not exist.
+
+        Example::
+
+            >>> api.get_status_page_heartbeats("slug1")
+            {
+                'heartbeatList': {
+                    1: [
+                        {
+                            'msg': '',
+                            'ping': 10.5,
+                            'status': <MonitorStatus.UP: 1>,
+                            'time': '2023-05-01 17:22:20.289'
+                        }
+                    ]
+                },
+                'uptimeList': {
+                    1: {
+                        24: 1
+                    }
+                }
+            }
+        """
+        path = "/api/status-page/heartbeat"
+        found = False
+        if self.cache is not None:
+            found, r = self.cache.get(path, slug)
+        if not found:
+            generation = self.cache.generation(path) if self.cache is not None else None
+            r = self._http_get(f"{path}/{slug}", path)
+            if r.get("ok") is False:
+                raise UptimeKumaException(r.get("msg"))
+            if self.cache is not None:
+                self.cache.put(path, slug, r, generation)
+        if self._raw:
+            return r
+        r = decode_status_page_heartbeats(r)
+        r["heartbeatList"] = self._typed_heartbeats(r["heartbeatList"])
+        return r
+
+    def get_status_pages_heartbeats(
+        self, slugs: list[str], max_workers: int = None, return_exceptions: bool = False
+    ) -> dict:
+        """
+        Get the heartbeats of multiple status pages concurrently (see :meth:`get_status_page_heartbeats`).
+
+        The requests share a pool of keep-alive connections.
+
+        :param list slugs: The slugs.
+        :param int, optional max_workers: Maximum number of concurrent requests, defaults to the size of the
+                                          connection pool (``16``).
+        :param bool, optional return_exceptions: ``True`` to return the exception of a failed status page in its place
+                                                 instead of raising it, defaults to False.
+        :return: The heartbeats by slug.
+        :rtype: dict
+        :raises UptimeKumaException: If a status page does not exist and ``return_exceptions`` is False.
+
+        Example::
+
+            >>> api.get_status_pages_heartbeats(["slug1", "slug2"])
+            {
+                'slug1': {
+                    'heartbeatList': {
+                        1: [
+                            ...
+                        ]
+                    },
+                    'uptimeList': {
+                        1: {
+                            24: 1
+                        }
+                    }
+                },
+                'slug2': {
+                    ...
+                }
+            }
+        """
+        slugs = list(slugs)
+        model_mode = self._model_mode
+
+        def get(slug):
+            # the model mode override of the calling thread applies to the worker threads
+            with self._model_mode_override(model_mode):
+                return self.get_status_page_heartbeats(slug)
+
+        r = self._run_bulk(get, slugs, max_workers or self.http_pool_size, return_exceptions)
+        return dict(zip(slugs, r))
 
     def add_status_page(self, slug: str, title: str) -> dict:
         """
@@ -2139,11 +2705,22 @@ class UptimeKumaApi(object):
 
             return r
 
-    def save_status_page(self, slug: str, **kwargs) -> dict:
+    def save_status_page(self, slug: str, refresh: bool = False, **kwargs) -> dict:
         """
         Save a status page.
 
+        Only the changed settings have to be passed, the other settings are taken from the config that this instance
+        last read or saved (e.g. with :meth:`get_status_page`). The config is requested only if it is unknown.
+        Changes of other clients are not known, use ``refresh`` to read the config again.
+
+        The server response contains only the saved groups. The remembered config and the entry of
+        :meth:`get_status_pages` are updated from the sent settings and not from what the server stored, use
+        :meth:`get_status_page` to read the stored config. An uploaded icon is requested again because the server
+        stores it under a new path.
+
         :param str slug: Slug
+        :param bool, optional refresh: Request the current config of the status page before saving, defaults to
+                                       ``False``.
         :param int id: Id of the status page to save
         :param str, optional title: Title, defaults to None
         :param str, optional description: Description, defaults to None
@@ -2196,22 +2773,92 @@ class UptimeKumaApi(object):
                 ]
             }
         """
-        status_page = self.get_status_page(slug)
-        status_page.pop("incident")
-        status_page.pop("maintenanceList")
+        status_page = self._status_page_config(slug)
+        if status_page is None or refresh:
+            status_page = self._get_decoded(self.get_status_page, slug)
+            status_page.pop("incident")
+            status_page.pop("maintenanceList")
         status_page.update(kwargs)
         data = self._build_status_page_data(**status_page)
         r = self._call("saveStatusPage", data)
+        config = data[1]
 
         # uptime kuma does not send the status page list event when a status page is saved
-        status_page = self._call("getStatusPage", slug)["config"]
-        status_page_id = status_page["id"]
+        if str(config["icon"]).startswith("data:"):
+            # the server stores uploaded icons under a new path
+            status_page = self._call("getStatusPage", slug)["config"]
+        else:
+            self._remember_status_page_config(slug, {**status_page, "publicGroupList": r["publicGroupList"]})
+            status_pages = self._event_data[Event.STATUS_PAGE_LIST] or {}
+            status_page = {**status_pages.get(str(config["id"]), {}), **config}
         if self._event_data[Event.STATUS_PAGE_LIST] is None:
             self._event_data[Event.STATUS_PAGE_LIST] = {}
-        self._event_data[Event.STATUS_PAGE_LIST][str(status_page_id)] = status_page
+        self._event_data[Event.STATUS_PAGE_LIST][str(status_page["id"])] = status_page
 
         return r
 
+    def sync_status_page_groups(
+        self,
+        rules: dict,
+        keep_other_groups: bool = False,
+        refresh: bool = False,
+        max_workers: int = None,
+        return_exceptions: bool = False,
+    ) -> dict:
+        """
+        Sync the groups of status pages with group rules (see :class:`~.GroupRule`).
+
+        The groups are built from the monitor list that the server sent and compared with the group list of each
+        status page. Only the status pages whose groups or monitors changed are saved, concurrently.
+        Existing groups and monitors keep their position, new monitors are appended sorted by name.
+
+        :param dict rules: The group rules in the order of the groups by slug.
+        :param bool, optional keep_other_groups: Keep the groups that have no rule, defaults to ``False``.
+        :param bool, optional refresh: Request the current config of the status pages instead of using the config
+                                       that this instance last read or saved, defaults to ``False``.
+        :param int, optional max_workers: Maximum number of concurrent calls, defaults to the concurrency of the
+                                          scheduler or ``4``.
+        :param bool, optional return_exceptions: ``True`` to return the exception of a failed status page in its place
+                                                 instead of raising it, defaults to False.
+        :return: Whether the status page was saved by slug.
+        :rtype: dict
+        :raises UptimeKumaException: If the server returns an error and ``return_exceptions`` is False.
+
+        Example::
+
+            >>> api.sync_status_page_groups({
+            ...     "slug1": [
+            ...         GroupRule("Production", tag="env", value="production"),
+            ...         GroupRule("Websites", filter=lambda monitor: monitor["type"] == "http")
+            ...     ],
+            ...     "slug2": [
+            ...         GroupRule("Staging", tag="env", value="staging")
+            ...     ]
+            ... })
+            {
+                'slug1': True,
+                'slug2': False
+            }
+        """
+        monitors = list(self._wait_event_data(Event.MONITOR_LIST).values())
+        monitors = [freeze(monitor) for monitor in monitors]
+        tag_index = index_by_tag(monitors)
+
+        def sync(slug):
+            config = self._status_page_config(slug)
+            current = config.get("publicGroupList") if config is not None else None
+            if current is None or refresh:
+                current = self._get_decoded(self.get_status_page, slug)["publicGroupList"]
+            groups = build_groups(rules[slug], monitors, current, keep_other_groups, tag_index)
+            if not groups_changed(current, groups):
+                return False
+            self.save_status_page(slug, publicGroupList=groups)
+            return True
+
+        slugs = list(rules)
+        r = self._run_bulk(sync, slugs, max_workers, return_exceptions)
+        return dict(zip(slugs, r))
+
     def post_incident(
         self,
         slug: str,
@@ -2249,9 +2896,59 @@ class UptimeKumaApi(object):
         """
         incident = {"title": title, "content": content, "style": style}
         r = self._call("postIncident", (slug, incident))["incident"]
-        self.save_status_page(slug)
-        parse_incident_style(r)
-        return r
+        return decode_incident(r)
+
+    def post_incidents(
+        self,
+        slugs: list[str],
+        title: str,
+        content: str,
+        style: IncidentStyle = IncidentStyle.PRIMARY,
+        max_workers: int = None,
+        return_exceptions: bool = False,
+    ) -> dict:
+        """
+        Post the same incident to multiple status pages concurrently (see :meth:`post_incident`).
+
+        :param list slugs: The slugs.
+        :param str title: Title
+        :param str content: Content
+        :param IncidentStyle, optional style: Style, defaults to :attr:`~.IncidentStyle.PRIMARY`
+        :param int, optional max_workers: Maximum number of concurrent calls, defaults to the concurrency of the
+                                          scheduler or ``4``.
+        :param bool, optional return_exceptions: ``True`` to return the exception of a failed status page in its place
+                                                 instead of raising it, defaults to False.
+        :return: The incidents by slug.
+        :rtype: dict
+        :raises UptimeKumaException: If the server returns an error and ``return_exceptions`` is False.
+
+        Example::
+
+            >>> api.post_incidents(
+            ...     ["slug1", "slug2"],
+            ...     title="title 1",
+            ...     content="content 1",
+            ...     style=IncidentStyle.DANGER
+            ... )
+            {
+                'slug1': {
+                    'content': 'content 1',
+                    'createdDate': '2022-12-15 16:51:43',
+                    'id': 1,
+                    'pin': True,
+                    'style': <IncidentStyle.DANGER: 'danger'>,
+                    'title': 'title 1'
+                },
+                'slug2': {
+                    ...
+                }
+            }
+        """
+        slugs = list(slugs)
+        r = self._run_bulk(
+            lambda slug: self.post_incident(slug, title, content, style), slugs, max_workers, return_exceptions
+        )
+        return dict(zip(slugs, r))
 
     def unpin_incident(self, slug: str) -> dict:
         """
@@ -2267,9 +2964,7 @@ class UptimeKumaApi(object):
             >>> api.unpin_incident(slug="slug1")
             {}
         """
-        r = self._call("unpinIncident", slug)
-        self.save_status_page(slug)
-        return r
+        return self._call("unpinIncident", slug)
 
     # heartbeat
 
@@ -2310,11 +3005,11 @@ class UptimeKumaApi(object):
                 ]
             }
         """
+        if self._raw:
+            return freeze(self._wait_event_data(Event.HEARTBEAT_LIST))
         r = self._get_event_data(Event.HEARTBEAT_LIST)
-        for i in r:
-            int_to_bool(r[i], ["important"])
-            parse_monitor_status(r[i])
-        return r
+        r = decode_heartbeats(r)
+        return self._typed_heartbeats(r)
 
     def get_important_heartbeats(self) -> dict:
         """
@@ -2340,11 +3035,11 @@ class UptimeKumaApi(object):
                 ]
             }
         """
+        if self._raw:
+            return freeze(self._wait_event_data(Event.IMPORTANT_HEARTBEAT_LIST))
         r = self._get_event_data(Event.IMPORTANT_HEARTBEAT_LIST)
-        for i in r:
-            int_to_bool(r[i], ["important"])
-            parse_monitor_status(r[i])
-        return r
+        r = decode_heartbeats(r)
+        return self._typed_heartbeats(r)
 
     # avg ping
 
@@ -2362,8 +3057,55 @@ class UptimeKumaApi(object):
                 1: 10
             }
         """
+        if self._raw:
+            return freeze(self._wait_event_data(Event.AVG_PING))
         return self._get_event_data(Event.AVG_PING)
 
+    # metrics
+
+    def get_monitor_metrics(self, api_key: str) -> dict:
+        """
+        Get the status, response time and certificate expiry of all monitors from the Prometheus endpoint ``/metrics``.
+
+        This is a fast alternative to :meth:`get_heartbeats` and :meth:`cert_info`: it needs one HTTP request,
+        which is parsed while it is received, and does not wait for heartbeat events. The endpoint only contains the
+        name, type, url, hostname and port of each monitor, they are assigned to the monitor ids with the monitor list.
+        Monitors whose labels are not unique are left out.
+
+        :param str api_key: An API key created with :meth:`add_api_key`.
+        :return: The metrics for each monitor id. Values that the server does not provide are ``None``.
+        :rtype: dict
+        :raises UptimeKumaException: If the API key is invalid.
+
+        Example::
+
+            >>> api.get_monitor_metrics("uk1_1H5bTlVMnD6iNqlBWOGfAq7jQmzIi7zfRb5ZBRrz")
+            {
+                1: {
+                    'cert_days_remaining': 62,
+                    'cert_is_valid': True,
+                    'response_time': 97.0,
+                    'status': <MonitorStatus.UP: 1>
+                }
+            }
+        """
+        url = f"{self.url}/metrics"
+        with self._span("/metrics", {"uptime_kuma.kind": "http", "http.url": url}):
+            start = time.perf_counter()
+            try:
+                metrics = fetch_monitor_metrics(self._get_http_session(), self.url, api_key, self.timeout)
+            except Timeout:
+                self._observe("http", "/metrics", start, "timeout")
+                raise
+            except Exception:
+                self._observe("http", "/metrics", start, "error")
+                raise
+            self._observe("http", "/metrics", start)
+        monitors = self._event_data[Event.MONITOR_LIST]
+        if monitors is None:
+            monitors = self._wait_event_data(Event.MONITOR_LIST)
+        return map_monitor_ids(metrics, list(monitors.values()))
+
     # cert info
 
     def cert_info(self) -> dict:
@@ -2524,7 +3266,55 @@ class UptimeKumaApi(object):
                 }
             }
         """
-        return self._get_event_data(Event.CERT_INFO)
+        cert_infos = self._wait_event_data(Event.CERT_INFO)
+        if isinstance(cert_infos, list):
+            # no monitors
+            return cert_infos
+        r = cert_infos.to_dict()
+        if self._raw:
+            return freeze(r)
+        return deepcopy(r)
+
+    def get_expiring_certificates(self, days: float) -> list[dict]:
+        """
+        Get the monitors whose certificates expire within the given number of days.
+
+        The certificate expiry dates are kept in a sorted index that is updated with the certificates that changed
+        since the last call. Each received certificate info is parsed once, shared with :meth:`cert_info`.
+        Already expired certificates are included.
+
+        :param float days: Number of days from now.
+        :return: The monitor id, expiry date and the remaining days of each certificate, sorted by expiry date.
+        :rtype: list
+
+        Example::
+
+            >>> api.get_expiring_certificates(30)
+            [
+                {
+                    'monitorID': 2,
+                    'validTo': datetime.datetime(2023, 5, 12, 23, 59, 59, tzinfo=datetime.timezone.utc),
+                    'daysRemaining': 10
+                }
+            ]
+        """
+        cert_infos = self._wait_event_data(Event.CERT_INFO)
+        if isinstance(cert_infos, list):
+            # no monitors
+            return []
+        now = time.time()
+        r = []
+        for monitor_id, expiry in cert_infos.expiring_within(days, now):
+            r.append(
+                {
+                    "monitorID": monitor_id,
+                    "validTo": datetime.datetime.fromtimestamp(
+                        expiry, datetime.timezone.utc
+                    ),
+                    "daysRemaining": int((expiry - now) // 86400),
+                }
+            )
+        return r
 
     # uptime
 
@@ -2545,6 +3335,8 @@ class UptimeKumaApi(object):
                 }
             }
         """
+        if self._raw:
+            return freeze(self._wait_event_data(Event.UPTIME))
         return self._get_event_data(Event.UPTIME)
 
     # info
@@ -2568,6 +3360,8 @@ class UptimeKumaApi(object):
                 'version': '1.23.1'
             }
         """
+        if self._raw:
+            return freeze(self._wait_event_data(Event.INFO))
         r = self._get_event_data(Event.INFO)
         return r
 
@@ -2662,12 +3456,30 @@ class UptimeKumaApi(object):
             }
         """
 
+        if self.cache is not None:
+            tags = self._cached_tags_by_id()
+            if tags is not None:
+                if id_ not in tags:
+                    raise UptimeKumaException("tag does not exist")
+                return deepcopy(tags[id_])
+
         tags = self.get_tags()
         for tag in tags:
             if tag["id"] == id_:
                 return tag
         raise UptimeKumaException("tag does not exist")
 
+    def _cached_tags_by_id(self) -> Optional[dict]:
+        # index of the cached tag list, None if the tags are not cached
+        def build(r):
+            return {tag["id"]: tag for tag in r["tags"]}
+
+        tags = self.cache.index("getTags", None, "id", build)
+        if tags is None:
+            self.get_tags()
+            tags = self.cache.index("getTags", None, "id", build)
+        return tags
+
     @append_docstring(tag_docstring("add"))
     def add_tag(self, **kwargs) -> dict:
         """
@@ -2739,8 +3551,7 @@ class UptimeKumaApi(object):
                 'msg': 'Deleted Successfully.'
             }
         """
-        if id_ not in [i["id"] for i in self.get_tags()]:
-            raise UptimeKumaException("tag does not exist")
+        self.get_tag(id_)
         return self._call("deleteTag", id_)
 
     # settings
@@ -2942,6 +3753,92 @@ class UptimeKumaApi(object):
             raise ValueError(f"Unknown import_handle value: {import_handle}")
         return self._call("uploadBackup", (json_data, import_handle))
 
+    def export_backup(self, file: Any) -> dict:
+        """
+        Export a backup of the notifications, monitors and proxies in the format of :meth:`upload_backup`.
+
+        The backup is built from the lists the server sent after the login and written to the file item by item.
+
+        :param file: The path or a file object opened in text mode.
+        :return: The number of exported notifications, monitors and proxies.
+        :rtype: dict
+
+        Example::
+
+            >>> api.export_backup("backup.json")
+            {
+                'notifications': 1,
+                'monitors': 42,
+                'proxies': 0
+            }
+        """
+        notifications = self._wait_event_data(Event.NOTIFICATION_LIST)
+        monitors = self._wait_event_data(Event.MONITOR_LIST)
+        proxies = self._wait_event_data(Event.PROXY_LIST)
+        return write_backup(
+            file,
+            self.version,
+            list(notifications),
+            list(monitors.values()),
+            list(proxies),
+            dumps=self._json.dumps,
+        )
+
+    def restore_backup(
+        self,
+        file: Any,
+        import_handle: str = "skip",
+        tags: list[str] = None,
+        notification_ids: dict = None,
+        proxy_ids: dict = None,
+        monitor_ids: dict = None,
+        validate: bool = True,
+    ) -> dict:
+        """
+        Import a backup file.
+
+        The backup is validated, filtered and rewritten item by item with :func:`~.backup.rewrite_backup` before it
+        is uploaded with :meth:`upload_backup`. Nothing is uploaded if the backup is invalid.
+
+        :param file: The path or a file object of the backup.
+        :param str, optional import_handle: See :meth:`upload_backup`, defaults to "skip"
+        :param list, optional tags: Only import the monitors with one of these tag names, their parent groups and the
+                                    notifications and proxies they use.
+        :param dict, optional notification_ids: New notification ids by the ids in the backup.
+        :param dict, optional proxy_ids: New proxy ids by the ids in the backup.
+        :param dict, optional monitor_ids: New monitor ids by the ids in the backup.
+        :param bool, optional validate: Check the ids, names and references of the items, defaults to ``True``.
+        :return: The server response.
+        :rtype: dict
+        :raises ValueError: If the backup is invalid.
+        :raises UptimeKumaException: If the server returns an error.
+
+        Example::
+
+            >>> api.restore_backup(
+            ...     "backup.json",
+            ...     tags=["production"],
+            ...     notification_ids={1: 4}
+            ... )
+            {
+                'msg': 'Backup successfully restored.'
+            }
+        """
+        if import_handle not in ["overwrite", "skip", "keep"]:
+            raise ValueError(f"Unknown import_handle value: {import_handle}")
+        buffer = io.StringIO()
+        rewrite_backup(
+            file,
+            buffer,
+            tags=tags,
+            notification_ids=notification_ids,
+            proxy_ids=proxy_ids,
+            monitor_ids=monitor_ids,
+            validate=validate,
+            dumps=self._json.dumps,
+        )
+        return self.upload_backup(buffer.getvalue(), import_handle)
+
     # 2FA
 
     def twofa_status(self) -> dict:
@@ -3213,9 +4110,10 @@ class UptimeKumaApi(object):
                 }
             ]
         """
+        if self._raw:
+            return freeze(self._wait_event_data(Event.DOCKER_HOST_LIST))
         r = self._get_event_data(Event.DOCKER_HOST_LIST)
-        parse_docker_type(r)
-        return r
+        return decode_list(decode_docker_host, r)
 
     def get_docker_host(self, id_: int) -> dict:
         """
@@ -3312,7 +4210,7 @@ class UptimeKumaApi(object):
                 'msg': 'Saved'
             }
         """
-        data = self.get_docker_host(id_)
+        data = self._get_decoded(self.get_docker_host, id_)
         data.update(kwargs)
         _convert_docker_host_input(data)
         with self.wait_for_event(Event.DOCKER_HOST_LIST):
@@ -3390,9 +4288,11 @@ class UptimeKumaApi(object):
                 }
             ]
         """
+        if self._raw:
+            return freeze(list(self._wait_event_data(Event.MAINTENANCE_LIST).values()))
         r = list(self._get_event_data(Event.MAINTENANCE_LIST).values())
-        parse_maintenance_strategy(r)
-        return r
+        r = decode_list(decode_maintenance, r)
+        return self._typed(Maintenance.from_dict, r)
 
     def get_maintenance(self, id_: int) -> dict:
         """
@@ -3444,8 +4344,10 @@ class UptimeKumaApi(object):
             }
         """
         r = self._call("getMaintenance", id_)["maintenance"]
-        parse_maintenance_strategy(r)
-        return r
+        if self._raw:
+            return r
+        r = decode_maintenance(r)
+        return self._typed(Maintenance.from_dict, r)
 
     @append_docstring(maintenance_docstring("add"))
     def add_maintenance(self, **kwargs) -> dict:
@@ -3675,7 +4577,7 @@ class UptimeKumaApi(object):
                 "maintenanceID": 1
             }
         """
-        maintenance = self.get_maintenance(id_)
+        maintenance = self._get_decoded(self.get_maintenance, id_)
         maintenance.update(kwargs)
         _check_arguments_maintenance(maintenance)
         return self._call("editMaintenance", maintenance)
@@ -3760,6 +4662,47 @@ class UptimeKumaApi(object):
         """
         return self._call("getMonitorMaintenance", id_)["monitors"]
 
+    def get_maintenance_schedule(
+        self,
+        start: Union[datetime.datetime, float] = None,
+        end: Union[datetime.datetime, float] = None,
+    ) -> MaintenanceSchedule:
+        """
+        Get a schedule of all maintenances and their monitors that answers point and range queries locally.
+
+        The monitors of the maintenances are requested concurrently once, the queries of the schedule need no server
+        calls. Maintenances with the timezone ``SAME_AS_SERVER`` use the server timezone of :meth:`info`.
+
+        :param start: Start of the time range as datetime (naive datetimes are UTC) or timestamp,
+                      defaults to one day ago.
+        :param end: End of the time range as datetime (naive datetimes are UTC) or timestamp,
+                    defaults to 30 days from now.
+        :return: The schedule.
+        :rtype: MaintenanceSchedule
+        :raises UptimeKumaException: If the server returns an error.
+
+        Example::
+
+            >>> schedule = api.get_maintenance_schedule()
+            >>> schedule.monitors_at(datetime.datetime.now(datetime.timezone.utc))
+            {1, 2}
+            >>> schedule = api.get_maintenance_schedule(
+            ...     start=datetime.datetime(2023, 3, 1),
+            ...     end=datetime.datetime(2023, 4, 1)
+            ... )
+            >>> schedule.is_under_maintenance(3, datetime.datetime(2023, 3, 26, 1, 30))
+            False
+        """
+        maintenances = self._get_decoded(self.get_maintenances)
+        monitors = self._run_bulk(lambda i: self.get_monitor_maintenance(i["id"]), maintenances)
+        return MaintenanceSchedule(
+            maintenances,
+            {maintenance["id"]: r for maintenance, r in zip(maintenances, monitors)},
+            start=start,
+            end=end,
+            server_timezone=self.info().get("serverTimezone") or "UTC",
+        )
+
     def add_monitor_maintenance(
         self,
         id_: int,
@@ -3791,6 +4734,78 @@ class UptimeKumaApi(object):
         """
         return self._call("addMonitorMaintenance", (id_, monitors))
 
+    def update_maintenance_monitors(self, id_: int, add: list = None, remove: list = None,
+                                    refresh: bool = False) -> dict:
+        """
+        Adds monitors to and removes monitors from a maintenance without resending unchanged lists.
+
+        The monitor list is only sent if it changes. Saving the request of the current monitors requires
+        ``cache=True`` (see :class:`~.TTLCache`): the current monitors are then read through the cache and the sent
+        monitors are stored in it after a change. Without cache the current monitors are requested on every call.
+        Changes of other clients are not known until the cached monitors expire, use ``refresh`` to read the monitors
+        again. Concurrent updates of the same maintenance by this instance are applied one after another.
+
+        :param int id_: Id of the maintenance.
+        :param list, optional add: The monitor ids (or monitors) to add.
+        :param list, optional remove: The monitor ids (or monitors) to remove.
+        :param bool, optional refresh: Request the current monitors of the maintenance instead of using the cached
+                                       monitors, defaults to ``False``.
+        :return: The ids of the added and removed monitors.
+        :rtype: dict
+        :raises UptimeKumaException: If the server returns an error.
+
+        Example::
+
+            >>> api.update_maintenance_monitors(1, add=[3, 4], remove=[1])
+            {
+                'added': [3, 4],
+                'removed': [1]
+            }
+        """
+        return self._update_members("getMonitorMaintenance", id_, add, remove, refresh)
+
+    def update_maintenances_monitors(
+        self,
+        changes: dict,
+        refresh: bool = False,
+        max_workers: int = None,
+        return_exceptions: bool = False,
+    ) -> dict:
+        """
+        Updates the monitors of many maintenances concurrently with :meth:`update_maintenance_monitors`.
+
+        Only the maintenances whose monitors change are sent.
+
+        :param dict changes: ``{"add": [...], "remove": [...]}`` by maintenance id.
+        :param bool, optional refresh: Request the current monitors of the maintenances, defaults to ``False``.
+        :param int, optional max_workers: Maximum number of concurrent calls, defaults to the concurrency of the
+                                          scheduler or ``4``.
+        :param bool, optional return_exceptions: Return exceptions of failed updates in the result instead of raising
+                                                 the first one, defaults to ``False``.
+        :return: The result of :meth:`update_maintenance_monitors` by maintenance id.
+        :rtype: dict
+        :raises UptimeKumaException: If the server returns an error.
+
+        Example::
+
+            >>> api.update_maintenances_monitors({
+            ...     1: {"add": [3]},
+            ...     2: {"remove": [3]}
+            ... })
+            {
+                1: {'added': [3], 'removed': []},
+                2: {'added': [], 'removed': [3]}
+            }
+        """
+        ids = list(changes)
+        r = self._run_bulk(
+            lambda i: self.update_maintenance_monitors(i, refresh=refresh, **changes[i]),
+            ids,
+            max_workers,
+            return_exceptions,
+        )
+        return dict(zip(ids, r))
+
     def get_status_page_maintenance(self, id_: int) -> list[dict]:
         """
         Gets all status pages of a maintenance.
@@ -3843,6 +4858,73 @@ class UptimeKumaApi(object):
         """
         return self._call("addMaintenanceStatusPage", (id_, status_pages))
 
+    def update_maintenance_status_pages(self, id_: int, add: list = None, remove: list = None,
+                                        refresh: bool = False) -> dict:
+        """
+        Adds status pages to and removes status pages from a maintenance without resending unchanged lists.
+
+        Works like :meth:`update_maintenance_monitors`, the current status pages are only cached with ``cache=True``.
+
+        :param int id_: Id of the maintenance.
+        :param list, optional add: The status page ids (or status pages) to add.
+        :param list, optional remove: The status page ids (or status pages) to remove.
+        :param bool, optional refresh: Request the current status pages of the maintenance, defaults to ``False``.
+        :return: The ids of the added and removed status pages.
+        :rtype: dict
+        :raises UptimeKumaException: If the server returns an error.
+
+        Example::
+
+            >>> api.update_maintenance_status_pages(1, add=[2])
+            {
+                'added': [2],
+                'removed': []
+            }
+        """
+        return self._update_members("getMaintenanceStatusPage", id_, add, remove, refresh)
+
+    def update_maintenances_status_pages(
+        self,
+        changes: dict,
+        refresh: bool = False,
+        max_workers: int = None,
+        return_exceptions: bool = False,
+    ) -> dict:
+        """
+        Updates the status pages of many maintenances concurrently with :meth:`update_maintenance_status_pages`.
+
+        Only the maintenances whose status pages change are sent.
+
+        :param dict changes: ``{"add": [...], "remove": [...]}`` by maintenance id.
+        :param bool, optional refresh: Request the current status pages of the maintenances, defaults to ``False``.
+        :param int, optional max_workers: Maximum number of concurrent calls, defaults to the concurrency of the
+                                          scheduler or ``4``.
+        :param bool, optional return_exceptions: Return exceptions of failed updates in the result instead of raising
+                                                 the first one, defaults to ``False``.
+        :return: The result of :meth:`update_maintenance_status_pages` by maintenance id.
+        :rtype: dict
+        :raises UptimeKumaException: If the server returns an error.
+
+        Example::
+
+            >>> api.update_maintenances_status_pages({
+            ...     1: {"add": [1]},
+            ...     2: {"add": [1]}
+            ... })
+            {
+                1: {'added': [1], 'removed': []},
+                2: {'added': [], 'removed': []}
+            }
+        """
+        ids = list(changes)
+        r = self._run_bulk(
+            lambda i: self.update_maintenance_status_pages(i, refresh=refresh, **changes[i]),
+            ids,
+            max_workers,
+            return_exceptions,
+        )
+        return dict(zip(ids, r))
+
     # api key
 
     def get_api_keys(self) -> list[dict]:
@@ -3880,9 +4962,10 @@ class UptimeKumaApi(object):
 
         # TODO: replace with getAPIKeyList?
 
+        if self._raw:
+            return freeze(self._wait_event_data(Event.API_KEY_LIST))
         r = self._get_event_data(Event.API_KEY_LIST)
-        int_to_bool(r, ["active"])
-        return r
+        return decode_list(decode_api_key, r)
 
     def get_api_key(self, id_: int) -> dict:
         """
@@ -4010,6 +5093,110 @@ class UptimeKumaApi(object):
                 raise UptimeKumaException("api key does not exist")
             return self._call("deleteAPIKey", id_)
 
+    # purge
+
+    def purge(self, kinds: list[str] = None, filter: Callable[[str, dict], bool] = None,
+              max_workers: int = None) -> dict:
+        """
+        Delete all objects of the given kinds, e.g. to reset a test instance.
+
+        The ids are resolved once from the lists that the server sent, the deletes are sent concurrently without
+        the existence checks of the single ``delete_*`` methods. Maintenances, status pages and api keys are deleted
+        first, then monitors and then the notifications, proxies, docker hosts and tags they used. The method waits
+        for the updated list of each kind once after all its deletes.
+
+        :param list, optional kinds: The kinds of objects to delete, defaults to all kinds:
+                                     ``"maintenances"``, ``"status_pages"``, ``"api_keys"``, ``"monitors"``,
+                                     ``"notifications"``, ``"proxies"``, ``"docker_hosts"`` and ``"tags"``.
+        :param callable, optional filter: Called with the kind and the object, only objects for which it returns
+                                          ``True`` are deleted. Defaults to all objects.
+        :param int, optional max_workers: Maximum number of concurrent deletes, defaults to the concurrency of the
+                                          scheduler or ``4``.
+        :return: The deleted ids (slugs for status pages) by kind.
+        :rtype: dict
+        :raises UptimeKumaException: If the server returns an error. The other deletes are finished before.
+
+        Example::
+
+            >>> api.purge(
+            ...     kinds=["monitors", "tags"],
+            ...     filter=lambda kind, obj: obj["name"].startswith("staging")
+            ... )
+            {
+                'monitors': [3, 4],
+                'tags': [1]
+            }
+        """
+        if kinds is None:
+            kinds = purge_kinds
+        for kind in kinds:
+            if kind not in purge_kinds:
+                raise ValueError(f"Unknown kind value: {kind}")
+        # kind -> (getter, key, delete event, list event)
+        specs = {
+            "maintenances": (self.get_maintenances, "id", "deleteMaintenance", Event.MAINTENANCE_LIST),
+            "status_pages": (self.get_status_pages, "slug", "deleteStatusPage", None),
+            "api_keys": (self.get_api_keys, "id", "deleteAPIKey", Event.API_KEY_LIST),
+            "monitors": (self.get_monitors, "id", "deleteMonitor", Event.MONITOR_LIST),
+            "notifications": (self.get_notifications, "id", "deleteNotification", Event.NOTIFICATION_LIST),
+            "proxies": (self.get_proxies, "id", "deleteProxy", Event.PROXY_LIST),
+            "docker_hosts": (self.get_docker_hosts, "id", "deleteDockerHost", Event.DOCKER_HOST_LIST),
+            "tags": (self.get_tags, "id", "deleteTag", None),
+        }
+
+        targets = {}
+        # the filter receives decoded objects, without a filter the ids are read from the raw lists
+        with self._model_mode_override("dict" if filter is not None else "raw"):
+            for kind in kinds:
+                getter, key, _, _ = specs[kind]
+                targets[kind] = [i[key] for i in getter() if filter is None or filter(kind, i)]
+
+        def delete(item):
+            kind, value = item
+            r = self._call(specs[kind][2], value)
+            if kind == "status_pages":
+                # uptime kuma does not send the status page list event when a status page is deleted
+                status_pages = self._event_data[Event.STATUS_PAGE_LIST] or {}
+                for status_page_id, status_page in list(status_pages.items()):
+                    if status_page["slug"] == value:
+                        status_pages.pop(status_page_id, None)
+            return r
+
+        deleted = {kind: [] for kind in kinds}
+        errors = []
+        for stage in purge_stages:
+            items = [(kind, value) for kind in stage if kind in targets for value in targets[kind]]
+            results = self._run_bulk(delete, items, max_workers, return_exceptions=True)
+            for (kind, value), result in zip(items, results):
+                if isinstance(result, Exception):
+                    errors.append(result)
+                else:
+                    deleted[kind].append(value)
+            for kind in stage:
+                event = specs[kind][3]
+                if event is not None and deleted.get(kind):
+                    self._wait_deleted(event, deleted[kind])
+        if errors:
+            raise errors[0]
+        return deleted
+
+    def _wait_deleted(self, event: Event, ids: list) -> None:
+        # waits for the list event that no longer contains the deleted ids
+        ids = set(ids)
+        start = time.perf_counter()
+        timestamp = time.time()
+        while True:
+            data = self._event_data[event]
+            if data is not None:
+                values = data.values() if isinstance(data, dict) else data
+                if not any(i["id"] in ids for i in values):
+                    break
+            if time.time() - timestamp > self.timeout:
+                self._observe("wait", event, start, "timeout")
+                raise Timeout(f"Timed out while waiting for event {event}")
+            time.sleep(0.01)
+        self._observe("wait", event, start)
+
     # helper methods
 
     def get_monitor_status(self, monitor_id: int) -> MonitorStatus:
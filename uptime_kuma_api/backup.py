@@ -0,0 +1,381 @@
+from __future__ import annotations
+
+import codecs
+import json
+import os
+import re
+from contextlib import contextmanager
+from typing import Any, Callable, Iterable, Iterator
+
+# the lists of a backup in the order Uptime Kuma writes them
+backup_lists = ("notificationList", "monitorList", "proxyList")
+
+_whitespace = re.compile(r"[ \t\n\r]*")
+
+
+@contextmanager
+def _open(file: Any, mode: str) -> Iterator[Any]:
+    # accepts a path or an open file object, only paths are closed
+    if isinstance(file, (str, os.PathLike)):
+        with open(file, mode, encoding="utf-8") as fp:
+            yield fp
+    else:
+        yield file
+
+
+class _JsonStream(object):
+    # reads the JSON values of a document one after another from a file object,
+    # only the current value has to fit into memory
+
+    def __init__(self, fp: Any, chunk_size: int) -> None:
+        self._fp = fp
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._bytes_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+        chunk = self._fp.read(self._chunk_size)
+        if isinstance(chunk, bytes):
+            chunk = self._bytes_decoder.decode(chunk, final=not chunk)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        while True:
+            self._pos = _whitespace.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                raise ValueError("Unexpected end of backup data")
+
+    def expect(self, chars: str) -> str:
+        char = self.peek()
+        if char not in chars:
+            raise ValueError(f"Invalid backup data: expected {' or '.join(chars)} at {char!r}")
+        self._pos += 1
+        return char
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError as e:
+                # the value continues in the next chunk
+                if self._fill():
+                    continue
+                raise ValueError(f"Invalid backup data: {e}")
+            # a number at the end of the buffer may continue in the next chunk
+            if end == len(self._buffer) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+
+def iter_backup(file: Any, chunk_size: int = 65536) -> Iterator[tuple[str, Any]]:
+    """
+    Reads a backup incrementally.
+
+    The items of the lists are decoded one after another, so large backups do not have to be loaded completely.
+
+    :param file: The path or a file object opened in text or binary mode.
+    :param int, optional chunk_size: Number of characters that are read at once, defaults to ``65536``.
+    :return: Generator of ``(key, item)`` tuples for every item of a list (e.g. ``("monitorList", {...})``) and
+             ``(key, value)`` tuples for other values (e.g. ``("version", "1.23.0")``).
+    :rtype: iterator
+    :raises ValueError: If the backup is not valid JSON.
+
+    Example::
+
+        >>> for key, item in iter_backup("backup.json"):
+        ...     if key == "monitorList":
+        ...         print(item["name"])
+        monitor 1
+        monitor 2
+    """
+    with _open(file, "r") as fp:
+        stream = _JsonStream(fp, chunk_size)
+        stream.expect("{")
+        if stream.peek() == "}":
+            return
+        while True:
+            key = stream.value()
+            if not isinstance(key, str):
+                raise ValueError(f"Invalid backup data: key {key!r} is not a string")
+            stream.expect(":")
+            if stream.peek() == "[":
+                stream.expect("[")
+                if stream.peek() == "]":
+                    stream.expect("]")
+                else:
+                    while True:
+                        yield key, stream.value()
+                        if stream.expect(",]") == "]":
+                            break
+            else:
+                yield key, stream.value()
+            if stream.expect(",}") == "}":
+                break
+
+
+class _BackupWriter(object):
+    # writes the backup document item by item
+
+    def __init__(self, fp: Any, dumps: Callable) -> None:
+        self._fp = fp
+        self._dumps = dumps
+        self._keys = []
+        self._list = None
+        self._empty = True
+
+    def _key(self, key: str) -> None:
+        self._close_list()
+        self._fp.write(("{" if not self._keys else ", ") + json.dumps(key) + ": ")
+        self._keys.append(key)
+
+    def _close_list(self) -> None:
+        if self._list is not None:
+            self._fp.write("]")
+            self._list = None
+
+    def value(self, key: str, value: Any) -> None:
+        self._key(key)
+        self._fp.write(self._dumps(value))
+
+    def item(self, key: str, item: Any) -> None:
+        if key != self._list:
+            if key in self._keys:
+                raise ValueError(f"Invalid backup data: duplicate key {key!r}")
+            self._key(key)
+            self._fp.write("[")
+            self._list = key
+            self._empty = True
+        if not self._empty:
+            self._fp.write(", ")
+        self._fp.write(self._dumps(item))
+        self._empty = False
+
+    def close(self) -> None:
+        self._close_list()
+        for key in backup_lists:
+            if key not in self._keys:
+                self._key(key)
+                self._fp.write("[]")
+        self._fp.write("}")
+
+
+def write_backup(
+    file: Any,
+    version: str,
+    notifications: Iterable[dict],
+    monitors: Iterable[dict],
+    proxies: Iterable[dict],
+    dumps: Callable = json.dumps,
+) -> dict:
+    """
+    Writes a backup in the format of :meth:`~.UptimeKumaApi.upload_backup` to a file.
+
+    Every item is encoded and written on its own, the document is never built in memory.
+
+    :param file: The path or a file object opened in text mode.
+    :param str version: The Uptime Kuma version.
+    :param notifications: The notifications in the format of the server.
+    :param monitors: The monitors in the format of the server.
+    :param proxies: The proxies in the format of the server.
+    :param callable, optional dumps: Encodes an item to ``str``, defaults to :func:`json.dumps`.
+    :return: The number of written notifications, monitors and proxies.
+    :rtype: dict
+    """
+    counts = {"notifications": 0, "monitors": 0, "proxies": 0}
+    with _open(file, "w") as fp:
+        writer = _BackupWriter(fp, dumps)
+        writer.value("version", version)
+        for key, count_key, items in [
+            ("notificationList", "notifications", notifications),
+            ("monitorList", "monitors", monitors),
+            ("proxyList", "proxies", proxies),
+        ]:
+            for item in items:
+                writer.item(key, item)
+                counts[count_key] += 1
+        writer.close()
+    return counts
+
+
+def _tag_names(monitor: dict) -> set:
+    return {tag.get("name") for tag in monitor.get("tags") or []}
+
+
+def _select_monitors(file: Any, tags: Iterable[str], chunk_size: int) -> tuple[set, set, set]:
+    # first pass for the tag filter: the matching monitors with their parents
+    # and the notifications and proxies that they use
+    tags = set(tags)
+    monitors = {}
+    matched = []
+    for key, item in iter_backup(file, chunk_size):
+        if key == "monitorList" and isinstance(item, dict):
+            monitors[item.get("id")] = (
+                item.get("parent"),
+                [str(i) for i in item.get("notificationIDList") or {}],
+                item.get("proxyId"),
+            )
+            if _tag_names(item) & tags:
+                matched.append(item.get("id"))
+    monitor_ids = set()
+    for monitor_id in matched:
+        while monitor_id is not None and monitor_id not in monitor_ids:
+            monitor_ids.add(monitor_id)
+            monitor_id = monitors.get(monitor_id, (None,))[0]
+    notification_ids = set()
+    proxy_ids = set()
+    for monitor_id in monitor_ids:
+        if monitor_id in monitors:
+            _, notifications, proxy_id = monitors[monitor_id]
+            notification_ids.update(notifications)
+            if proxy_id is not None:
+                proxy_ids.add(proxy_id)
+    return monitor_ids, notification_ids, proxy_ids
+
+
+def _validate(key: str, item: Any, seen: dict, errors: list) -> None:
+    if not isinstance(item, dict):
+        errors.append(f"{key} contains a {type(item).__name__} instead of an object")
+        return
+    item_id = item.get("id")
+    if not isinstance(item_id, int) or isinstance(item_id, bool):
+        errors.append(f"{key} item {item.get('name')!r} has an invalid id: {item_id!r}")
+    elif item_id in seen[key]:
+        errors.append(f"{key} contains the id {item_id} more than once")
+    seen[key].add(item_id)
+    if key != "proxyList" and not isinstance(item.get("name"), str):
+        errors.append(f"{key} item {item_id} has no name")
+    if key == "monitorList" and not item.get("type"):
+        errors.append(f"monitorList item {item_id} has no type")
+
+
+def rewrite_backup(
+    src: Any,
+    dst: Any,
+    tags: Iterable[str] = None,
+    notification_ids: dict = None,
+    proxy_ids: dict = None,
+    monitor_ids: dict = None,
+    validate: bool = True,
+    chunk_size: int = 65536,
+    dumps: Callable = json.dumps,
+) -> dict:
+    """
+    Validates, filters and rewrites a backup item by item, e.g. before :meth:`~.UptimeKumaApi.upload_backup`.
+
+    The ids of notifications, proxies and monitors are replaced in the items and in all references
+    (``notificationIDList``, ``proxyId`` and ``parent``), e.g. to assign the monitors to notifications that already
+    exist on the target server. Ids that are not in a mapping are kept.
+
+    :param src: The path or a file object of the backup. If ``tags`` is used, a file object must be seekable
+                because the backup is read twice.
+    :param dst: The path or a file object opened in text mode for the rewritten backup.
+    :param list, optional tags: Only keep the monitors with one of these tag names, their parent groups and the
+                                notifications and proxies they use.
+    :param dict, optional notification_ids: New notification ids by the ids in the backup.
+    :param dict, optional proxy_ids: New proxy ids by the ids in the backup.
+    :param dict, optional monitor_ids: New monitor ids by the ids in the backup.
+    :param bool, optional validate: Check the ids, names and references of the items, defaults to ``True``.
+    :param int, optional chunk_size: Number of characters that are read at once, defaults to ``65536``.
+    :param callable, optional dumps: Encodes an item to ``str``, defaults to :func:`json.dumps`.
+    :return: The number of written notifications, monitors and proxies and of the items that were filtered out.
+    :rtype: dict
+    :raises ValueError: If the backup is invalid. ``dst`` then contains an incomplete backup.
+
+    Example::
+
+        >>> rewrite_backup(
+        ...     "backup.json",
+        ...     "production.json",
+        ...     tags=["production"],
+        ...     notification_ids={1: 4}
+        ... )
+        {
+            'notifications': 1,
+            'monitors': 12,
+            'proxies': 0,
+            'skipped': 30
+        }
+    """
+    notification_ids = {str(k): v for k, v in (notification_ids or {}).items()}
+    proxy_ids = proxy_ids or {}
+    monitor_ids = monitor_ids or {}
+    selected = None
+    if tags is not None:
+        if not isinstance(src, (str, os.PathLike)):
+            if not src.seekable():
+                raise ValueError("The tag filter needs a path or a seekable file object")
+            start = src.tell()
+        selected = _select_monitors(src, tags, chunk_size)
+        if not isinstance(src, (str, os.PathLike)):
+            src.seek(start)
+
+    counts = {"notifications": 0, "monitors": 0, "proxies": 0, "skipped": 0}
+    count_keys = dict(zip(backup_lists, ["notifications", "monitors", "proxies"]))
+    seen = {key: set() for key in backup_lists}
+    references = {"notificationList": set(), "proxyList": set(), "monitorList": set()}
+    errors = []
+    with _open(dst, "w") as fp:
+        writer = _BackupWriter(fp, dumps)
+        for key, item in iter_backup(src, chunk_size):
+            if key not in backup_lists:
+                writer.value(key, item)
+                continue
+            if validate:
+                _validate(key, item, seen, errors)
+                if len(errors) >= 10:
+                    break
+            if not isinstance(item, dict):
+                writer.item(key, item)
+                continue
+            item = dict(item)
+            if key == "notificationList":
+                if selected is not None and str(item.get("id")) not in selected[1]:
+                    counts["skipped"] += 1
+                    continue
+                item["id"] = notification_ids.get(str(item.get("id")), item.get("id"))
+            elif key == "proxyList":
+                if selected is not None and item.get("id") not in selected[2]:
+                    counts["skipped"] += 1
+                    continue
+                item["id"] = proxy_ids.get(item.get("id"), item.get("id"))
+            else:
+                if selected is not None and item.get("id") not in selected[0]:
+                    counts["skipped"] += 1
+                    continue
+                references["notificationList"].update(item.get("notificationIDList") or {})
+                if item.get("proxyId") is not None:
+                    references["proxyList"].add(item["proxyId"])
+                if item.get("parent") is not None:
+                    references["monitorList"].add(item["parent"])
+                item["id"] = monitor_ids.get(item.get("id"), item.get("id"))
+                item["parent"] = monitor_ids.get(item.get("parent"), item.get("parent"))
+                item["proxyId"] = proxy_ids.get(item.get("proxyId"), item.get("proxyId"))
+                if item.get("notificationIDList"):
+                    item["notificationIDList"] = {
+                        str(notification_ids.get(str(k), k)): v for k, v in item["notificationIDList"].items()
+                    }
+            writer.item(key, item)
+            counts[count_keys[key]] += 1
+        if validate and not errors:
+            for key, ids in references.items():
+                found = {str(i) for i in seen[key]} if key == "notificationList" else seen[key]
+                for i in sorted(ids - found, key=str):
+                    errors.append(f"{key} does not contain the referenced id {i}")
+        if errors:
+            raise ValueError("Invalid backup: " + "; ".join(errors[:10]))
+        writer.close()
+    return counts
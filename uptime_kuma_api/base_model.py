@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from typing import Any
+
+
+class BaseModel(object):
+    """Base class of the typed models that are returned with ``model_mode="typed"``.
+
+    The known keys of an object are stored in ``__slots__``. Keys that are unknown to the model,
+    e.g. keys added by newer Uptime Kuma versions or notification provider options, are kept in a separate dict,
+    so that :meth:`to_dict` returns the same keys that were passed to :meth:`from_dict`.
+
+    Values can be accessed as attributes (``monitor.name``) and as items (``monitor["name"]``).
+    Known keys that were not sent by the server are ``None`` as attributes and missing as items.
+    """
+
+    __slots__ = ("_extra",)
+    _fields: tuple = ()
+    _field_set: frozenset = frozenset()
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        fields = []
+        for klass in reversed(cls.__mro__):
+            for field in klass.__dict__.get("__slots__", ()):
+                if field != "_extra":
+                    fields.append(field)
+        cls._fields = tuple(fields)
+        cls._field_set = frozenset(fields)
+
+    def __init__(self, **kwargs) -> None:
+        fields = self._field_set
+        extra = {}
+        for key, value in kwargs.items():
+            if key in fields:
+                object.__setattr__(self, key, value)
+            else:
+                extra[key] = value
+        object.__setattr__(self, "_extra", extra)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> BaseModel:
+        """
+        Creates a model from a dict.
+
+        :param dict data: The object as returned with the default ``model_mode="dict"``.
+        :return: The model.
+        """
+        return cls(**data)
+
+    def to_dict(self) -> dict:
+        """
+        Converts the model to a dict.
+
+        :return: The object as returned with the default ``model_mode="dict"``.
+        :rtype: dict
+        """
+        data = {}
+        for field in self._fields:
+            try:
+                data[field] = object.__getattribute__(self, field)
+            except AttributeError:
+                # not sent by the server
+                pass
+        data.update(self._extra)
+        return data
+
+    def __getstate__(self) -> tuple:
+        fields = {}
+        for field in self._fields:
+            try:
+                fields[field] = object.__getattribute__(self, field)
+            except AttributeError:
+                pass
+        return fields, self._extra
+
+    def __setstate__(self, state: tuple) -> None:
+        fields, extra = state
+        for key, value in fields.items():
+            object.__setattr__(self, key, value)
+        object.__setattr__(self, "_extra", extra)
+
+    def __getattr__(self, name: str) -> Any:
+        # only called for unset slots and unknown attributes
+        if name == "_extra" or name.startswith("__"):
+            # not initialized yet, e.g. while copying or unpickling
+            raise AttributeError(name)
+        if name in self._field_set:
+            return None
+        try:
+            return self._extra[name]
+        except KeyError:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._field_set:
+            try:
+                return object.__getattribute__(self, key)
+            except AttributeError:
+                raise KeyError(key)
+        return self._extra[key]
+
+    def __contains__(self, key: str) -> bool:
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, BaseModel):
+            return type(self) == type(other) and self.to_dict() == other.to_dict()
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+
+def to_dict(obj: Any) -> Any:
+    """
+    Converts a model to a dict. Other objects are returned unchanged.
+
+    :param obj: A model or a dict.
+    :return: The dict.
+    """
+    if isinstance(obj, BaseModel):
+        return obj.to_dict()
+    return obj
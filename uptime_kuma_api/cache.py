@@ -0,0 +1,304 @@
+from __future__ import annotations
+
+import threading
+import time
+from copy import deepcopy
+from typing import Any, Callable, Optional
+
+# read events and REST paths that are cached and their default time to live in seconds
+default_ttls = {
+    "getTags": 30,
+    "getSettings": 60,
+    "getGameList": 3600,
+    "getMonitorMaintenance": 30,
+    "getMaintenanceStatusPage": 30,
+    "getDatabaseSize": 10,
+    "twoFAStatus": 60,
+    "/api/status-page/heartbeat": 30,
+}
+
+_all = None
+
+
+# the status page configs that UptimeKumaApi keeps to save status pages, they do not expire
+STATUS_PAGE_CONFIG = "statusPageConfig"
+
+
+def _first_arg(data):
+    return data[0]
+
+
+def _same_arg(data):
+    return data
+
+
+# write events and the cached reads they change: (read event, function that returns the read data of the changed
+# entry from the write data or None for all entries of the read event), "*" clears the whole cache
+invalidation_rules = {
+    "addTag": [("getTags", _all)],
+    "editTag": [("getTags", _all)],
+    "deleteTag": [("getTags", _all)],
+    "setSettings": [("getSettings", _all)],
+    "addMonitorMaintenance": [("getMonitorMaintenance", _first_arg)],
+    "addMaintenanceStatusPage": [("getMaintenanceStatusPage", _first_arg)],
+    "deleteMaintenance": [("getMonitorMaintenance", _same_arg), ("getMaintenanceStatusPage", _same_arg)],
+    "deleteMonitor": [
+        ("getMonitorMaintenance", _all), ("getDatabaseSize", _all), ("/api/status-page/heartbeat", _all),
+        (STATUS_PAGE_CONFIG, _all)
+    ],
+    # the heartbeat lists of the status pages change with the monitors
+    "editMonitor": [("/api/status-page/heartbeat", _all)],
+    "pauseMonitor": [("/api/status-page/heartbeat", _all)],
+    "resumeMonitor": [("/api/status-page/heartbeat", _all)],
+    "saveStatusPage": [("/api/status-page/heartbeat", _first_arg), (STATUS_PAGE_CONFIG, _first_arg)],
+    "deleteStatusPage": [
+        ("getMaintenanceStatusPage", _all), ("/api/status-page/heartbeat", _same_arg), (STATUS_PAGE_CONFIG, _same_arg)
+    ],
+    "clearEvents": [("getDatabaseSize", _all)],
+    "clearHeartbeats": [("getDatabaseSize", _all)],
+    "clearStatistics": [("getDatabaseSize", _all)],
+    "shrinkDatabase": [("getDatabaseSize", _all)],
+    "save2FA": [("twoFAStatus", _all)],
+    "disable2FA": [("twoFAStatus", _all)],
+    "uploadBackup": "*",
+    "setup": "*",
+    "login": "*",
+    "loginByToken": "*",
+    "logout": "*",
+}
+
+
+def invalidated_entries(event: str, data: Any = None) -> Any:
+    """
+    Returns the reads that a write call changes (see ``invalidation_rules``).
+
+    :param str event: The event name of the write call.
+    :param data: The call data.
+    :return: ``(read event, read data, all entries of the read event)`` tuples, ``"*"`` for all reads or ``None``.
+    """
+    rules = invalidation_rules.get(event)
+    if rules is None or rules == "*":
+        return rules
+    return [
+        (read_event, None, True) if selector is _all else (read_event, selector(data), False)
+        for read_event, selector in rules
+    ]
+
+
+class _Entry(object):
+    __slots__ = ("value", "expires", "indexes")
+
+    def __init__(self, value: Any, expires: float) -> None:
+        self.value = value
+        self.expires = expires
+        self.indexes = {}
+
+
+class TTLCache(object):
+    """Caches the responses of read calls that are not kept up to date by server events.
+
+    Each cached event has its own time to live (see ``default_ttls``). The write methods of the same instance
+    remove the entries they change, e.g. :meth:`~.UptimeKumaApi.add_tag` removes the cached tag list and
+    :meth:`~.UptimeKumaApi.add_monitor_maintenance` the cached monitors of this maintenance. Changes made by other
+    clients are visible after the time to live. Callers receive copies of the cached responses.
+
+    Pass an instance (or ``True``) as ``cache`` to :class:`~.UptimeKumaApi` to enable it.
+
+    Example::
+
+        >>> api = UptimeKumaApi('INSERT_URL', cache=TTLCache(ttls={"getTags": 300}))
+        >>> api.login('INSERT_USERNAME', 'INSERT_PASSWORD')
+        >>> api.get_tag(1)
+        >>> api.get_tag(2)
+        >>> api.cache.snapshot()
+        {
+            'hits': 1,
+            'misses': 1,
+            'invalidations': 0,
+            'hit_rate': 0.5,
+            'size': 1,
+            'events': {
+                'getTags': {
+                    'hits': 1,
+                    'misses': 1,
+                    'invalidations': 0
+                }
+            }
+        }
+
+    :param dict, optional ttls: Time to live in seconds by event name, overrides ``default_ttls``.
+                                A time to live of ``0`` disables the cache for the event.
+    :param int, optional max_entries: Maximum number of entries, defaults to ``1000``.
+    """
+
+    def __init__(self, ttls: dict = None, max_entries: int = 1000) -> None:
+        self.ttls = {**default_ttls, **(ttls or {})}
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: dict = {}
+        self._generations: dict = {}
+        self._stats: dict = {}
+
+    def _event_stats(self, event: str) -> list:
+        stats = self._stats.get(event)
+        if stats is None:
+            stats = self._stats[event] = [0, 0, 0]
+        return stats
+
+    def cacheable(self, event: str) -> bool:
+        """
+        Returns whether responses of the event are cached.
+
+        :param str event: The event name.
+        :rtype: bool
+        """
+        return bool(self.ttls.get(event))
+
+    def generation(self, event: str) -> int:
+        """
+        Returns a counter that changes when entries of the event are removed. Pass it to :meth:`put` to avoid storing
+        a response that was requested before a write.
+
+        :param str event: The event name.
+        :rtype: int
+        """
+        with self._lock:
+            return self._generations.get(event, 0)
+
+    def get(self, event: str, data: Any = None) -> tuple[bool, Any]:
+        """
+        Looks up a response.
+
+        :param str event: The event name.
+        :param data: The call data.
+        :return: ``(True, copy of the response)`` or ``(False, None)`` if there is no valid entry.
+        :rtype: tuple
+        """
+        key = (event, repr(data))
+        with self._lock:
+            entry = self._entries.get(key)
+            stats = self._event_stats(event)
+            if entry is None or entry.expires <= time.monotonic():
+                stats[1] += 1
+                return False, None
+            stats[0] += 1
+            value = entry.value
+        return True, deepcopy(value)
+
+    def put(self, event: str, data: Any, value: Any, generation: int = None) -> None:
+        """
+        Stores a copy of a response.
+
+        :param str event: The event name.
+        :param data: The call data.
+        :param value: The response.
+        :param int, optional generation: The value of :meth:`generation` before the call. If entries of the event
+                                         were removed since then, the response is not stored.
+        """
+        ttl = self.ttls.get(event)
+        if not ttl:
+            return
+        value = deepcopy(value)
+        now = time.monotonic()
+        with self._lock:
+            if generation is not None and generation != self._generations.get(event, 0):
+                return
+            if len(self._entries) >= self.max_entries:
+                self._evict(now)
+            self._entries[(event, repr(data))] = _Entry(value, now + ttl)
+
+    def _evict(self, now: float) -> None:
+        # removes the expired entries and, if that is not enough, the entries that expire first
+        for key in [key for key, entry in self._entries.items() if entry.expires <= now]:
+            del self._entries[key]
+        if len(self._entries) >= self.max_entries:
+            for key, _ in sorted(self._entries.items(), key=lambda i: i[1].expires)[:len(self._entries) // 10 + 1]:
+                del self._entries[key]
+
+    def index(self, event: str, data: Any, name: str, build: Callable[[Any], Any]) -> Optional[Any]:
+        """
+        Returns a lookup structure that is derived from a cached response and is removed with it,
+        e.g. the tags by id.
+
+        :param str event: The event name.
+        :param data: The call data.
+        :param str name: The name of the index.
+        :param callable build: Builds the index from the cached response.
+        :return: The index or ``None`` if there is no valid entry. Callers must not modify it.
+        """
+        key = (event, repr(data))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.expires <= time.monotonic():
+                return None
+            if name not in entry.indexes:
+                entry.indexes[name] = build(entry.value)
+            self._event_stats(event)[0] += 1
+            return entry.indexes[name]
+
+    def invalidate(self, event: str, data: Any = _all) -> None:
+        """
+        Removes the entry of an event and call data or all entries of an event.
+
+        :param str event: The event name.
+        :param data: The call data, defaults to all entries of the event.
+        """
+        with self._lock:
+            self._invalidate(event, data, all_data=data is _all)
+
+    def _invalidate(self, event: str, data: Any, all_data: bool) -> None:
+        self._generations[event] = self._generations.get(event, 0) + 1
+        self._event_stats(event)[2] += 1
+        if all_data:
+            for key in [key for key in self._entries if key[0] == event]:
+                del self._entries[key]
+        else:
+            self._entries.pop((event, repr(data)), None)
+
+    def invalidate_for(self, event: str, data: Any = None) -> None:
+        """
+        Removes the entries that a write call changes (see ``invalidation_rules``).
+
+        :param str event: The event name of the write call.
+        :param data: The call data.
+        """
+        entries = invalidated_entries(event, data)
+        if entries is None:
+            return
+        if entries == "*":
+            self.clear()
+            return
+        with self._lock:
+            for read_event, read_data, all_data in entries:
+                if read_event in self.ttls:
+                    self._invalidate(read_event, read_data, all_data)
+
+    def clear(self) -> None:
+        """
+        Removes all entries.
+        """
+        with self._lock:
+            for event in list(self._generations) + list(self.ttls):
+                self._generations[event] = self._generations.get(event, 0) + 1
+            self._entries = {}
+
+    def snapshot(self) -> dict:
+        """
+        Returns the hits, misses and invalidations in total and by event.
+
+        :return: The statistics.
+        :rtype: dict
+        """
+        with self._lock:
+            hits = sum(i[0] for i in self._stats.values())
+            misses = sum(i[1] for i in self._stats.values())
+            return {
+                "hits": hits,
+                "misses": misses,
+                "invalidations": sum(i[2] for i in self._stats.values()),
+                "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+                "size": len(self._entries),
+                "events": {
+                    event: {"hits": i[0], "misses": i[1], "invalidations": i[2]} for event, i in self._stats.items()
+                },
+            }
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import bisect
+import datetime
+import threading
+import time
+from typing import Callable, Optional
+
+
+def _parse_valid_to(cert_info: dict, received: float) -> Optional[float]:
+    # returns the expiry of the certificate as timestamp
+    if not cert_info.get("valid") or not cert_info.get("certInfo"):
+        return None
+    info = cert_info["certInfo"]
+    valid_to = info.get("validTo")
+    if valid_to:
+        try:
+            dt = datetime.datetime.strptime(
+                valid_to.replace("Z", "+0000"), "%Y-%m-%dT%H:%M:%S.%f%z"
+            )
+            return dt.timestamp()
+        except ValueError:
+            pass
+    days_remaining = info.get("daysRemaining")
+    if days_remaining is not None:
+        return received + days_remaining * 86400
+    return None
+
+
+class CertInfoStore(object):
+    """Stores the certificate infos of the monitors as sent by the server.
+
+    The certificate infos are parsed on first access. An index of the certificate expiry dates is
+    updated incrementally with the certificates that changed since the last query, so that
+    :meth:`expiring_within` is a range scan over the sorted index.
+
+    :param callable loads: The JSON decoder.
+    """
+
+    def __init__(self, loads: Callable) -> None:
+        self._loads = loads
+        self._lock = threading.Lock()
+        # monitor id -> (raw data, receive timestamp)
+        self._raw: dict = {}
+        # monitor id -> parsed certificate info
+        self._parsed: dict = {}
+        # monitor ids whose certificate info changed since the last index update
+        self._dirty: set = set()
+        # sorted list of (expiry timestamp, monitor id)
+        self._index: list = []
+        # monitor id -> expiry timestamp in the index
+        self._expiry: dict = {}
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    def __contains__(self, monitor_id: int) -> bool:
+        return monitor_id in self._raw
+
+    def set(self, monitor_id: int, data: str) -> None:
+        """
+        Stores the certificate info of a monitor without parsing it.
+
+        :param int monitor_id: The monitor id.
+        :param str data: The certificate info as JSON string.
+        """
+        with self._lock:
+            self._raw[monitor_id] = (data, time.time())
+            self._parsed.pop(monitor_id, None)
+            self._dirty.add(monitor_id)
+
+    def _get(self, monitor_id: int) -> dict:
+        try:
+            return self._parsed[monitor_id]
+        except KeyError:
+            parsed = self._loads(self._raw[monitor_id][0])
+            self._parsed[monitor_id] = parsed
+            return parsed
+
+    def get(self, monitor_id: int) -> dict:
+        """
+        Get the parsed certificate info of a monitor.
+
+        :param int monitor_id: The monitor id.
+        :return: The certificate info. It is cached and must not be modified.
+        :rtype: dict
+        :raises KeyError: If no certificate info was received for the monitor.
+        """
+        with self._lock:
+            return self._get(monitor_id)
+
+    def to_dict(self) -> dict:
+        """
+        Get the parsed certificate infos of all monitors.
+
+        Each certificate info is parsed once, certificate infos that were parsed before (e.g. by
+        :meth:`expiring_within`) are reused.
+
+        :return: The certificate info for each monitor id. The values are cached and must not be modified.
+        :rtype: dict
+        """
+        with self._lock:
+            return {monitor_id: self._get(monitor_id) for monitor_id in self._raw}
+
+    def _update_index(self) -> None:
+        for monitor_id in self._dirty:
+            old_expiry = self._expiry.pop(monitor_id, None)
+            if old_expiry is not None:
+                i = bisect.bisect_left(self._index, (old_expiry, monitor_id))
+                del self._index[i]
+            expiry = _parse_valid_to(self._get(monitor_id), self._raw[monitor_id][1])
+            if expiry is not None:
+                bisect.insort(self._index, (expiry, monitor_id))
+                self._expiry[monitor_id] = expiry
+        self._dirty.clear()
+
+    def expiring_within(self, days: float, now: float = None) -> list[tuple[int, float]]:
+        """
+        Get the monitors whose certificates expire within the given number of days.
+
+        Already expired certificates are included.
+
+        :param float days: Number of days from now.
+        :param float, optional now: Reference timestamp, defaults to the current time.
+        :return: Tuples of monitor id and expiry timestamp, sorted by expiry.
+        :rtype: list
+        """
+        if now is None:
+            now = time.time()
+        with self._lock:
+            self._update_index()
+            end = bisect.bisect_right(self._index, (now + days * 86400, float("inf")))
+            return [(monitor_id, expiry) for expiry, monitor_id in self._index[:end]]
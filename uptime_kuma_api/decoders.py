@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import json
+from typing import Callable
+
+from .auth_method import AuthMethod
+from .docker_type import DockerType
+from .incident_style import IncidentStyle
+from .maintenance_strategy import MaintenanceStrategy
+from .monitor_status import MonitorStatus
+from .monitor_type import MonitorType
+from .notification_providers import NotificationType
+from .proxy_protocol import ProxyProtocol
+
+
+def _enum_lookup(enum) -> dict:
+    # members are hashed like their values, so the lookup accepts raw values and enum members
+    return {member.value: member for member in enum}
+
+
+def build_decoder(
+    bool_keys: tuple = (), enum_keys: tuple = (), convert: Callable = None
+) -> Callable[[dict], dict]:
+    """
+    Generates a decoder that converts a record in a single pass.
+
+    :param tuple bool_keys: Keys whose values are converted from ``0``/``1`` to ``bool``.
+    :param tuple enum_keys: Tuples of ``(key, enum, default)``. The values are converted to the enum member.
+                            ``None`` values are replaced by ``default`` if it is not ``None``.
+                            Unknown values are kept as they are.
+    :param callable convert: Optional function that is called with the record before the other conversions.
+    :return: The decoder. It converts the record in place and returns it.
+    :rtype: callable
+    """
+    enum_keys = tuple((key, _enum_lookup(enum), default) for key, enum, default in enum_keys)
+
+    def decode(record: dict) -> dict:
+        if convert is not None:
+            record = convert(record)
+        for key in bool_keys:
+            if key in record:
+                record[key] = record[key] == 1
+        for key, lookup, default in enum_keys:
+            if key in record:
+                value = record[key]
+                if value is not None:
+                    record[key] = lookup.get(value, value)
+                elif default is not None:
+                    record[key] = default
+        return record
+
+    return decode
+
+
+def _convert_monitor(monitor: dict) -> dict:
+    notification_ids = monitor.get("notificationIDList")
+    if isinstance(notification_ids, dict):
+        monitor["notificationIDList"] = [int(i) for i in notification_ids]
+    return monitor
+
+
+def _convert_status_page(status_page: dict) -> dict:
+    incident = status_page.get("incident")
+    if incident:
+        decode_incident(incident)
+    for group in status_page.get("publicGroupList") or []:
+        for monitor in group["monitorList"]:
+            if "sendUrl" in monitor:
+                monitor["sendUrl"] = monitor["sendUrl"] == 1
+    return status_page
+
+
+decode_monitor = build_decoder(
+    bool_keys=("active",),
+    enum_keys=(
+        ("type", MonitorType, None),
+        ("authMethod", AuthMethod, AuthMethod.NONE),
+    ),
+    convert=_convert_monitor,
+)
+
+decode_heartbeat = build_decoder(
+    bool_keys=("important",),
+    enum_keys=(("status", MonitorStatus, None),),
+)
+
+
+def notification_decoder(loads: Callable = json.loads) -> Callable[[dict], dict]:
+    """
+    Generates a notification decoder that parses the notification config with the given JSON decoder.
+
+    :param callable loads: The JSON decoder, defaults to :func:`json.loads`.
+    :return: The decoder.
+    :rtype: callable
+    """
+
+    def convert(notification: dict) -> dict:
+        notification = notification.copy()
+        config = loads(notification.pop("config"))
+        notification.update(config)
+        return notification
+
+    return build_decoder(
+        enum_keys=(("type", NotificationType, None),),
+        convert=convert,
+    )
+
+
+decode_notification = notification_decoder()
+
+decode_proxy = build_decoder(
+    bool_keys=("auth", "active", "default", "applyExisting"),
+    enum_keys=(("protocol", ProxyProtocol, None),),
+)
+
+decode_docker_host = build_decoder(
+    enum_keys=(("dockerType", DockerType, None),),
+)
+
+decode_maintenance = build_decoder(
+    enum_keys=(("strategy", MaintenanceStrategy, None),),
+)
+
+decode_api_key = build_decoder(
+    bool_keys=("active",),
+)
+
+decode_incident = build_decoder(
+    enum_keys=(("style", IncidentStyle, None),),
+)
+
+decode_status_page = build_decoder(
+    convert=_convert_status_page,
+)
+
+
+def decode_list(decoder: Callable[[dict], dict], records: list) -> list:
+    """
+    Decodes every record of a list.
+
+    :param callable decoder: The decoder of the record type.
+    :param list records: The records.
+    :return: The decoded records.
+    :rtype: list
+    """
+    return [decoder(record) for record in records]
+
+
+def decode_heartbeats(heartbeats: dict) -> dict:
+    """
+    Decodes the heartbeat lists of all monitors.
+
+    :param dict heartbeats: The heartbeats for each monitor id.
+    :return: The decoded heartbeats for each monitor id.
+    :rtype: dict
+    """
+    for monitor_heartbeats in heartbeats.values():
+        for heartbeat in monitor_heartbeats:
+            decode_heartbeat(heartbeat)
+    return heartbeats
+
+
+def decode_status_page_heartbeats(data: dict) -> dict:
+    """
+    Decodes the response of the public status page heartbeat endpoint.
+
+    :param dict data: The response with ``heartbeatList`` by monitor id and ``uptimeList`` by ``<monitor id>_<hours>``.
+    :return: The decoded heartbeats and the uptime by hours for each monitor id.
+    :rtype: dict
+    """
+    heartbeats = {
+        int(monitor_id): [decode_heartbeat(heartbeat) for heartbeat in monitor_heartbeats]
+        for monitor_id, monitor_heartbeats in data["heartbeatList"].items()
+    }
+    uptime = {}
+    for key, value in data["uptimeList"].items():
+        monitor_id, _, hours = key.partition("_")
+        uptime.setdefault(int(monitor_id), {})[int(hours)] = value
+    return {"heartbeatList": heartbeats, "uptimeList": uptime}
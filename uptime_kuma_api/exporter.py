@@ -0,0 +1,387 @@
+from __future__ import annotations
+
+import argparse
+import math
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Optional
+
+from .api import UptimeKumaApi
+from .event import Event
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# name -> (type, help)
+metric_families = {
+    "monitor_status": ("gauge", "Monitor status (0 = down, 1 = up, 2 = pending, 3 = maintenance)"),
+    "monitor_response_time": ("gauge", "Response time of the last heartbeat in milliseconds"),
+    "monitor_avg_response_time": ("gauge", "Average response time of the last 24 hours in milliseconds"),
+    "monitor_uptime_ratio": ("gauge", "Uptime ratio of the window in hours"),
+    "monitor_cert_is_valid": ("gauge", "Whether the certificate is valid (1) or not (0)"),
+    "monitor_cert_days_remaining": ("gauge", "Days until the certificate expires"),
+    "monitor_last_heartbeat_timestamp_seconds": ("gauge", "Time when the last heartbeat was received"),
+    "uptime_kuma_exporter_events_total": ("counter", "Server events received by the exporter"),
+}
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: Any) -> str:
+    if value is None:
+        return "NaN"
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, float) and math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(value)
+
+
+class MetricsRegistry(object):
+    """In-memory registry of the exporter metrics in the Prometheus text format.
+
+    Each series is rendered to its text line when its value changes, and the complete output is
+    rendered only when a series has changed since the last scrape. Scrapes between changes return
+    the cached output.
+
+    Series of monitors carry the labels ``monitor_id``, ``monitor_name``, ``monitor_type``,
+    ``monitor_url`` and ``monitor_hostname`` once the monitor list was received.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # family -> series key -> rendered line
+        self._lines: dict = {family: {} for family in metric_families}
+        # (family, monitor id, extra labels) -> value
+        self._values: dict = {}
+        # monitor id -> rendered monitor labels
+        self._labels: dict = {}
+        # monitor id -> keys of self._values
+        self._monitor_keys: dict = {}
+        self._rendered: Optional[bytes] = None
+
+    def _monitor_labels(self, monitor_id: int) -> str:
+        try:
+            return self._labels[monitor_id]
+        except KeyError:
+            return f'monitor_id="{monitor_id}"'
+
+    def _render_line(self, family: str, monitor_id: Optional[int], extra: tuple, value: Any) -> str:
+        labels = []
+        if monitor_id is not None:
+            labels.append(self._monitor_labels(monitor_id))
+        labels.extend(f'{name}="{_escape(label)}"' for name, label in extra)
+        return f"{family}{{{','.join(labels)}}} {_format_value(value)}"
+
+    def set(self, family: str, monitor_id: Optional[int], value: Any, extra: tuple = ()) -> None:
+        """
+        Sets the value of a series.
+
+        :param str family: The metric name, one of :data:`metric_families`.
+        :param int monitor_id: The monitor id or ``None`` for series that do not belong to a monitor.
+        :param value: The value.
+        :param tuple, optional extra: Additional labels as tuples of name and value.
+        """
+        key = (family, monitor_id, extra)
+        with self._lock:
+            if self._values.get(key, self) == value:
+                return
+            self._values[key] = value
+            if monitor_id is not None:
+                self._monitor_keys.setdefault(monitor_id, set()).add(key)
+            self._lines[family][monitor_id, extra] = self._render_line(family, monitor_id, extra, value)
+            self._rendered = None
+
+    def inc(self, family: str, extra: tuple = (), amount: float = 1) -> None:
+        """
+        Increments a counter that does not belong to a monitor.
+
+        :param str family: The metric name, one of :data:`metric_families`.
+        :param tuple, optional extra: Labels as tuples of name and value.
+        :param float, optional amount: The increment, defaults to ``1``.
+        """
+        key = (family, None, extra)
+        with self._lock:
+            value = self._values.get(key, 0) + amount
+            self._values[key] = value
+            self._lines[family][None, extra] = self._render_line(family, None, extra, value)
+            self._rendered = None
+
+    def set_monitor_labels(self, monitor_id: int, labels: dict) -> None:
+        """
+        Sets the labels of a monitor and re-renders its series if they changed.
+
+        :param int monitor_id: The monitor id.
+        :param dict labels: The labels without ``monitor_id``.
+        """
+        rendered = ",".join(
+            [f'monitor_id="{monitor_id}"'] + [f'{name}="{_escape(value)}"' for name, value in labels.items()]
+        )
+        with self._lock:
+            if self._labels.get(monitor_id) == rendered:
+                return
+            self._labels[monitor_id] = rendered
+            for key in self._monitor_keys.get(monitor_id, ()):
+                family, _, extra = key
+                self._lines[family][monitor_id, extra] = self._render_line(
+                    family, monitor_id, extra, self._values[key]
+                )
+            self._rendered = None
+
+    def remove_monitor(self, monitor_id: int) -> None:
+        """
+        Removes all series of a monitor.
+
+        :param int monitor_id: The monitor id.
+        """
+        with self._lock:
+            self._labels.pop(monitor_id, None)
+            for key in self._monitor_keys.pop(monitor_id, ()):
+                family, _, extra = key
+                del self._values[key]
+                del self._lines[family][monitor_id, extra]
+            self._rendered = None
+
+    def monitor_ids(self) -> set:
+        """
+        Get the ids of the monitors that have labels or series.
+
+        :return: The monitor ids.
+        :rtype: set
+        """
+        with self._lock:
+            return set(self._labels) | set(self._monitor_keys)
+
+    def render(self) -> bytes:
+        """
+        Get the metrics in the Prometheus text format.
+
+        :return: The encoded metrics.
+        :rtype: bytes
+        """
+        rendered = self._rendered
+        if rendered is not None:
+            return rendered
+        with self._lock:
+            if self._rendered is None:
+                output = []
+                for family, lines in self._lines.items():
+                    if not lines:
+                        continue
+                    type_, help_ = metric_families[family]
+                    output.append(f"# HELP {family} {help_}")
+                    output.append(f"# TYPE {family} {type_}")
+                    output.extend(lines.values())
+                self._rendered = ("\n".join(output) + "\n").encode()
+            return self._rendered
+
+
+class UptimeKumaExporter(object):
+    """Updates a :class:`MetricsRegistry` from the server events of an :class:`~.UptimeKumaApi` instance.
+
+    The exporter listens for the ``monitorList``, ``heartbeatList``, ``heartbeat``, ``avgPing``,
+    ``uptime`` and ``certInfo`` events, so no getter is called and the cost of a scrape does not
+    depend on the number of monitors. Data that was already received by the instance is loaded when
+    the exporter is created.
+
+    Example::
+
+        >>> api = UptimeKumaApi('INSERT_URL')
+        >>> exporter = UptimeKumaExporter(api)
+        >>> api.login('INSERT_USERNAME', 'INSERT_PASSWORD')
+        >>> exporter.serve(port=9901)
+
+    :param UptimeKumaApi api: The connected instance.
+    :param MetricsRegistry, optional registry: The registry, defaults to a new registry.
+    """
+
+    def __init__(self, api: UptimeKumaApi, registry: MetricsRegistry = None) -> None:
+        self.api = api
+        self.registry = registry or MetricsRegistry()
+        self._listeners = {
+            Event.MONITOR_LIST: self._on_monitor_list,
+            Event.HEARTBEAT_LIST: self._on_heartbeat_list,
+            Event.HEARTBEAT: self._on_heartbeat,
+            Event.AVG_PING: self._on_avg_ping,
+            Event.UPTIME: self._on_uptime,
+            Event.CERT_INFO: self._on_cert_info,
+        }
+        self._load()
+        for event, listener in self._listeners.items():
+            api.add_event_listener(event, listener)
+
+    def close(self) -> None:
+        """
+        Stops listening for events.
+        """
+        for event, listener in self._listeners.items():
+            self.api.remove_event_listener(event, listener)
+
+    def _load(self) -> None:
+        # loads the data that was received before the exporter was created
+        event_data = self.api._event_data
+        if event_data[Event.MONITOR_LIST] is not None:
+            self._on_monitor_list(event_data[Event.MONITOR_LIST], count=False)
+        for monitor_id, heartbeats in (event_data[Event.HEARTBEAT_LIST] or {}).items():
+            self._on_heartbeat_list(monitor_id, heartbeats, True, count=False)
+        for monitor_id, avg_ping in (event_data[Event.AVG_PING] or {}).items():
+            self._on_avg_ping(monitor_id, avg_ping, count=False)
+        for monitor_id, uptimes in (event_data[Event.UPTIME] or {}).items():
+            for type_, uptime in uptimes.items():
+                self._on_uptime(monitor_id, type_, uptime, count=False)
+        cert_info = event_data[Event.CERT_INFO]
+        if cert_info:
+            for monitor_id, info in cert_info.to_dict().items():
+                self._set_cert_info(monitor_id, info)
+
+    def _count(self, event: Event) -> None:
+        self.registry.inc("uptime_kuma_exporter_events_total", (("event", event.value),))
+
+    def _on_monitor_list(self, monitors: dict, count: bool = True) -> None:
+        registry = self.registry
+        monitor_ids = set()
+        for monitor in monitors.values():
+            monitor_id = int(monitor["id"])
+            monitor_ids.add(monitor_id)
+            registry.set_monitor_labels(monitor_id, {
+                "monitor_name": monitor.get("name") or "",
+                "monitor_type": monitor.get("type") or "",
+                "monitor_url": monitor.get("url") or "",
+                "monitor_hostname": monitor.get("hostname") or "",
+            })
+        for monitor_id in registry.monitor_ids() - monitor_ids:
+            registry.remove_monitor(monitor_id)
+        if count:
+            self._count(Event.MONITOR_LIST)
+
+    def _set_heartbeat(self, monitor_id: int, heartbeat: dict) -> None:
+        registry = self.registry
+        registry.set("monitor_status", monitor_id, heartbeat.get("status"))
+        registry.set("monitor_response_time", monitor_id, heartbeat.get("ping"))
+        registry.set("monitor_last_heartbeat_timestamp_seconds", monitor_id, time.time())
+
+    def _on_heartbeat_list(self, monitor_id: int, heartbeats: list, overwrite: bool, count: bool = True) -> None:
+        if heartbeats:
+            # the list is sorted from old to new
+            self._set_heartbeat(int(monitor_id), heartbeats[-1])
+        if count:
+            self._count(Event.HEARTBEAT_LIST)
+
+    def _on_heartbeat(self, heartbeat: dict) -> None:
+        self._set_heartbeat(int(heartbeat["monitorID"]), heartbeat)
+        self._count(Event.HEARTBEAT)
+
+    def _on_avg_ping(self, monitor_id: int, avg_ping: Any, count: bool = True) -> None:
+        self.registry.set("monitor_avg_response_time", int(monitor_id), avg_ping)
+        if count:
+            self._count(Event.AVG_PING)
+
+    def _on_uptime(self, monitor_id: int, type_: Any, uptime: Any, count: bool = True) -> None:
+        self.registry.set("monitor_uptime_ratio", int(monitor_id), uptime, (("window", type_),))
+        if count:
+            self._count(Event.UPTIME)
+
+    def _set_cert_info(self, monitor_id: int, info: dict) -> None:
+        registry = self.registry
+        registry.set("monitor_cert_is_valid", monitor_id, bool(info.get("valid")))
+        cert = info.get("certInfo") or {}
+        if cert.get("daysRemaining") is not None:
+            registry.set("monitor_cert_days_remaining", monitor_id, cert["daysRemaining"])
+
+    def _on_cert_info(self, monitor_id: int, data: str) -> None:
+        self._set_cert_info(int(monitor_id), self.api._json.loads(data))
+        self._count(Event.CERT_INFO)
+
+    def make_server(self, host: str = "0.0.0.0", port: int = 9901) -> ThreadingHTTPServer:
+        """
+        Creates an HTTP server that serves the metrics at ``/metrics``.
+
+        :param str, optional host: The listen address, defaults to ``0.0.0.0``
+        :param int, optional port: The port, defaults to ``9901``
+        :return: The server. Call ``serve_forever()`` to handle requests.
+        :rtype: ThreadingHTTPServer
+        """
+        registry = self.registry
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?", 1)[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = registry.render()
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        server.daemon_threads = True
+        return server
+
+    def serve(self, host: str = "0.0.0.0", port: int = 9901) -> None:
+        """
+        Serves the metrics at ``/metrics`` until the process is stopped.
+
+        :param str, optional host: The listen address, defaults to ``0.0.0.0``
+        :param int, optional port: The port, defaults to ``9901``
+        """
+        server = self.make_server(host, port)
+        try:
+            server.serve_forever()
+        finally:
+            server.server_close()
+
+
+def main(argv: list = None) -> None:
+    """
+    Entry point of the ``uptime-kuma-exporter`` command.
+
+    :param list, optional argv: The command line arguments, defaults to ``sys.argv[1:]``.
+    """
+    parser = argparse.ArgumentParser(
+        prog="uptime-kuma-exporter",
+        description="Exports the monitor states of an Uptime Kuma server in the Prometheus format.",
+    )
+    parser.add_argument("--url", default=os.environ.get("UPTIME_KUMA_URL"),
+                        help="Uptime Kuma url, defaults to $UPTIME_KUMA_URL")
+    parser.add_argument("--username", default=os.environ.get("UPTIME_KUMA_USERNAME"),
+                        help="defaults to $UPTIME_KUMA_USERNAME, omit for servers with disabled auth")
+    parser.add_argument("--password", default=os.environ.get("UPTIME_KUMA_PASSWORD"),
+                        help="defaults to $UPTIME_KUMA_PASSWORD")
+    parser.add_argument("--timeout", type=float, default=10, help="api timeout in seconds, defaults to 10")
+    parser.add_argument("--no-ssl-verify", action="store_true", help="skip SSL certificate verification")
+    parser.add_argument("--listen-address", default="0.0.0.0", help="defaults to 0.0.0.0")
+    parser.add_argument("--port", type=int, default=9901, help="defaults to 9901")
+    args = parser.parse_args(argv)
+    if not args.url:
+        parser.error("--url or $UPTIME_KUMA_URL is required")
+
+    api = UptimeKumaApi(args.url, timeout=args.timeout, ssl_verify=not args.no_ssl_verify)
+    exporter = UptimeKumaExporter(api)
+
+    def login():
+        api.login(args.username, args.password)
+
+    def on_connect():
+        # the server forgets the login when the connection is lost,
+        # the login is not possible inside the event handler thread
+        threading.Thread(target=login, daemon=True).start()
+
+    login()
+    api.add_event_listener(Event.CONNECT, on_connect)
+    try:
+        exporter.serve(args.listen_address, args.port)
+    finally:
+        exporter.close()
+        api.disconnect()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,1316 @@
+from __future__ import annotations
+
+import base64
+import datetime
+import hashlib
+import hmac
+import json
+import os
+import random
+import re
+import secrets
+import struct
+import threading
+import time
+from socketserver import ThreadingMixIn
+from typing import Any, Callable, Optional
+from urllib.parse import parse_qs
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer, make_server
+
+import socketio
+
+
+def _now() -> str:
+    return datetime.datetime.now(datetime.timezone.utc).strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+
+
+def _totp(secret: str, counter: int) -> str:
+    # time based one-time password (RFC 6238) with the defaults of authenticator apps
+    digest = hmac.new(base64.b32decode(secret), struct.pack(">Q", counter), hashlib.sha1).digest()
+    offset = digest[-1] & 0x0F
+    code = struct.unpack(">I", digest[offset:offset + 4])[0] & 0x7FFFFFFF
+    return str(code % 1000000).zfill(6)
+
+
+def _verify_totp(secret: str, token: str) -> bool:
+    counter = int(time.time() // 30)
+    return any(_totp(secret, counter + i) == token for i in (-1, 0, 1))
+
+
+def make_monitor(id_: int) -> dict:
+    """
+    Creates a monitor with all fields that Uptime Kuma 1.23 sends.
+
+    :param int id_: The monitor id.
+    :return: The monitor.
+    :rtype: dict
+    """
+    return {
+        "id": id_,
+        "name": f"monitor {id_}",
+        "description": None,
+        "pathName": f"monitor {id_}",
+        "parent": None,
+        "childrenIDs": [],
+        "url": f"https://example{id_}.com",
+        "method": "GET",
+        "hostname": None,
+        "port": None,
+        "maxretries": 0,
+        "weight": 2000,
+        "active": 1,
+        "forceInactive": False,
+        "type": "http",
+        "timeout": 48,
+        "interval": 60,
+        "retryInterval": 60,
+        "resendInterval": 0,
+        "keyword": None,
+        "invertKeyword": False,
+        "expiryNotification": False,
+        "ignoreTls": False,
+        "upsideDown": False,
+        "packetSize": 56,
+        "maxredirects": 10,
+        "accepted_statuscodes": ["200-299"],
+        "dns_resolve_type": "A",
+        "dns_resolve_server": "1.1.1.1",
+        "dns_last_result": None,
+        "docker_container": None,
+        "docker_host": None,
+        "proxyId": None,
+        "notificationIDList": {"1": True, "2": True},
+        "tags": [],
+        "maintenance": False,
+        "mqttTopic": "",
+        "mqttSuccessMessage": "",
+        "databaseQuery": None,
+        "authMethod": None,
+        "grpcUrl": None,
+        "grpcProtobuf": None,
+        "grpcMethod": None,
+        "grpcServiceName": None,
+        "grpcEnableTls": False,
+        "radiusCalledStationId": None,
+        "radiusCallingStationId": None,
+        "game": None,
+        "gamedigGivenPortOnly": True,
+        "httpBodyEncoding": "json",
+        "jsonPath": None,
+        "expectedValue": None,
+        "kafkaProducerTopic": None,
+        "kafkaProducerBrokers": [],
+        "kafkaProducerSsl": False,
+        "kafkaProducerAllowAutoTopicCreation": False,
+        "kafkaProducerMessage": None,
+        "screenshot": None,
+        "headers": None,
+        "body": None,
+        "grpcBody": None,
+        "grpcMetadata": None,
+        "basic_auth_user": None,
+        "basic_auth_pass": None,
+        "oauth_client_id": None,
+        "oauth_client_secret": None,
+        "oauth_token_url": None,
+        "oauth_scopes": None,
+        "oauth_auth_method": "client_secret_basic",
+        "pushToken": None,
+        "databaseConnectionString": None,
+        "radiusUsername": None,
+        "radiusPassword": None,
+        "radiusSecret": None,
+        "mqttUsername": "",
+        "mqttPassword": "",
+        "authWorkstation": None,
+        "authDomain": None,
+        "tlsCa": None,
+        "tlsCert": None,
+        "tlsKey": None,
+        "kafkaProducerSaslOptions": {"mechanism": "None"},
+        "includeSensitiveData": True,
+    }
+
+
+def make_heartbeat(monitor_id: int, id_: int, important: bool = False, **kwargs) -> dict:
+    """
+    Creates a heartbeat like Uptime Kuma 1.23 sends it.
+
+    :param int monitor_id: The monitor id.
+    :param int id_: The heartbeat id.
+    :param bool, optional important: Whether the status has changed, defaults to False
+    :param kwargs: Fields that replace the defaults, e.g. ``status`` or ``ping``.
+    :return: The heartbeat.
+    :rtype: dict
+    """
+    heartbeat = {
+        "id": id_,
+        "monitor_id": monitor_id,
+        "status": 1,
+        "msg": "200 - OK",
+        "time": "2023-05-01 17:22:20.289",
+        "ping": 10.5,
+        "important": 1 if important else 0,
+        "duration": 60,
+        "down_count": 0,
+    }
+    heartbeat.update(kwargs)
+    return heartbeat
+
+
+default_settings = {
+    "checkBeta": False,
+    "checkUpdate": False,
+    "chromeExecutable": "",
+    "disableAuth": False,
+    "dnsCache": True,
+    "entryPage": "dashboard",
+    "keepDataPeriodDays": 180,
+    "nscd": False,
+    "primaryBaseURL": "",
+    "searchEngineIndex": False,
+    "serverTimezone": "UTC",
+    "steamAPIKey": "",
+    "tlsExpiryNotifyDays": [7, 14, 21],
+    "trustProxy": False,
+}
+
+game_list = [
+    {
+        "keys": ["minecraft"],
+        "pretty": "Minecraft (2009)",
+        "options": {"port": 25565, "protocol": "minecraft"},
+        "extra": {},
+    },
+]
+
+
+class _ThreadingWSGIServer(ThreadingMixIn, WSGIServer):
+    daemon_threads = True
+
+
+class _RequestHandler(WSGIRequestHandler):
+    def get_environ(self):
+        environ = super().get_environ()
+        # lets simple-websocket take over the connection for the websocket transport
+        environ["werkzeug.socket"] = self.connection
+        return environ
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeUptimeKumaServer(object):
+    """In-process stand-in for an Uptime Kuma server, used for tests and benchmarks without Docker.
+
+    The server implements the Socket.IO events and REST endpoints that :class:`~.UptimeKumaApi` uses
+    with the response formats of Uptime Kuma 1.23. It keeps all data in memory and does not run any checks.
+    Heartbeats are only created by :meth:`push_heartbeats` or by the ``heartbeat_interval`` option.
+    Events that are not implemented are answered with an error.
+
+    The Socket.IO server runs in threading mode on a local WSGI server and supports the websocket transport.
+
+    Example::
+
+        >>> with FakeUptimeKumaServer(monitors=100, latency=0.005) as server:
+        ...     with UptimeKumaApi(server.url) as api:
+        ...         api.login(server.username, server.password)
+        ...         monitors = api.get_monitors()
+
+    :param str, optional host: The listen address, defaults to ``127.0.0.1``
+    :param int, optional port: The port, defaults to ``0`` (a free port)
+    :param str, optional version: The reported Uptime Kuma version, defaults to ``1.23.2``
+    :param str, optional username: The username of the existing user or ``None`` for a server that needs the setup,
+                                   defaults to ``admin``
+    :param str, optional password: The password of the existing user, defaults to ``secret123``
+    :param bool, optional disable_auth: Log in every client automatically, defaults to False
+    :param float, optional latency: Seconds each event handler waits before it answers, defaults to ``0``
+    :param float, optional jitter: Additional random delay of up to this many seconds, defaults to ``0``
+    :param int, optional seed: Seed of the random generator for jitter and heartbeat values, defaults to ``0``
+    :param int, optional monitors: Number of HTTP monitors the server starts with, defaults to ``0``
+    :param int, optional heartbeats: Number of heartbeats of each initial monitor, defaults to ``0``
+    :param float, optional heartbeat_interval: Push a heartbeat of each active monitor every this many seconds,
+                                               defaults to ``None`` (disabled)
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        version: str = "1.23.2",
+        username: Optional[str] = "admin",
+        password: str = "secret123",
+        disable_auth: bool = False,
+        latency: float = 0,
+        jitter: float = 0,
+        seed: int = 0,
+        monitors: int = 0,
+        heartbeats: int = 0,
+        heartbeat_interval: float = None,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.version = version
+        self.username = username
+        self.password = password
+        self.disable_auth = disable_auth
+        self.latency = latency
+        self.jitter = jitter
+        self.heartbeat_interval = heartbeat_interval
+
+        self._random = random.Random(seed)
+        self._lock = threading.RLock()
+        self._users = {username: password} if username is not None else {}
+        self._tokens: set = set()
+        self._twofa_secret: Optional[str] = None
+        self._twofa_active = False
+        self._sessions: set = set()
+        self._ids: dict = {}
+
+        self.monitors: dict = {}
+        self.heartbeats: dict = {}
+        self.notifications: dict = {}
+        self.proxies: dict = {}
+        self.docker_hosts: dict = {}
+        self.tags: dict = {}
+        self.monitor_tags: dict = {}
+        self.status_pages: dict = {}
+        self.maintenances: dict = {}
+        self.maintenance_monitors: dict = {}
+        self.maintenance_status_pages: dict = {}
+        self.api_keys: dict = {}
+        self._api_key_values: dict = {}
+        self.settings = dict(default_settings)
+
+        for _ in range(monitors):
+            monitor_id = self._next_id("monitor")
+            self.monitors[monitor_id] = make_monitor(monitor_id)
+            self.heartbeats[monitor_id] = []
+            for i in range(heartbeats):
+                self._add_heartbeat(monitor_id, important=(i == 0))
+
+        self.sio = socketio.Server(async_mode="threading")
+        self._sio_app = socketio.WSGIApp(self.sio, self._rest_app)
+        self._server = None
+        self._threads: list = []
+        self._stopped = threading.Event()
+
+        self.sio.on("connect", self._on_connect)
+        self.sio.on("disconnect", self._on_disconnect)
+        self.sio.on("*", self._on_unknown_event)
+        public_events = {"needSetup", "setup", "login", "loginByToken"}
+        for event, handler in self._handlers().items():
+            self.sio.on(event, self._wrap(handler, event not in public_events))
+
+    # lifecycle
+
+    @property
+    def url(self) -> str:
+        """The url of the running server, e.g. ``http://127.0.0.1:41523``."""
+        return f"http://{self.host}:{self.port}"
+
+    def start(self) -> None:
+        """
+        Starts the server in background threads.
+        """
+        self._server = make_server(
+            self.host, self.port, self.app, server_class=_ThreadingWSGIServer, handler_class=_RequestHandler
+        )
+        self.port = self._server.server_address[1]
+        self._stopped.clear()
+        self._start_thread(self._server.serve_forever)
+        if self.heartbeat_interval:
+            self._start_thread(self._heartbeat_loop)
+
+    def stop(self) -> None:
+        """
+        Stops the server.
+        """
+        self._stopped.set()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+    def __enter__(self) -> FakeUptimeKumaServer:
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+    def _start_thread(self, target: Callable) -> None:
+        thread = threading.Thread(target=target, daemon=True)
+        thread.start()
+        self._threads.append(thread)
+
+    def app(self, environ: dict, start_response: Callable) -> list:
+        """
+        The WSGI application of the server.
+        """
+        try:
+            return self._sio_app(environ, start_response)
+        except ConnectionError:
+            # simple-websocket signals the end of a websocket connection with ConnectionError,
+            # the WSGI server ignores ConnectionAbortedError
+            raise ConnectionAbortedError()
+
+    def _heartbeat_loop(self) -> None:
+        while not self._stopped.wait(self.heartbeat_interval):
+            self.push_heartbeats()
+
+    # helpers
+
+    def _next_id(self, kind: str) -> int:
+        self._ids[kind] = self._ids.get(kind, 0) + 1
+        return self._ids[kind]
+
+    def _delay(self) -> None:
+        if self.latency or self.jitter:
+            with self._lock:
+                jitter = self._random.uniform(0, self.jitter) if self.jitter else 0
+            time.sleep(self.latency + jitter)
+
+    def _wrap(self, handler: Callable, requires_login: bool) -> Callable:
+        def wrapper(sid, *args):
+            self._delay()
+            if requires_login and sid not in self._sessions:
+                return {"ok": False, "msg": "You are not logged in."}
+            try:
+                with self._lock:
+                    return handler(sid, *args)
+            except _Error as e:
+                return {"ok": False, "msg": str(e)}
+
+        return wrapper
+
+    def _emit(self, event: str, data: Any = None, to: str = "users") -> None:
+        self.sio.emit(event, data, to=to)
+
+    # events that the server sends
+
+    def _info(self, logged_in: bool) -> dict:
+        info = {
+            "primaryBaseURL": self.settings["primaryBaseURL"] or None,
+            "serverTimezone": "UTC",
+            "serverTimezoneOffset": "+00:00",
+        }
+        if logged_in:
+            info.update({"version": self.version, "latestVersion": self.version, "isContainer": False})
+        return info
+
+    def _monitor_json(self, monitor_id: int) -> dict:
+        monitor = dict(self.monitors[monitor_id])
+        monitor["tags"] = [
+            {**monitor_tag, "name": self.tags[monitor_tag["tag_id"]]["name"],
+             "color": self.tags[monitor_tag["tag_id"]]["color"]}
+            for monitor_tag in self.monitor_tags.get(monitor_id, [])
+        ]
+        monitor["maintenance"] = any(
+            monitor_id in [i["id"] for i in self.maintenance_monitors.get(maintenance_id, [])]
+            and maintenance["status"] == "under-maintenance"
+            for maintenance_id, maintenance in self.maintenances.items()
+        )
+        return monitor
+
+    def _send_monitor_list(self, to: str = "users") -> None:
+        self._emit("monitorList", {str(i): self._monitor_json(i) for i in self.monitors}, to)
+
+    def _send_notification_list(self, to: str = "users") -> None:
+        self._emit("notificationList", list(self.notifications.values()), to)
+
+    def _send_proxy_list(self, to: str = "users") -> None:
+        self._emit("proxyList", list(self.proxies.values()), to)
+
+    def _send_docker_host_list(self, to: str = "users") -> None:
+        self._emit("dockerHostList", list(self.docker_hosts.values()), to)
+
+    def _send_status_page_list(self, to: str = "users") -> None:
+        self._emit("statusPageList", {str(i["id"]): self._status_page_json(i) for i in self.status_pages.values()}, to)
+
+    def _send_maintenance_list(self, to: str = "users") -> None:
+        self._emit("maintenanceList", {str(i): self.maintenances[i] for i in self.maintenances}, to)
+
+    def _send_api_key_list(self, to: str = "users") -> None:
+        self._emit("apiKeyList", list(self.api_keys.values()), to)
+
+    def _send_heartbeat_data(self, to: str) -> None:
+        for monitor_id in self.monitors:
+            heartbeats = self.heartbeats.get(monitor_id, [])
+            important = [i for i in heartbeats if i["important"]]
+            self._emit("heartbeatList", (monitor_id, heartbeats[-100:], True), to)
+            self._emit("importantHeartbeatList", (monitor_id, important[::-1][:500], True), to)
+            self._send_statistics(monitor_id, to)
+
+    def _send_statistics(self, monitor_id: int, to: str = "users") -> None:
+        heartbeats = self.heartbeats.get(monitor_id, [])
+        pings = [i["ping"] for i in heartbeats if i["ping"] is not None]
+        avg_ping = round(sum(pings) / len(pings)) if pings else None
+        uptime = sum(i["status"] == 1 for i in heartbeats) / len(heartbeats) if heartbeats else 0
+        self._emit("avgPing", (monitor_id, avg_ping), to)
+        self._emit("uptime", (monitor_id, 24, uptime), to)
+        self._emit("uptime", (monitor_id, 720, uptime), to)
+        url = self.monitors[monitor_id].get("url") or ""
+        if self.monitors[monitor_id]["type"] in ["http", "keyword", "json-query"] and url.startswith("https"):
+            cert_info = {"valid": True, "certInfo": {"subject": {"CN": url}, "daysRemaining": 60}}
+            self._emit("certInfo", (monitor_id, json.dumps(cert_info)), to)
+
+    def _after_login(self, sid: str) -> None:
+        self._sessions.add(sid)
+        self.sio.enter_room(sid, "users")
+        self._emit("info", self._info(True), sid)
+        self._send_monitor_list(sid)
+        self._send_notification_list(sid)
+        self._send_proxy_list(sid)
+        self._send_status_page_list(sid)
+        self._send_docker_host_list(sid)
+        self._send_maintenance_list(sid)
+        self._send_api_key_list(sid)
+        self._send_heartbeat_data(sid)
+
+    def _add_heartbeat(self, monitor_id: int, important: bool = False, **kwargs) -> dict:
+        kwargs.setdefault("time", _now())
+        kwargs.setdefault("ping", round(self._random.uniform(5, 50), 1))
+        heartbeat = make_heartbeat(monitor_id, self._next_id("heartbeat"), important, **kwargs)
+        heartbeats = self.heartbeats.setdefault(monitor_id, [])
+        heartbeats.append(heartbeat)
+        if len(heartbeats) > 1000:
+            del heartbeats[0]
+        return heartbeat
+
+    def _beat(self, monitor_id: int, status: int = 1, **kwargs) -> None:
+        # creates a heartbeat of the monitor and sends it like a finished check
+        heartbeats = self.heartbeats.get(monitor_id)
+        important = not heartbeats or heartbeats[-1]["status"] != status
+        heartbeat = self._add_heartbeat(monitor_id, important, status=status, **kwargs)
+        self._emit("heartbeat", {**heartbeat, "monitorID": monitor_id})
+        self._send_statistics(monitor_id)
+
+    def push_heartbeats(self, status: int = 1) -> None:
+        """
+        Creates a heartbeat for each active monitor and sends it to the logged in clients.
+
+        :param int, optional status: The status of the heartbeats, defaults to ``1`` (up).
+        """
+        with self._lock:
+            for monitor_id, monitor in self.monitors.items():
+                if monitor["active"]:
+                    self._beat(monitor_id, status)
+
+    # connection
+
+    def _on_connect(self, sid, environ, auth=None) -> None:
+        self._emit("info", self._info(False), sid)
+        if self.disable_auth or self.settings["disableAuth"]:
+            self._emit("autoLogin", None, sid)
+            with self._lock:
+                self._after_login(sid)
+
+    def _on_disconnect(self, sid, *args) -> None:
+        self._sessions.discard(sid)
+
+    def _on_unknown_event(self, event, sid, *args) -> dict:
+        return {"ok": False, "msg": f"Event {event} is not supported by the fake server"}
+
+    def _handlers(self) -> dict:
+        return {
+            "needSetup": self._need_setup,
+            "setup": self._setup,
+            "login": self._login,
+            "loginByToken": self._login_by_token,
+            "logout": self._logout,
+            "add": self._add_monitor,
+            "editMonitor": self._edit_monitor,
+            "getMonitor": self._get_monitor,
+            "getMonitorBeats": self._get_monitor_beats,
+            "pauseMonitor": self._pause_monitor,
+            "resumeMonitor": self._resume_monitor,
+            "deleteMonitor": self._delete_monitor,
+            "getTags": self._get_tags,
+            "addTag": self._add_tag,
+            "editTag": self._edit_tag,
+            "deleteTag": self._delete_tag,
+            "addMonitorTag": self._add_monitor_tag,
+            "deleteMonitorTag": self._delete_monitor_tag,
+            "addNotification": self._add_notification,
+            "deleteNotification": self._delete_notification,
+            "testNotification": self._ok,
+            "checkApprise": lambda sid: False,
+            "addProxy": self._add_proxy,
+            "deleteProxy": self._delete_proxy,
+            "addStatusPage": self._add_status_page,
+            "getStatusPage": self._get_status_page,
+            "saveStatusPage": self._save_status_page,
+            "deleteStatusPage": self._delete_status_page,
+            "postIncident": self._post_incident,
+            "unpinIncident": self._unpin_incident,
+            "clearEvents": self._clear_events,
+            "clearHeartbeats": self._clear_heartbeats,
+            "clearStatistics": self._clear_statistics,
+            "getSettings": lambda sid: {"ok": True, "data": dict(self.settings)},
+            "setSettings": self._set_settings,
+            "changePassword": self._change_password,
+            "uploadBackup": self._upload_backup,
+            "twoFAStatus": lambda sid: {"ok": True, "status": self._twofa_active},
+            "prepare2FA": self._prepare_2fa,
+            "verifyToken": self._verify_token,
+            "save2FA": self._save_2fa,
+            "disable2FA": self._disable_2fa,
+            "getDatabaseSize": lambda sid: {"ok": True, "size": 4096 + 512 * len(self.monitors)},
+            "shrinkDatabase": self._ok,
+            "addDockerHost": self._add_docker_host,
+            "deleteDockerHost": self._delete_docker_host,
+            "testDockerHost": self._test_docker_host,
+            "addMaintenance": self._add_maintenance,
+            "editMaintenance": self._edit_maintenance,
+            "getMaintenance": self._get_maintenance,
+            "deleteMaintenance": self._delete_maintenance,
+            "pauseMaintenance": self._pause_maintenance,
+            "resumeMaintenance": self._resume_maintenance,
+            "getMonitorMaintenance": self._get_monitor_maintenance,
+            "addMonitorMaintenance": self._add_monitor_maintenance,
+            "getMaintenanceStatusPage": self._get_maintenance_status_page,
+            "addMaintenanceStatusPage": self._add_maintenance_status_page,
+            "addAPIKey": self._add_api_key,
+            "enableAPIKey": self._enable_api_key,
+            "disableAPIKey": self._disable_api_key,
+            "deleteAPIKey": self._delete_api_key,
+            "getGameList": lambda sid: {"ok": True, "gameList": game_list},
+            "testChrome": lambda sid, *args: {"ok": True, "msg": "Found Chromium/Chrome. Version: 0"},
+        }
+
+    def _ok(self, sid, *args) -> dict:
+        return {"ok": True}
+
+    # auth
+
+    def _need_setup(self, sid) -> bool:
+        return not self._users
+
+    def _setup(self, sid, username, password) -> dict:
+        if self._users:
+            raise _Error("Uptime Kuma has been initialized. If you want to run setup again, please delete the database.")
+        self._users[username] = password
+        return {"ok": True, "msg": "Added Successfully."}
+
+    def _login(self, sid, data) -> dict:
+        if self._users.get(data.get("username")) != data.get("password") or data.get("username") is None:
+            raise _Error("Incorrect username or password.")
+        if self._twofa_active:
+            if not data.get("token"):
+                return {"tokenRequired": True}
+            if not _verify_totp(self._twofa_secret, data["token"]):
+                raise _Error("Invalid Token!")
+        token = secrets.token_urlsafe(32)
+        self._tokens.add(token)
+        self._after_login(sid)
+        return {"ok": True, "token": token}
+
+    def _login_by_token(self, sid, token) -> dict:
+        if token not in self._tokens:
+            raise _Error("Invalid token.")
+        self._after_login(sid)
+        return {"ok": True}
+
+    def _check_password(self, password: str) -> None:
+        if password not in self._users.values():
+            raise _Error("Incorrect current password")
+
+    def _prepare_2fa(self, sid, password) -> dict:
+        self._check_password(password)
+        if self._twofa_active:
+            raise _Error("2FA is already enabled.")
+        self._twofa_secret = base64.b32encode(secrets.token_bytes(20)).decode()
+        uri = f"otpauth://totp/Uptime%20Kuma:{self.username}?secret={self._twofa_secret}"
+        return {"ok": True, "uri": uri}
+
+    def _verify_token(self, sid, token, password) -> dict:
+        self._check_password(password)
+        return {"ok": True, "valid": bool(self._twofa_secret) and _verify_totp(self._twofa_secret, token)}
+
+    def _save_2fa(self, sid, password) -> dict:
+        self._check_password(password)
+        self._twofa_active = True
+        return {"ok": True, "msg": "2FA Enabled."}
+
+    def _disable_2fa(self, sid, password) -> dict:
+        self._check_password(password)
+        self._twofa_active = False
+        self._twofa_secret = None
+        return {"ok": True, "msg": "2FA Disabled."}
+
+    def _logout(self, sid) -> None:
+        self._sessions.discard(sid)
+        self.sio.leave_room(sid, "users")
+
+    # monitors
+
+    def _require(self, items: dict, id_: Any, name: str) -> dict:
+        try:
+            return items[int(id_)]
+        except (KeyError, TypeError, ValueError):
+            raise _Error(f"{name} not found")
+
+    def _add_monitor(self, sid, data) -> dict:
+        monitor_id = self._next_id("monitor")
+        monitor = make_monitor(monitor_id)
+        monitor.update(data)
+        monitor.update({"id": monitor_id, "pathName": monitor["name"], "active": 1})
+        self.monitors[monitor_id] = monitor
+        self.heartbeats[monitor_id] = []
+        self._send_monitor_list()
+        # the first check finishes immediately
+        self._beat(monitor_id)
+        return {"ok": True, "msg": "Added Successfully.", "monitorID": monitor_id}
+
+    def _edit_monitor(self, sid, data) -> dict:
+        monitor = self._require(self.monitors, data.get("id"), "Monitor")
+        for key in ["id", "active", "tags", "maintenance"]:
+            data.pop(key, None)
+        monitor.update(data)
+        monitor["pathName"] = monitor["name"]
+        self._send_monitor_list()
+        return {"ok": True, "msg": "Saved.", "monitorID": monitor["id"]}
+
+    def _get_monitor(self, sid, monitor_id) -> dict:
+        self._require(self.monitors, monitor_id, "Monitor")
+        return {"ok": True, "monitor": self._monitor_json(int(monitor_id))}
+
+    def _get_monitor_beats(self, sid, monitor_id, period) -> dict:
+        self._require(self.monitors, monitor_id, "Monitor")
+        return {"ok": True, "data": list(self.heartbeats.get(int(monitor_id), []))}
+
+    def _set_monitor_active(self, monitor_id: Any, active: int) -> None:
+        monitor = self._require(self.monitors, monitor_id, "Monitor")
+        monitor["active"] = active
+        self._send_monitor_list()
+
+    def _pause_monitor(self, sid, monitor_id) -> dict:
+        self._set_monitor_active(monitor_id, 0)
+        return {"ok": True, "msg": "Paused Successfully."}
+
+    def _resume_monitor(self, sid, monitor_id) -> dict:
+        self._set_monitor_active(monitor_id, 1)
+        self._beat(int(monitor_id))
+        return {"ok": True, "msg": "Resumed Successfully."}
+
+    def _delete_monitor(self, sid, monitor_id) -> dict:
+        self._require(self.monitors, monitor_id, "Monitor")
+        monitor_id = int(monitor_id)
+        del self.monitors[monitor_id]
+        self.heartbeats.pop(monitor_id, None)
+        self.monitor_tags.pop(monitor_id, None)
+        for monitors in self.maintenance_monitors.values():
+            monitors[:] = [i for i in monitors if i["id"] != monitor_id]
+        for status_page in self.status_pages.values():
+            for group in status_page["publicGroupList"]:
+                group["monitorList"] = [i for i in group["monitorList"] if i["id"] != monitor_id]
+        self._send_monitor_list()
+        return {"ok": True, "msg": "Deleted Successfully."}
+
+    # tags
+
+    def _get_tags(self, sid) -> dict:
+        return {"ok": True, "tags": list(self.tags.values())}
+
+    def _add_tag(self, sid, data) -> dict:
+        tag_id = self._next_id("tag")
+        tag = {"id": tag_id, "name": data["name"], "color": data["color"]}
+        self.tags[tag_id] = tag
+        return {"ok": True, "tag": dict(tag)}
+
+    def _edit_tag(self, sid, data) -> dict:
+        tag = self._require(self.tags, data.get("id"), "Tag")
+        tag.update({"name": data["name"], "color": data["color"]})
+        return {"ok": True, "msg": "Saved", "tag": dict(tag)}
+
+    def _delete_tag(self, sid, tag_id) -> dict:
+        self._require(self.tags, tag_id, "Tag")
+        del self.tags[int(tag_id)]
+        for monitor_tags in self.monitor_tags.values():
+            monitor_tags[:] = [i for i in monitor_tags if i["tag_id"] != int(tag_id)]
+        return {"ok": True, "msg": "Deleted Successfully."}
+
+    def _add_monitor_tag(self, sid, tag_id, monitor_id, value) -> dict:
+        self._require(self.tags, tag_id, "Tag")
+        self._require(self.monitors, monitor_id, "Monitor")
+        self.monitor_tags.setdefault(int(monitor_id), []).append({
+            "id": self._next_id("monitor_tag"),
+            "monitor_id": int(monitor_id),
+            "tag_id": int(tag_id),
+            "value": value,
+        })
+        return {"ok": True, "msg": "Added Successfully."}
+
+    def _delete_monitor_tag(self, sid, tag_id, monitor_id, value) -> dict:
+        monitor_tags = self.monitor_tags.get(int(monitor_id), [])
+        monitor_tags[:] = [
+            i for i in monitor_tags if not (i["tag_id"] == int(tag_id) and i["value"] == value)
+        ]
+        return {"ok": True, "msg": "Deleted Successfully."}
+
+    # notifications
+
+    def _add_notification(self, sid, data, notification_id) -> dict:
+        if notification_id is None:
+            notification_id = self._next_id("notification")
+        else:
+            self._require(self.notifications, notification_id, "Notification")
+        notification_id = int(notification_id)
+        self.notifications[notification_id] = {
+            "id": notification_id,
+            "name": data.get("name"),
+            "active": True,
+            "userId": 1,
+            "isDefault": bool(data.get("isDefault")),
+            "config": json.dumps(data),
+        }
+        if data.get("applyExisting"):
+            for monitor in self.monitors.values():
+                monitor["notificationIDList"] = {**(monitor["notificationIDList"] or {}), str(notification_id): True}
+            self._send_monitor_list()
+        self._send_notification_list()
+        return {"ok": True, "msg": "Saved", "id": notification_id}
+
+    def _delete_notification(self, sid, notification_id) -> dict:
+        self._require(self.notifications, notification_id, "Notification")
+        del self.notifications[int(notification_id)]
+        for monitor in self.monitors.values():
+            (monitor["notificationIDList"] or {}).pop(str(notification_id), None)
+        self._send_notification_list()
+        return {"ok": True, "msg": "Deleted"}
+
+    # proxies
+
+    def _add_proxy(self, sid, data, proxy_id) -> dict:
+        if proxy_id is None:
+            proxy_id = self._next_id("proxy")
+            created_date = _now()[:19]
+        else:
+            created_date = self._require(self.proxies, proxy_id, "Proxy")["createdDate"]
+        proxy_id = int(proxy_id)
+        if data.get("default"):
+            for proxy in self.proxies.values():
+                proxy["default"] = False
+        self.proxies[proxy_id] = {
+            "id": proxy_id,
+            "userId": 1,
+            "protocol": data.get("protocol"),
+            "host": data.get("host"),
+            "port": data.get("port"),
+            "auth": bool(data.get("auth")),
+            "username": data.get("username"),
+            "password": data.get("password"),
+            "active": data.get("active", True),
+            "default": bool(data.get("default")),
+            "createdDate": created_date,
+        }
+        if data.get("applyExisting"):
+            for monitor in self.monitors.values():
+                monitor["proxyId"] = proxy_id
+            self._send_monitor_list()
+        self._send_proxy_list()
+        return {"ok": True, "msg": "Saved", "id": proxy_id}
+
+    def _delete_proxy(self, sid, proxy_id) -> dict:
+        self._require(self.proxies, proxy_id, "Proxy")
+        del self.proxies[int(proxy_id)]
+        for monitor in self.monitors.values():
+            if monitor["proxyId"] == int(proxy_id):
+                monitor["proxyId"] = None
+        self._send_proxy_list()
+        self._send_monitor_list()
+        return {"ok": True, "msg": "Deleted"}
+
+    # status pages
+
+    def _status_page_by_slug(self, slug: str) -> dict:
+        for status_page in self.status_pages.values():
+            if status_page["slug"] == slug:
+                return status_page
+        raise _Error("No slug?")
+
+    @staticmethod
+    def _status_page_json(status_page: dict) -> dict:
+        return {key: value for key, value in status_page.items() if key not in ["publicGroupList", "incident"]}
+
+    def _add_status_page(self, sid, title, slug) -> dict:
+        slug = slug.strip().lower()
+        if not re.match(r"^[a-z0-9-]+$", slug):
+            raise _Error("Accept characters: a-z 0-9 -")
+        if any(i["slug"] == slug for i in self.status_pages.values()):
+            raise _Error("Slug already taken")
+        status_page_id = self._next_id("status_page")
+        self.status_pages[status_page_id] = {
+            "id": status_page_id,
+            "slug": slug,
+            "title": title,
+            "description": None,
+            "icon": "/icon.svg",
+            "theme": "auto",
+            "published": True,
+            "showTags": False,
+            "domainNameList": [],
+            "customCSS": "",
+            "footerText": None,
+            "showPoweredBy": True,
+            "googleAnalyticsId": None,
+            "showCertificateExpiry": False,
+            "publicGroupList": [],
+            "incident": None,
+        }
+        self._send_status_page_list()
+        return {"ok": True, "msg": "OK!"}
+
+    def _get_status_page(self, sid, slug) -> dict:
+        return {"ok": True, "config": self._status_page_json(self._status_page_by_slug(slug))}
+
+    def _save_status_page(self, sid, slug, config, img_data_url, public_group_list) -> dict:
+        status_page = self._status_page_by_slug(slug)
+        for key in [
+            "slug", "title", "description", "theme", "published", "showTags", "domainNameList",
+            "googleAnalyticsId", "customCSS", "footerText", "showPoweredBy", "showCertificateExpiry",
+        ]:
+            if key in config:
+                status_page[key] = config[key]
+        if isinstance(img_data_url, str) and img_data_url.startswith("data:"):
+            status_page["icon"] = f"/upload/logo{status_page['id']}.png?t={int(time.time())}"
+        elif img_data_url:
+            status_page["icon"] = img_data_url
+        groups = []
+        for i, group in enumerate(public_group_list or []):
+            groups.append({
+                "id": group.get("id") or self._next_id("group"),
+                "name": group.get("name"),
+                "weight": i + 1,
+                "monitorList": [{"id": monitor["id"]} for monitor in group.get("monitorList", [])],
+            })
+        status_page["publicGroupList"] = groups
+        return {"ok": True, "publicGroupList": groups}
+
+    def _delete_status_page(self, sid, slug) -> dict:
+        status_page = self._status_page_by_slug(slug)
+        del self.status_pages[status_page["id"]]
+        for status_pages in self.maintenance_status_pages.values():
+            status_pages[:] = [i for i in status_pages if i["id"] != status_page["id"]]
+        return {"ok": True}
+
+    def _post_incident(self, sid, slug, data) -> dict:
+        status_page = self._status_page_by_slug(slug)
+        incident = status_page["incident"]
+        if not data.get("id") or not incident:
+            incident = {"id": self._next_id("incident"), "createdDate": _now()[:19], "lastUpdatedDate": None}
+        else:
+            incident = dict(incident, lastUpdatedDate=_now()[:19])
+        incident.update({
+            "title": data["title"],
+            "content": data["content"],
+            "style": data["style"],
+            "pin": True,
+        })
+        status_page["incident"] = incident
+        return {"ok": True, "incident": dict(incident)}
+
+    def _unpin_incident(self, sid, slug) -> dict:
+        self._status_page_by_slug(slug)["incident"] = None
+        return {"ok": True}
+
+    def _public_status_page(self, slug: str) -> Optional[dict]:
+        try:
+            status_page = self._status_page_by_slug(slug)
+        except _Error:
+            return None
+        groups = []
+        for group in status_page["publicGroupList"]:
+            monitors = []
+            for monitor in group["monitorList"]:
+                if monitor["id"] in self.monitors:
+                    monitor_json = self._monitor_json(monitor["id"])
+                    item = {
+                        "id": monitor["id"],
+                        "name": monitor_json["name"],
+                        "sendUrl": 0,
+                        "type": monitor_json["type"],
+                    }
+                    if status_page["showTags"]:
+                        item["tags"] = monitor_json["tags"]
+                    monitors.append(item)
+            groups.append({**group, "monitorList": monitors})
+        maintenance_list = [
+            {key: maintenance[key] for key in ["id", "title", "description", "strategy", "active", "status"]}
+            for maintenance_id, maintenance in self.maintenances.items()
+            if maintenance["status"] == "under-maintenance"
+            and status_page["id"] in [i["id"] for i in self.maintenance_status_pages.get(maintenance_id, [])]
+        ]
+        return {
+            "config": self._status_page_json(status_page),
+            "incident": status_page["incident"],
+            "publicGroupList": groups,
+            "maintenanceList": maintenance_list,
+        }
+
+    # heartbeats
+
+    def _clear_events(self, sid, monitor_id) -> dict:
+        for heartbeat in self.heartbeats.get(int(monitor_id), []):
+            heartbeat["important"] = 0
+        return {"ok": True}
+
+    def _clear_heartbeats(self, sid, monitor_id) -> dict:
+        self.heartbeats[int(monitor_id)] = []
+        return {"ok": True}
+
+    def _clear_statistics(self, sid) -> dict:
+        for monitor_id in self.heartbeats:
+            self.heartbeats[monitor_id] = []
+        return {"ok": True}
+
+    # settings
+
+    def _set_settings(self, sid, data, password=None) -> dict:
+        if data.get("disableAuth") and self._users and password not in self._users.values():
+            raise _Error("Incorrect current password")
+        self.settings.update(data)
+        return {"ok": True, "msg": "Saved"}
+
+    def _change_password(self, sid, data) -> dict:
+        username = self.username if self.username in self._users else next(iter(self._users), None)
+        if self._users.get(username) != data.get("currentPassword"):
+            raise _Error("Incorrect current password")
+        self._users[username] = data["newPassword"]
+        self.password = data["newPassword"]
+        return {"ok": True, "msg": "Password has been updated successfully."}
+
+    def _upload_backup(self, sid, data, import_handle) -> dict:
+        backup = json.loads(data)
+        if import_handle == "overwrite":
+            self.monitors.clear()
+            self.heartbeats.clear()
+            self.monitor_tags.clear()
+            self.notifications.clear()
+            self.proxies.clear()
+        notification_ids = {}
+        for notification in backup.get("notificationList") or []:
+            existing = [i for i in self.notifications.values() if i["name"] == notification["name"]]
+            if import_handle == "skip" and existing:
+                notification_ids[str(notification["id"])] = existing[0]["id"]
+                continue
+            config = json.loads(notification["config"]) if notification.get("config") else {}
+            notification_id = self._add_notification(sid, {**config, "name": notification["name"]}, None)["id"]
+            notification_ids[str(notification["id"])] = notification_id
+        proxy_ids = {}
+        for proxy in backup.get("proxyList") or []:
+            proxy_ids[proxy["id"]] = self._add_proxy(sid, proxy, None)["id"]
+        monitor_ids = {}
+        for monitor in backup.get("monitorList") or []:
+            existing = [i for i in self.monitors.values() if i["name"] == monitor["name"]]
+            if import_handle == "skip" and existing:
+                continue
+            monitor = dict(monitor)
+            old_id = monitor.pop("id", None)
+            tags = monitor.pop("tags", None) or []
+            monitor["notificationIDList"] = {
+                str(notification_ids[key]): True
+                for key in (monitor.get("notificationIDList") or {}) if key in notification_ids
+            }
+            monitor["proxyId"] = proxy_ids.get(monitor.get("proxyId"))
+            monitor_id = self._add_monitor(sid, monitor)["monitorID"]
+            monitor_ids[old_id] = monitor_id
+            for tag in tags:
+                tag_id = next((i["id"] for i in self.tags.values() if i["name"] == tag["name"]), None)
+                if tag_id is None:
+                    tag_id = self._add_tag(sid, tag)["tag"]["id"]
+                self._add_monitor_tag(sid, tag_id, monitor_id, tag.get("value", ""))
+        for monitor_id in monitor_ids.values():
+            parent = self.monitors[monitor_id].get("parent")
+            self.monitors[monitor_id]["parent"] = monitor_ids.get(parent)
+        self._send_monitor_list()
+        return {"ok": True, "msg": "Backup successfully restored."}
+
+    # docker hosts
+
+    def _test_docker_host(self, sid, data) -> dict:
+        if data.get("dockerType") == "socket" and not os.path.exists(data.get("dockerDaemon") or ""):
+            raise _Error(f"connect ENOENT {data.get('dockerDaemon')}")
+        return {"ok": True, "msg": "Connected Successfully. Amount of containers: 0"}
+
+    def _add_docker_host(self, sid, data, docker_host_id) -> dict:
+        if docker_host_id is None:
+            docker_host_id = self._next_id("docker_host")
+        else:
+            self._require(self.docker_hosts, docker_host_id, "Docker host")
+        docker_host_id = int(docker_host_id)
+        self.docker_hosts[docker_host_id] = {
+            "id": docker_host_id,
+            "userID": 1,
+            "dockerDaemon": data.get("dockerDaemon"),
+            "dockerType": data.get("dockerType"),
+            "name": data.get("name"),
+        }
+        self._send_docker_host_list()
+        return {"ok": True, "msg": "Saved", "id": docker_host_id}
+
+    def _delete_docker_host(self, sid, docker_host_id) -> dict:
+        self._require(self.docker_hosts, docker_host_id, "Docker host")
+        del self.docker_hosts[int(docker_host_id)]
+        for monitor in self.monitors.values():
+            if monitor["docker_host"] == int(docker_host_id):
+                monitor["docker_host"] = None
+        self._send_docker_host_list()
+        return {"ok": True, "msg": "Deleted"}
+
+    # maintenances
+
+    def _store_maintenance(self, maintenance_id: int, data: dict) -> None:
+        maintenance = {
+            "id": maintenance_id,
+            "title": data.get("title"),
+            "description": data.get("description"),
+            "strategy": data.get("strategy"),
+            "intervalDay": data.get("intervalDay"),
+            "active": data.get("active", True),
+            "dateRange": data.get("dateRange") or [],
+            "timeRange": data.get("timeRange") or [],
+            "weekdays": data.get("weekdays") or [],
+            "daysOfMonth": data.get("daysOfMonth") or [],
+            "timeslotList": [],
+            "cron": data.get("cron"),
+            "duration": None,
+            "durationMinutes": data.get("durationMinutes") or 0,
+            "timezoneOption": data.get("timezoneOption"),
+            "timezoneOffset": "+00:00",
+        }
+        if not maintenance["active"]:
+            maintenance["status"] = "inactive"
+        elif maintenance["strategy"] == "manual":
+            maintenance["status"] = "under-maintenance"
+        else:
+            maintenance["status"] = "scheduled"
+        self.maintenances[maintenance_id] = maintenance
+
+    def _add_maintenance(self, sid, data) -> dict:
+        maintenance_id = self._next_id("maintenance")
+        self._store_maintenance(maintenance_id, data)
+        self._send_maintenance_list()
+        return {"ok": True, "msg": "Added Successfully.", "maintenanceID": maintenance_id}
+
+    def _edit_maintenance(self, sid, data) -> dict:
+        self._require(self.maintenances, data.get("id"), "Maintenance")
+        self._store_maintenance(int(data["id"]), data)
+        self._send_maintenance_list()
+        return {"ok": True, "msg": "Saved.", "maintenanceID": int(data["id"])}
+
+    def _get_maintenance(self, sid, maintenance_id) -> dict:
+        return {"ok": True, "maintenance": dict(self._require(self.maintenances, maintenance_id, "Maintenance"))}
+
+    def _delete_maintenance(self, sid, maintenance_id) -> dict:
+        self._require(self.maintenances, maintenance_id, "Maintenance")
+        del self.maintenances[int(maintenance_id)]
+        self.maintenance_monitors.pop(int(maintenance_id), None)
+        self.maintenance_status_pages.pop(int(maintenance_id), None)
+        self._send_maintenance_list()
+        return {"ok": True, "msg": "Deleted Successfully."}
+
+    def _set_maintenance_active(self, maintenance_id: Any, active: bool) -> None:
+        maintenance = self._require(self.maintenances, maintenance_id, "Maintenance")
+        self._store_maintenance(maintenance["id"], {**maintenance, "active": active})
+        self._send_maintenance_list()
+
+    def _pause_maintenance(self, sid, maintenance_id) -> dict:
+        self._set_maintenance_active(maintenance_id, False)
+        return {"ok": True, "msg": "Paused Successfully."}
+
+    def _resume_maintenance(self, sid, maintenance_id) -> dict:
+        self._set_maintenance_active(maintenance_id, True)
+        return {"ok": True, "msg": "Resume Successfully"}
+
+    def _get_monitor_maintenance(self, sid, maintenance_id) -> dict:
+        self._require(self.maintenances, maintenance_id, "Maintenance")
+        return {"ok": True, "monitors": [dict(i) for i in self.maintenance_monitors.get(int(maintenance_id), [])]}
+
+    def _add_monitor_maintenance(self, sid, maintenance_id, monitors) -> dict:
+        self._require(self.maintenances, maintenance_id, "Maintenance")
+        self.maintenance_monitors[int(maintenance_id)] = [
+            {"id": int(i["id"]), "name": self.monitors[int(i["id"])]["name"]}
+            for i in monitors if int(i["id"]) in self.monitors
+        ]
+        return {"ok": True, "msg": "Added Successfully."}
+
+    def _get_maintenance_status_page(self, sid, maintenance_id) -> dict:
+        self._require(self.maintenances, maintenance_id, "Maintenance")
+        return {
+            "ok": True,
+            "statusPages": [dict(i) for i in self.maintenance_status_pages.get(int(maintenance_id), [])],
+        }
+
+    def _add_maintenance_status_page(self, sid, maintenance_id, status_pages) -> dict:
+        self._require(self.maintenances, maintenance_id, "Maintenance")
+        self.maintenance_status_pages[int(maintenance_id)] = [
+            {"id": int(i["id"]), "title": self.status_pages[int(i["id"])]["title"]}
+            for i in status_pages if int(i["id"]) in self.status_pages
+        ]
+        return {"ok": True, "msg": "Added Successfully."}
+
+    # api keys
+
+    def _add_api_key(self, sid, data) -> dict:
+        key_id = self._next_id("api_key")
+        active = bool(data.get("active", True))
+        self.api_keys[key_id] = {
+            "id": key_id,
+            "name": data.get("name"),
+            "userID": 1,
+            "createdDate": _now()[:19],
+            "active": active,
+            "expires": data.get("expires"),
+            "status": "active" if active else "inactive",
+        }
+        self._send_api_key_list()
+        key = f"uk{key_id}_{secrets.token_urlsafe(24)}"
+        self._api_key_values[key] = key_id
+        return {"ok": True, "msg": "Added Successfully.", "key": key, "keyID": key_id}
+
+    def _set_api_key_active(self, key_id: Any, active: bool) -> None:
+        api_key = self._require(self.api_keys, key_id, "API key")
+        api_key.update({"active": active, "status": "active" if active else "inactive"})
+        self._send_api_key_list()
+
+    def _enable_api_key(self, sid, key_id) -> dict:
+        self._set_api_key_active(key_id, True)
+        return {"ok": True, "msg": "Enabled Successfully"}
+
+    def _disable_api_key(self, sid, key_id) -> dict:
+        self._set_api_key_active(key_id, False)
+        return {"ok": True, "msg": "Disabled Successfully."}
+
+    def _delete_api_key(self, sid, key_id) -> dict:
+        self._require(self.api_keys, key_id, "API key")
+        del self.api_keys[int(key_id)]
+        self._send_api_key_list()
+        return {"ok": True, "msg": "Deleted Successfully."}
+
+    # rest api
+
+    def _rest_routes(self) -> list:
+        return [
+            (re.compile(r"^/metrics$"), self._rest_metrics),
+            (re.compile(r"^/api/push/([^/]+)$"), self._rest_push),
+            (re.compile(r"^/api/status-page/heartbeat/([^/]+)$"), self._rest_status_page_heartbeat),
+            (re.compile(r"^/api/status-page/([^/]+)$"), self._rest_status_page),
+        ]
+
+    def _rest_status_page(self, environ: dict, slug: str) -> tuple:
+        data = self._public_status_page(slug)
+        if data is None:
+            return 404, {"ok": False, "msg": "Status Page Not Found"}
+        return 200, data
+
+    def _rest_status_page_heartbeat(self, environ: dict, slug: str) -> tuple:
+        try:
+            status_page = self._status_page_by_slug(slug)
+        except _Error:
+            return 404, {"ok": False, "msg": "Status Page Not Found"}
+        heartbeat_list = {}
+        uptime_list = {}
+        for group in status_page["publicGroupList"]:
+            for monitor in group["monitorList"]:
+                if monitor["id"] not in self.monitors:
+                    continue
+                heartbeats = self.heartbeats.get(monitor["id"], [])[-100:]
+                heartbeat_list[str(monitor["id"])] = [
+                    {key: heartbeat[key] for key in ["status", "time", "msg", "ping"]} for heartbeat in heartbeats
+                ]
+                up = sum(heartbeat["status"] == 1 for heartbeat in heartbeats)
+                uptime_list[f"{monitor['id']}_24"] = up / len(heartbeats) if heartbeats else 0
+        return 200, {"heartbeatList": heartbeat_list, "uptimeList": uptime_list}
+
+    def _rest_push(self, environ: dict, token: str) -> tuple:
+        query = {key: value[-1] for key, value in parse_qs(environ.get("QUERY_STRING", "")).items()}
+        for monitor_id, monitor in self.monitors.items():
+            if monitor["type"] == "push" and monitor["pushToken"] == token and monitor["active"]:
+                break
+        else:
+            return 404, {"ok": False, "msg": "Monitor not found or not active."}
+        try:
+            ping = float(query["ping"]) if query.get("ping") else None
+        except ValueError:
+            ping = None
+        status = 1 if query.get("status", "up") == "up" else 0
+        self._beat(monitor_id, status, msg=query.get("msg", "OK"), ping=ping)
+        return 200, {"ok": True}
+
+    def _rest_metrics(self, environ: dict) -> tuple:
+        # Prometheus metrics like prom-client renders them, protected by API keys (basic auth password)
+        try:
+            scheme, credentials = environ.get("HTTP_AUTHORIZATION", "").split(" ", 1)
+            key = base64.b64decode(credentials).decode().split(":", 1)[1]
+        except (ValueError, IndexError):
+            key = None
+        key_id = self._api_key_values.get(key)
+        if key_id not in self.api_keys or not self.api_keys[key_id]["active"]:
+            return 401, "Unauthorized"
+
+        def labels(monitor):
+            values = [monitor["name"], monitor["type"], monitor.get("url"), monitor.get("hostname"), monitor.get("port")]
+            values = ["null" if i is None else str(i).replace("\\", "\\\\").replace('"', '\\"') for i in values]
+            return ",".join(f'{name}="{value}"' for name, value in zip(
+                ["monitor_name", "monitor_type", "monitor_url", "monitor_hostname", "monitor_port"], values
+            ))
+
+        families = {
+            "monitor_cert_days_remaining": "The number of days remaining until the certificate expires",
+            "monitor_cert_is_valid": "Is the certificate still valid? (1 = Yes, 0= No)",
+            "monitor_response_time": "Monitor Response Time (ms)",
+            "monitor_status": "Monitor Status (1 = UP, 0= DOWN, 2= PENDING, 3= MAINTENANCE)",
+        }
+        samples = {name: [] for name in families}
+        for monitor_id, monitor in self.monitors.items():
+            heartbeats = self.heartbeats.get(monitor_id)
+            if not monitor["active"] or not heartbeats:
+                continue
+            heartbeat = heartbeats[-1]
+            samples["monitor_status"].append((labels(monitor), heartbeat["status"]))
+            ping = heartbeat["ping"]
+            samples["monitor_response_time"].append((labels(monitor), ping if ping is not None else -1))
+            if monitor["type"] in ["http", "keyword", "json-query"] and (monitor.get("url") or "").startswith("https"):
+                samples["monitor_cert_days_remaining"].append((labels(monitor), 60))
+                samples["monitor_cert_is_valid"].append((labels(monitor), 1))
+        lines = []
+        for name, help_text in families.items():
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} gauge"]
+            lines += [f"{name}{{{label_text}}} {value}" for label_text, value in samples[name]]
+        return 200, "\n".join(lines) + "\n"
+
+    def _rest_app(self, environ: dict, start_response: Callable) -> list:
+        self._delay()
+        path = environ.get("PATH_INFO", "")
+        if path == "/":
+            start_response("200 OK", [("Content-Type", "text/plain")])
+            return [b"Uptime Kuma fake server"]
+        for pattern, route in self._rest_routes():
+            match = pattern.match(path)
+            if match:
+                with self._lock:
+                    status, data = route(environ, *match.groups())
+                if isinstance(data, str):
+                    body = data.encode()
+                    content_type = "text/plain; version=0.0.4; charset=utf-8"
+                else:
+                    body = json.dumps(data).encode()
+                    content_type = "application/json; charset=utf-8"
+                reason = {200: "OK", 401: "Unauthorized", 404: "Not Found"}.get(status, "")
+                start_response(f"{status} {reason}", [
+                    ("Content-Type", content_type),
+                    ("Content-Length", str(len(body))),
+                ])
+                return [body]
+        start_response("404 Not Found", [("Content-Type", "text/plain")])
+        return [b"Not Found"]
+
+
+class _Error(Exception):
+    # answered with ok=False and the message
+    pass
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import bisect
+import threading
+from typing import Callable
+
+DEFAULT_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+class LatencyHistogram(object):
+    """Latency histogram with fixed bucket boundaries in seconds.
+
+    :param tuple buckets: The upper bounds of the buckets. An additional bucket for larger values is added.
+    """
+
+    __slots__ = ("buckets", "counts", "count", "sum", "min", "max", "errors", "timeouts")
+
+    def __init__(self, buckets: tuple = DEFAULT_BUCKETS) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min = None
+        self.max = None
+        self.errors = 0
+        self.timeouts = 0
+
+    def observe(self, duration: float, outcome: str = "ok") -> None:
+        self.counts[bisect.bisect_left(self.buckets, duration)] += 1
+        self.count += 1
+        self.sum += duration
+        if self.min is None or duration < self.min:
+            self.min = duration
+        if self.max is None or duration > self.max:
+            self.max = duration
+        if outcome == "error":
+            self.errors += 1
+        elif outcome == "timeout":
+            self.timeouts += 1
+
+    def snapshot(self) -> dict:
+        cumulative = 0
+        buckets = []
+        for le, count in zip(self.buckets + (float("inf"),), self.counts):
+            cumulative += count
+            buckets.append((le, cumulative))
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "sum": self.sum,
+            "min": self.min,
+            "max": self.max,
+            "buckets": buckets,
+        }
+
+
+class Instrumentation(object):
+    """Collects latency histograms, counts, errors and timeouts of the client.
+
+    The measurements are grouped by kind and name:
+
+    - ``call``: Socket.IO calls (:meth:`~.UptimeKumaApi._call`) by event name, e.g. ``getMonitor``.
+    - ``http``: REST requests by path without parameters, e.g. ``/api/status-page``.
+    - ``wait``: Waiting for the first event of a type to arrive by :class:`~.Event`.
+    - ``settle``: Waiting for further events of the same type (``wait_events``) by :class:`~.Event`.
+
+    Pass an instance (or ``True``) as ``instrumentation`` to :class:`~.UptimeKumaApi` to enable it.
+    If it is not enabled, the client does not measure anything.
+
+    Example::
+
+        >>> api = UptimeKumaApi('INSERT_URL', instrumentation=True)
+        >>> api.instrumentation.snapshot()
+        {
+            'call': {
+                'login': {
+                    'count': 1,
+                    'errors': 0,
+                    'timeouts': 0,
+                    'sum': 0.092,
+                    'min': 0.092,
+                    'max': 0.092,
+                    'buckets': [(0.005, 0), (0.01, 0), ..., (0.1, 1), ..., (inf, 1)]
+                }
+            },
+            ...
+        }
+
+    :param tuple buckets: The upper bounds of the histogram buckets in seconds.
+    """
+
+    def __init__(self, buckets: tuple = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._histograms: dict = {}
+        self._hooks: list = []
+
+    def add_hook(self, hook: Callable[[str, str, float, str], None]) -> None:
+        """
+        Registers a function that is called for each measurement, e.g. to forward it to an exporter.
+
+        The function is called with the kind, the name, the duration in seconds and the outcome
+        (``ok``, ``error`` or ``timeout``) in the thread that made the measurement.
+
+        :param callable hook: The function.
+        """
+        with self._lock:
+            self._hooks = self._hooks + [hook]
+
+    def remove_hook(self, hook: Callable[[str, str, float, str], None]) -> None:
+        """
+        Removes a function that was registered with :meth:`add_hook`.
+
+        :param callable hook: The function.
+        """
+        with self._lock:
+            self._hooks = [i for i in self._hooks if i != hook]
+
+    def observe(self, kind: str, name: str, duration: float, outcome: str = "ok") -> None:
+        """
+        Records a measurement.
+
+        :param str kind: The kind of the measurement.
+        :param str name: The name of the measurement, e.g. the event name.
+        :param float duration: The duration in seconds.
+        :param str, optional outcome: ``ok``, ``error`` or ``timeout``, defaults to ``ok``
+        """
+        # use the value of enum members (e.g. Event)
+        name = getattr(name, "value", name)
+        with self._lock:
+            try:
+                histogram = self._histograms[kind, name]
+            except KeyError:
+                histogram = self._histograms[kind, name] = LatencyHistogram(self.buckets)
+            histogram.observe(duration, outcome)
+            hooks = self._hooks
+        for hook in hooks:
+            hook(kind, name, duration, outcome)
+
+    def snapshot(self) -> dict:
+        """
+        Get a copy of all measurements.
+
+        :return: The histogram of each name grouped by kind.
+        :rtype: dict
+        """
+        r = {}
+        with self._lock:
+            for (kind, name), histogram in self._histograms.items():
+                r.setdefault(kind, {})[name] = histogram.snapshot()
+        return r
+
+    def reset(self) -> None:
+        """
+        Removes all measurements.
+        """
+        with self._lock:
+            self._histograms = {}
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Callable
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+class JsonCodec(object):
+    """A JSON implementation with the ``loads`` and ``dumps`` interface of the :mod:`json` module.
+
+    It is used for the Socket.IO packets and for all REST responses.
+
+    :param str name: Name of the codec.
+    :param callable loads: Decodes a ``str`` or ``bytes`` object.
+    :param callable dumps: Encodes an object to ``str``. Keyword arguments of :func:`json.dumps` must be accepted.
+    """
+
+    def __init__(self, name: str, loads: Callable, dumps: Callable) -> None:
+        self.name = name
+        self.loads = loads
+        self.dumps = dumps
+
+    def __repr__(self) -> str:
+        return f"JsonCodec({self.name!r})"
+
+
+json_codec = JsonCodec("json", json.loads, json.dumps)
+
+if orjson is not None:
+
+    def _orjson_dumps(obj: Any, **kwargs) -> str:
+        # the options of json.dumps (e.g. separators) only change the formatting,
+        # orjson always writes the compact format
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            # e.g. integers that exceed 64 bit
+            return json.dumps(obj, **kwargs)
+
+    orjson_codec = JsonCodec("orjson", orjson.loads, _orjson_dumps)
+else:  # pragma: no cover
+    orjson_codec = None
+
+
+def get_json_codec(codec: Any = "json") -> JsonCodec:
+    """
+    Get a JSON codec.
+
+    :param codec: ``"json"`` for the standard library, ``"orjson"`` for orjson,
+                  ``"auto"`` for orjson if it is installed and the standard library otherwise,
+                  or a :class:`JsonCodec` instance.
+    :return: The codec.
+    :rtype: JsonCodec
+    :raises ImportError: If orjson is requested but not installed.
+    :raises ValueError: If the codec is unknown.
+    """
+    if isinstance(codec, JsonCodec):
+        return codec
+    if codec == "json":
+        return json_codec
+    if codec == "orjson":
+        if orjson_codec is None:
+            raise ImportError("orjson is not installed")
+        return orjson_codec
+    if codec == "auto":
+        return orjson_codec or json_codec
+    raise ValueError(f"Unknown json_codec value: {codec}")
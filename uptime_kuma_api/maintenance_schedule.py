@@ -0,0 +1,455 @@
+from __future__ import annotations
+
+import calendar
+import datetime
+import math
+import re
+from bisect import bisect_left, bisect_right
+from typing import Any, Iterable, Optional, Union
+
+try:
+    import zoneinfo
+except ImportError:  # pragma: no cover
+    # python < 3.9, the fixed timezoneOffset of the server is used instead
+    zoneinfo = None
+
+from .maintenance_strategy import MaintenanceStrategy
+
+_utc = datetime.timezone.utc
+
+_month_names = {name.lower(): i for i, name in enumerate(calendar.month_abbr) if name}
+_weekday_names = {"sun": 0, "mon": 1, "tue": 2, "wed": 3, "thu": 4, "fri": 5, "sat": 6}
+
+_last_day = re.compile(r"^lastDay(\d+)$")
+_offset = re.compile(r"^([+-])(\d{2}):?(\d{2})$")
+
+
+def _parse_cron_field(text: str, low: int, high: int, names: dict = None) -> Optional[frozenset]:
+    # returns the allowed values or None for "*"
+    if text in ("*", "?"):
+        return None
+    values = set()
+    for part in text.split(","):
+        step = 1
+        if "/" in part:
+            part, step_text = part.split("/", 1)
+            step = int(step_text)
+            if step < 1:
+                raise ValueError(f"Invalid cron step: {step_text}")
+        if part in ("*", "?"):
+            start, end = low, high
+        else:
+            bounds = [names.get(i.lower(), i) if names else i for i in part.split("-", 1)]
+            start = int(bounds[0])
+            end = int(bounds[1]) if len(bounds) == 2 else (high if step > 1 else start)
+        if start < low or end > high or start > end:
+            raise ValueError(f"Invalid cron field: {text}")
+        values.update(range(start, end + 1, step))
+    return frozenset(values)
+
+
+class _Cron(object):
+    # cron expression with 5 or 6 (seconds) fields like croner, which Uptime Kuma uses:
+    # if day of month and day of week are both restricted, a day matches if one of them matches
+
+    def __init__(self, expression: str) -> None:
+        fields = expression.split()
+        if len(fields) == 5:
+            fields = ["0"] + fields
+        if len(fields) != 6:
+            raise ValueError(f"Invalid cron expression: {expression}")
+        seconds, minutes, hours, days, months, weekdays = fields
+        self.seconds = _parse_cron_field(seconds, 0, 59) or frozenset(range(60))
+        self.minutes = _parse_cron_field(minutes, 0, 59) or frozenset(range(60))
+        self.hours = _parse_cron_field(hours, 0, 23) or frozenset(range(24))
+        day_parts = days.split(",")
+        self.last_day = "L" in day_parts
+        days = ",".join(i for i in day_parts if i != "L")
+        # None if the day of month is not restricted
+        self.days = _parse_cron_field(days, 1, 31) if days else frozenset()
+        self.months = _parse_cron_field(months, 1, 12, _month_names)
+        weekdays = _parse_cron_field(weekdays, 0, 7, _weekday_names)
+        self.weekdays = frozenset(i % 7 for i in weekdays) if weekdays is not None else None
+        self.times = sorted(
+            datetime.time(hour, minute, second)
+            for hour in self.hours for minute in self.minutes for second in self.seconds
+        )
+
+    def matches(self, date: datetime.date) -> bool:
+        if self.months is not None and date.month not in self.months:
+            return False
+        weekday_match = self.weekdays is not None and (date.weekday() + 1) % 7 in self.weekdays
+        if self.days is None:
+            return self.weekdays is None or weekday_match
+        day_match = date.day in self.days or (self.last_day and date.day == calendar.monthrange(date.year,
+                                                                                                date.month)[1])
+        return day_match or weekday_match
+
+
+def _timestamp(value: Union[datetime.datetime, float, int]) -> float:
+    # naive datetimes are UTC
+    if isinstance(value, datetime.datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=_utc)
+        return value.timestamp()
+    return float(value)
+
+
+def _datetime(timestamp: float) -> Optional[datetime.datetime]:
+    if math.isinf(timestamp):
+        return None
+    return datetime.datetime.fromtimestamp(timestamp, _utc)
+
+
+def _parse_date(value: Any) -> Optional[datetime.datetime]:
+    if not value:
+        return None
+    if isinstance(value, datetime.datetime):
+        return value.replace(tzinfo=None)
+    return datetime.datetime.fromisoformat(str(value).replace("T", " ").rstrip("Z"))
+
+
+def _parse_time(value: Any) -> datetime.time:
+    if isinstance(value, dict):
+        return datetime.time(int(value.get("hours") or 0), int(value.get("minutes") or 0),
+                             int(value.get("seconds") or 0))
+    parts = [int(i) for i in str(value).split(":")]
+    return datetime.time(*parts)
+
+
+def _timezone(maintenance: dict, server_timezone: str) -> datetime.tzinfo:
+    # the server resolves "SAME_AS_SERVER" in "timezone", "timezoneOption" is the setting itself
+    name = maintenance.get("timezone")
+    if not name or name == "SAME_AS_SERVER":
+        name = maintenance.get("timezoneOption")
+    if not name or name == "SAME_AS_SERVER":
+        name = server_timezone
+    if not name or name == "UTC":
+        return _utc
+    if zoneinfo is not None:
+        try:
+            return zoneinfo.ZoneInfo(name)
+        except (zoneinfo.ZoneInfoNotFoundError, ValueError):
+            pass
+    match = _offset.match(maintenance.get("timezoneOffset") or "")
+    if match is None:
+        raise ValueError(f"Unknown timezone: {name}")
+    sign, hours, minutes = match.groups()
+    offset = datetime.timedelta(hours=int(hours), minutes=int(minutes))
+    return datetime.timezone(-offset if sign == "-" else offset)
+
+
+def _localize(value: datetime.datetime, tz: datetime.tzinfo) -> float:
+    return value.replace(tzinfo=tz).timestamp()
+
+
+def _duration(maintenance: dict) -> float:
+    # seconds, like Uptime Kuma: the end time of the time range is on the next day if it is before the start time
+    if maintenance.get("strategy") == MaintenanceStrategy.CRON:
+        return float(maintenance.get("durationMinutes") or 0) * 60
+    time_range = maintenance.get("timeRange") or []
+    if len(time_range) < 2:
+        return 0.0
+    start, end = (_parse_time(i) for i in time_range[:2])
+    duration = (end.hour * 3600 + end.minute * 60 + end.second) - (start.hour * 3600 + start.minute * 60 + start.second)
+    if duration < 0:
+        duration += 24 * 3600
+    return float(duration)
+
+
+def _recurring_rule(maintenance: dict) -> tuple[Any, list]:
+    # returns a function that checks a local date and the local start times of the windows on matching days
+    strategy = maintenance.get("strategy")
+    if strategy == MaintenanceStrategy.CRON:
+        cron = _Cron(maintenance.get("cron") or "")
+        return cron.matches, cron.times
+
+    time_range = maintenance.get("timeRange") or []
+    times = [_parse_time(time_range[0])] if time_range else [datetime.time(0, 0)]
+    if strategy == MaintenanceStrategy.RECURRING_WEEKDAY:
+        weekdays = {int(i) % 7 for i in maintenance.get("weekdays") or []}
+        return (lambda date: (date.weekday() + 1) % 7 in weekdays), times
+
+    if strategy == MaintenanceStrategy.RECURRING_DAY_OF_MONTH:
+        days = set()
+        last_days = set()
+        for day in maintenance.get("daysOfMonth") or []:
+            match = _last_day.match(str(day))
+            if match:
+                last_days.add(int(match.group(1)) - 1)
+            else:
+                days.add(int(day))
+
+        def matches(date):
+            if date.day in days:
+                return True
+            return calendar.monthrange(date.year, date.month)[1] - date.day in last_days
+
+        return matches, times
+
+    if strategy == MaintenanceStrategy.RECURRING_INTERVAL:
+        interval = max(int(maintenance.get("intervalDay") or 1), 1)
+        start = _parse_date((maintenance.get("dateRange") or [None])[0])
+        anchor = start.date() if start is not None else datetime.date(1970, 1, 1)
+        return (lambda date: (date - anchor).days % interval == 0), times
+
+    raise ValueError(f"Unknown strategy value: {strategy}")
+
+
+def _runs(times: list, duration: float) -> list[tuple[int, int]]:
+    # indexes of the first and last time of each group of windows that overlap or touch each other,
+    # e.g. a cron expression that starts a window every second has one group per day instead of 86400 windows
+    runs = []
+    previous = None
+    for i, time in enumerate(times):
+        seconds = time.hour * 3600 + time.minute * 60 + time.second
+        if runs and seconds - previous <= duration:
+            runs[-1] = (runs[-1][0], i)
+        else:
+            runs.append((i, i))
+        previous = seconds
+    return runs
+
+
+def _append_window(windows: list, window: tuple) -> None:
+    # merges a window into the previous window of the maintenance if they overlap, e.g. across midnight
+    if windows and windows[-1][0] <= window[0] <= windows[-1][1]:
+        windows[-1] = (windows[-1][0], max(windows[-1][1], window[1]), window[2])
+    else:
+        windows.append(window)
+
+
+class MaintenanceSchedule(object):
+    """Answers which maintenances and monitors are under maintenance at a time or in a time range without server
+    calls.
+
+    The strategies of the maintenances are compiled once into a sorted list of maintenance windows
+    for the time range from ``start`` to ``end``. Recurring windows are calculated in the timezone of the maintenance
+    like Uptime Kuma does, e.g. a daily window at 02:00 in ``Europe/Berlin`` moves by an hour in UTC when daylight
+    saving time starts. Windows of a maintenance that overlap or touch each other are merged into one window, so a
+    cron expression that starts a window every second or minute does not create a window per start.
+    Paused maintenances have no windows, manual maintenances are always active while they are active.
+
+    Use :meth:`~.UptimeKumaApi.get_maintenance_schedule` to build it from the server data.
+
+    Example::
+
+        >>> schedule = MaintenanceSchedule(
+        ...     maintenances=api.get_maintenances(),
+        ...     monitors={1: [1, 2, 3]},
+        ...     start=datetime.datetime(2023, 3, 1),
+        ...     end=datetime.datetime(2023, 4, 1)
+        ... )
+        >>> schedule.monitors_at(datetime.datetime(2023, 3, 26, 1, 30))
+        {1, 2, 3}
+        >>> schedule.windows(datetime.datetime(2023, 3, 25), datetime.datetime(2023, 3, 27), monitor_id=1)
+        [
+            (datetime.datetime(2023, 3, 25, 1, 0, tzinfo=datetime.timezone.utc),
+             datetime.datetime(2023, 3, 25, 2, 0, tzinfo=datetime.timezone.utc), 1),
+            (datetime.datetime(2023, 3, 26, 1, 0, tzinfo=datetime.timezone.utc),
+             datetime.datetime(2023, 3, 26, 2, 0, tzinfo=datetime.timezone.utc), 1)
+        ]
+
+    :param list maintenances: The maintenances as returned by :meth:`~.UptimeKumaApi.get_maintenances`.
+    :param dict, optional monitors: The monitor ids (or monitors as returned by
+                                    :meth:`~.UptimeKumaApi.get_monitor_maintenance`) by maintenance id.
+    :param start: Start of the time range as datetime (naive datetimes are UTC) or timestamp,
+                  defaults to one day ago.
+    :param end: End of the time range as datetime (naive datetimes are UTC) or timestamp,
+                defaults to 30 days from now.
+    :param str, optional server_timezone: The timezone of maintenances with the timezone ``SAME_AS_SERVER``,
+                                          defaults to ``"UTC"``.
+    """
+
+    def __init__(
+        self,
+        maintenances: Iterable[dict],
+        monitors: dict = None,
+        start: Union[datetime.datetime, float] = None,
+        end: Union[datetime.datetime, float] = None,
+        server_timezone: str = "UTC",
+    ) -> None:
+        now = datetime.datetime.now(_utc)
+        self.start = _timestamp(start if start is not None else now - datetime.timedelta(days=1))
+        self.end = _timestamp(end if end is not None else now + datetime.timedelta(days=30))
+        if self.end < self.start:
+            raise ValueError("The end of the time range is before the start")
+
+        self._monitors = {}
+        for maintenance_id, items in (monitors or {}).items():
+            self._monitors[int(maintenance_id)] = frozenset(
+                int(i["id"]) if isinstance(i, dict) else int(i) for i in items
+            )
+        self._maintenances_by_monitor = {}
+        for maintenance_id, monitor_ids in self._monitors.items():
+            for monitor_id in monitor_ids:
+                self._maintenances_by_monitor.setdefault(monitor_id, set()).add(maintenance_id)
+
+        windows = []
+        for maintenance in maintenances:
+            windows.extend(self._compile(maintenance, server_timezone))
+        # windows without start or end (manual maintenances, single maintenances without end) are checked always
+        self._open_windows = [i for i in windows if math.isinf(i[0]) or math.isinf(i[1])]
+        # the other windows sorted by start, a window that contains a point starts at most max_duration before it
+        self._windows = sorted(i for i in windows if not (math.isinf(i[0]) or math.isinf(i[1])))
+        self._starts = [i[0] for i in self._windows]
+        self._max_duration = max((i[1] - i[0] for i in self._windows), default=0.0)
+
+    def _compile(self, maintenance: dict, server_timezone: str) -> list:
+        maintenance_id = int(maintenance["id"])
+        if not maintenance.get("active", True):
+            return []
+        strategy = maintenance.get("strategy")
+        if strategy == MaintenanceStrategy.MANUAL:
+            return [(-math.inf, math.inf, maintenance_id)]
+
+        tz = _timezone(maintenance, server_timezone)
+        date_range = list(maintenance.get("dateRange") or []) + [None, None]
+        range_start = _parse_date(date_range[0])
+        range_end = _parse_date(date_range[1])
+
+        if strategy == MaintenanceStrategy.SINGLE:
+            if range_start is None:
+                return []
+            window_start = _localize(range_start, tz)
+            window_end = _localize(range_end, tz) if range_end is not None else math.inf
+            if window_end <= self.start or window_start > self.end or window_end <= window_start:
+                return []
+            return [(window_start, window_end, maintenance_id)]
+
+        duration = _duration(maintenance)
+        if duration <= 0:
+            return []
+        matches, times = _recurring_rule(maintenance)
+        runs = _runs(times, duration)
+        # local dates whose windows can overlap the time range
+        first = datetime.datetime.fromtimestamp(self.start - duration, tz).date() - datetime.timedelta(days=1)
+        last = datetime.datetime.fromtimestamp(self.end, tz).date() + datetime.timedelta(days=1)
+        if range_start is not None:
+            first = max(first, range_start.date())
+        if range_end is not None:
+            last = min(last, range_end.date())
+        windows = []
+        date = first
+        while date <= last:
+            if matches(date):
+                # the windows of a day that start within the date range
+                low = 0
+                high = len(times) - 1
+                if range_start is not None and date == range_start.date():
+                    low = bisect_left(times, range_start.time())
+                if range_end is not None and date == range_end.date():
+                    high = bisect_right(times, range_end.time()) - 1
+                for run_first, run_last in runs:
+                    run_first = max(run_first, low)
+                    run_last = min(run_last, high)
+                    if run_first > run_last:
+                        continue
+                    window_start = _localize(datetime.datetime.combine(date, times[run_first]), tz)
+                    window_end = _localize(datetime.datetime.combine(date, times[run_last]), tz) + duration
+                    if window_end > self.start and window_start <= self.end:
+                        _append_window(windows, (window_start, window_end, maintenance_id))
+            date += datetime.timedelta(days=1)
+        return windows
+
+    def _check(self, timestamp: float) -> None:
+        if not self.start <= timestamp <= self.end:
+            raise ValueError(
+                f"{_datetime(timestamp)} is outside of the compiled time range {_datetime(self.start)} - "
+                f"{_datetime(self.end)}"
+            )
+
+    def _overlapping(self, start: float, end: float) -> list[tuple]:
+        # the windows that contain a point in [start, end], sorted by start
+        first = bisect_left(self._starts, start - self._max_duration)
+        r = [i for i in self._open_windows if i[0] <= end and i[1] > start]
+        r.extend(i for i in self._windows[first:bisect_right(self._starts, end)] if i[1] > start)
+        return r
+
+    def maintenances_at(self, time: Union[datetime.datetime, float]) -> set[int]:
+        """
+        Returns the ids of the maintenances that are active at a time.
+
+        :param time: The time as datetime (naive datetimes are UTC) or timestamp.
+        :return: The maintenance ids.
+        :rtype: set
+        :raises ValueError: If the time is outside of the compiled time range.
+        """
+        timestamp = _timestamp(time)
+        self._check(timestamp)
+        return {i[2] for i in self._overlapping(timestamp, timestamp)}
+
+    def monitors_at(self, time: Union[datetime.datetime, float]) -> set[int]:
+        """
+        Returns the ids of the monitors that are under maintenance at a time.
+
+        :param time: The time as datetime (naive datetimes are UTC) or timestamp.
+        :return: The monitor ids.
+        :rtype: set
+        :raises ValueError: If the time is outside of the compiled time range.
+        """
+        r = set()
+        for maintenance_id in self.maintenances_at(time):
+            r.update(self._monitors.get(maintenance_id, ()))
+        return r
+
+    def is_under_maintenance(self, monitor_id: int, time: Union[datetime.datetime, float]) -> bool:
+        """
+        Returns whether a monitor is under maintenance at a time.
+
+        :param int monitor_id: The monitor id.
+        :param time: The time as datetime (naive datetimes are UTC) or timestamp.
+        :rtype: bool
+        :raises ValueError: If the time is outside of the compiled time range.
+        """
+        maintenance_ids = self._maintenances_by_monitor.get(monitor_id)
+        if not maintenance_ids:
+            self._check(_timestamp(time))
+            return False
+        return not maintenance_ids.isdisjoint(self.maintenances_at(time))
+
+    def windows(
+        self,
+        start: Union[datetime.datetime, float],
+        end: Union[datetime.datetime, float],
+        monitor_id: int = None,
+    ) -> list[tuple]:
+        """
+        Returns the maintenance windows that overlap a time range.
+
+        :param start: Start of the time range as datetime (naive datetimes are UTC) or timestamp.
+        :param end: End of the time range as datetime (naive datetimes are UTC) or timestamp.
+        :param int, optional monitor_id: Only return the windows of maintenances of this monitor.
+        :return: ``(start, end, maintenance id)`` tuples sorted by start. Start and end are UTC datetimes,
+                 they are ``None`` for manual maintenances.
+        :rtype: list
+        :raises ValueError: If the time range is outside of the compiled time range.
+        """
+        start = _timestamp(start)
+        end = _timestamp(end)
+        self._check(start)
+        self._check(end)
+        maintenance_ids = None
+        if monitor_id is not None:
+            maintenance_ids = self._maintenances_by_monitor.get(monitor_id, set())
+        return [
+            (_datetime(window_start), _datetime(window_end), maintenance_id)
+            for window_start, window_end, maintenance_id in sorted(self._overlapping(start, end))
+            if maintenance_ids is None or maintenance_id in maintenance_ids
+        ]
+
+    def monitors_between(self, start: Union[datetime.datetime, float], end: Union[datetime.datetime, float]) -> dict:
+        """
+        Returns the maintenance windows of all monitors that overlap a time range.
+
+        :param start: Start of the time range as datetime (naive datetimes are UTC) or timestamp.
+        :param end: End of the time range as datetime (naive datetimes are UTC) or timestamp.
+        :return: The windows like :meth:`windows` by monitor id.
+        :rtype: dict
+        :raises ValueError: If the time range is outside of the compiled time range.
+        """
+        r = {}
+        for window in self.windows(start, end):
+            for monitor_id in self._monitors.get(window[2], ()):
+                r.setdefault(monitor_id, []).append(window)
+        return r
@@ -0,0 +1,318 @@
+from .base_model import BaseModel
+from .monitor_type import MonitorType
+
+
+class Monitor(BaseModel):
+    """Monitor"""
+
+    __slots__ = (
+        "id",
+        "name",
+        "description",
+        "pathName",
+        "parent",
+        "childrenIDs",
+        "url",
+        "method",
+        "hostname",
+        "port",
+        "maxretries",
+        "weight",
+        "active",
+        "forceInactive",
+        "type",
+        "timeout",
+        "interval",
+        "retryInterval",
+        "resendInterval",
+        "keyword",
+        "invertKeyword",
+        "expiryNotification",
+        "ignoreTls",
+        "upsideDown",
+        "packetSize",
+        "maxredirects",
+        "accepted_statuscodes",
+        "dns_resolve_type",
+        "dns_resolve_server",
+        "dns_last_result",
+        "docker_container",
+        "docker_host",
+        "proxyId",
+        "notificationIDList",
+        "tags",
+        "maintenance",
+        "mqttTopic",
+        "mqttSuccessMessage",
+        "databaseQuery",
+        "authMethod",
+        "grpcUrl",
+        "grpcProtobuf",
+        "grpcMethod",
+        "grpcServiceName",
+        "grpcEnableTls",
+        "radiusCalledStationId",
+        "radiusCallingStationId",
+        "game",
+        "gamedigGivenPortOnly",
+        "httpBodyEncoding",
+        "jsonPath",
+        "expectedValue",
+        "kafkaProducerTopic",
+        "kafkaProducerBrokers",
+        "kafkaProducerSsl",
+        "kafkaProducerAllowAutoTopicCreation",
+        "kafkaProducerMessage",
+        "screenshot",
+        "headers",
+        "body",
+        "grpcBody",
+        "grpcMetadata",
+        "basic_auth_user",
+        "basic_auth_pass",
+        "oauth_client_id",
+        "oauth_client_secret",
+        "oauth_token_url",
+        "oauth_scopes",
+        "oauth_auth_method",
+        "pushToken",
+        "databaseConnectionString",
+        "radiusUsername",
+        "radiusPassword",
+        "radiusSecret",
+        "mqttUsername",
+        "mqttPassword",
+        "authWorkstation",
+        "authDomain",
+        "tlsCa",
+        "tlsCert",
+        "tlsKey",
+        "kafkaProducerSaslOptions",
+        "includeSensitiveData",
+    )
+
+
+class Heartbeat(BaseModel):
+    """Heartbeat"""
+
+    __slots__ = (
+        "monitorID",
+        "status",
+        "time",
+        "msg",
+        "ping",
+        "important",
+        "duration",
+        "id",
+        "monitor_id",
+        "down_count",
+    )
+
+
+class Notification(BaseModel):
+    """Notification"""
+
+    __slots__ = (
+        "id",
+        "name",
+        "active",
+        "userId",
+        "isDefault",
+        "applyExisting",
+        "type",
+    )
+
+
+class Maintenance(BaseModel):
+    """Maintenance"""
+
+    __slots__ = (
+        "id",
+        "title",
+        "description",
+        "strategy",
+        "intervalDay",
+        "active",
+        "dateRange",
+        "timeRange",
+        "weekdays",
+        "daysOfMonth",
+        "timeslotList",
+        "cron",
+        "duration",
+        "durationMinutes",
+        "timezone",
+        "timezoneOption",
+        "timezoneOffset",
+        "status",
+    )
+
+
+class GroupMonitor(Monitor):
+    """Monitor of type :attr:`~.MonitorType.GROUP`"""
+
+    __slots__ = ()
+
+
+class HttpMonitor(Monitor):
+    """Monitor of type :attr:`~.MonitorType.HTTP`"""
+
+    __slots__ = ()
+
+
+class PortMonitor(Monitor):
+    """Monitor of type :attr:`~.MonitorType.PORT`"""
+
+    __slots__ = ()
+
+
+class PingMonitor(Monitor):
+    """Monitor of type :attr:`~.MonitorType.PING`"""
+
+    __slots__ = ()
+
+
+class KeywordMonitor(Monitor):
+    """Monitor of type :attr:`~.MonitorType.KEYWORD`"""
+
+    __slots__ = ()
+
+
+class JsonQueryMonitor(Monitor):
+    """Monitor of type :attr:`~.MonitorType.JSON_QUERY`"""
+
+    __slots__ = ()
+
+
+class GrpcKeywordMonitor(Monitor):
+    """Monitor of type :attr:`~.MonitorType.GRPC_KEYWORD`"""
+
+    __slots__ = ()
+
+
+class DnsMonitor(Monitor):
+    """Monitor of type :attr:`~.MonitorType.DNS`"""
+
+    __slots__ = ()
+
+
+class DockerMonitor(Monitor):
+    """Monitor of type :attr:`~.MonitorType.DOCKER`"""
+
+    __slots__ = ()
+
+
+class RealBrowserMonitor(Monitor):
+    """Monitor of type :attr:`~.MonitorType.REAL_BROWSER`"""
+
+    __slots__ = ()
+
+
+class PushMonitor(Monitor):
+    """Monitor of type :attr:`~.MonitorType.PUSH`"""
+
+    __slots__ = ()
+
+
+class SteamMonitor(Monitor):
+    """Monitor of type :attr:`~.MonitorType.STEAM`"""
+
+    __slots__ = ()
+
+
+class GamedigMonitor(Monitor):
+    """Monitor of type :attr:`~.MonitorType.GAMEDIG`"""
+
+    __slots__ = ()
+
+
+class MqttMonitor(Monitor):
+    """Monitor of type :attr:`~.MonitorType.MQTT`"""
+
+    __slots__ = ()
+
+
+class KafkaProducerMonitor(Monitor):
+    """Monitor of type :attr:`~.MonitorType.KAFKA_PRODUCER`"""
+
+    __slots__ = ()
+
+
+class SqlserverMonitor(Monitor):
+    """Monitor of type :attr:`~.MonitorType.SQLSERVER`"""
+
+    __slots__ = ()
+
+
+class PostgresMonitor(Monitor):
+    """Monitor of type :attr:`~.MonitorType.POSTGRES`"""
+
+    __slots__ = ()
+
+
+class MysqlMonitor(Monitor):
+    """Monitor of type :attr:`~.MonitorType.MYSQL`"""
+
+    __slots__ = ()
+
+
+class MongodbMonitor(Monitor):
+    """Monitor of type :attr:`~.MonitorType.MONGODB`"""
+
+    __slots__ = ()
+
+
+class RadiusMonitor(Monitor):
+    """Monitor of type :attr:`~.MonitorType.RADIUS`"""
+
+    __slots__ = ()
+
+
+class RedisMonitor(Monitor):
+    """Monitor of type :attr:`~.MonitorType.REDIS`"""
+
+    __slots__ = ()
+
+
+class TailscalePingMonitor(Monitor):
+    """Monitor of type :attr:`~.MonitorType.TAILSCALE_PING`"""
+
+    __slots__ = ()
+
+
+monitor_models = {
+    MonitorType.GROUP: GroupMonitor,
+    MonitorType.HTTP: HttpMonitor,
+    MonitorType.PORT: PortMonitor,
+    MonitorType.PING: PingMonitor,
+    MonitorType.KEYWORD: KeywordMonitor,
+    MonitorType.JSON_QUERY: JsonQueryMonitor,
+    MonitorType.GRPC_KEYWORD: GrpcKeywordMonitor,
+    MonitorType.DNS: DnsMonitor,
+    MonitorType.DOCKER: DockerMonitor,
+    MonitorType.REAL_BROWSER: RealBrowserMonitor,
+    MonitorType.PUSH: PushMonitor,
+    MonitorType.STEAM: SteamMonitor,
+    MonitorType.GAMEDIG: GamedigMonitor,
+    MonitorType.MQTT: MqttMonitor,
+    MonitorType.KAFKA_PRODUCER: KafkaProducerMonitor,
+    MonitorType.SQLSERVER: SqlserverMonitor,
+    MonitorType.POSTGRES: PostgresMonitor,
+    MonitorType.MYSQL: MysqlMonitor,
+    MonitorType.MONGODB: MongodbMonitor,
+    MonitorType.RADIUS: RadiusMonitor,
+    MonitorType.REDIS: RedisMonitor,
+    MonitorType.TAILSCALE_PING: TailscalePingMonitor,
+}
+
+
+def monitor_from_dict(data: dict) -> Monitor:
+    """
+    Creates the model of a monitor depending on its type.
+
+    :param dict data: The monitor.
+    :return: The monitor model.
+    :rtype: Monitor
+    """
+    model = monitor_models.get(data.get("type"), Monitor)
+    return model.from_dict(data)
\ No newline at end of file
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+from typing import Iterable
+
+from .notification_providers import (
+    NotificationType,
+    notification_provider_conditions,
+    notification_provider_options,
+)
+
+_common_required_options = ("type", "name")
+
+# keys of all notifications, besides the options of the provider
+_common_options = frozenset(("id", "name", "type", "isDefault", "applyExisting", "active", "userId"))
+
+_all_provider_options = frozenset(
+    option
+    for provider_options in notification_provider_options.values()
+    for option in provider_options
+)
+
+
+class NotificationProviderValidator(object):
+    """Validates and cleans up the arguments of a single notification provider.
+
+    The option schema of the provider is compiled once from
+    :data:`notification_provider_options` and :data:`notification_provider_conditions`,
+    so that validating a notification does not need to walk the schema again.
+
+    :param NotificationType type_: The notification type.
+    """
+
+    __slots__ = ("type", "options", "allowed", "required", "conditions", "foreign_options")
+
+    def __init__(self, type_: NotificationType) -> None:
+        provider_options = notification_provider_options[type_]
+        self.type = type_
+        self.options = frozenset(provider_options)
+        self.allowed = self.options | _common_options
+        self.required = _common_required_options + tuple(
+            option for option, spec in provider_options.items() if spec["required"]
+        )
+        self.conditions = tuple(
+            (option, conditions.get("min"), conditions.get("max"))
+            for option, conditions in notification_provider_conditions.items()
+        )
+        self.foreign_options = _all_provider_options - self.options
+
+    def validate(self, kwargs: dict, ignore: Iterable[str] = ()) -> None:
+        """
+        Validates the arguments of a notification.
+
+        :param dict kwargs: The notification arguments.
+        :param ignore: Keys that are not checked against the options of the provider,
+                       e.g. settings that the server returned for an existing notification.
+        :raises TypeError: If a required argument is missing or an argument is not an option of the provider.
+        :raises ValueError: If an argument is out of range.
+        """
+        for key in kwargs:
+            if key not in self.allowed and key not in ignore:
+                raise TypeError(f"unknown argument '{key}' for notification type {self.type.value}")
+
+        missing_arguments = [i for i in self.required if kwargs.get(i) is None]
+        if missing_arguments:
+            missing_arguments_str = ", ".join([f"'{i}'" for i in missing_arguments])
+            raise TypeError(
+                f"missing {len(missing_arguments)} required argument: {missing_arguments_str}"
+            )
+
+        for option, min_, max_ in self.conditions:
+            value = kwargs.get(option)
+            if value is None:
+                continue
+            if min_ is not None and value < min_:
+                raise ValueError(f"the value of {option} must not be less than {min_}")
+            if max_ is not None and value > max_:
+                raise ValueError(
+                    f"the value of {option} must not be larger than {max_}"
+                )
+
+    def strip(self, notification: dict) -> None:
+        """
+        Removes the options of all other notification providers from a notification.
+
+        :param dict notification: The notification to clean up in place.
+        """
+        for option in self.foreign_options.intersection(notification):
+            del notification[option]
+
+
+notification_validators = {
+    type_: NotificationProviderValidator(type_) for type_ in notification_provider_options
+}
+
+
+def check_notification_options(kwargs: dict) -> None:
+    """
+    Checks that all keys are options of a known notification provider.
+
+    :param dict kwargs: The provider options.
+    :raises TypeError: If an unknown argument is passed.
+    """
+    for key in kwargs:
+        if key not in _all_provider_options:
+            raise TypeError(f"unknown argument '{key}'")
+
+
+def get_notification_validator(type_) -> NotificationProviderValidator:
+    """
+    Get the compiled validator of a notification type.
+
+    :param NotificationType type_: The notification type.
+    :return: The validator.
+    :rtype: NotificationProviderValidator
+    :raises ValueError: If the notification type is unknown.
+    """
+    try:
+        return notification_validators[type_]
+    except (KeyError, TypeError):
+        raise ValueError(f"Unknown notification type: {type_}")
+
+
+def validate_notifications(notifications: list[dict]) -> list[tuple[int, Exception]]:
+    """
+    Validates many notifications at once, e.g. before a bulk import.
+
+    All notifications are checked, so that every invalid entry is reported and not just the first one.
+
+    :param list notifications: The notifications to validate.
+    :return: The index and the error of each invalid notification. The list is empty if all notifications are valid.
+             The error is a :class:`TypeError` for a missing argument or an argument that is not an option of the
+             provider and a :class:`ValueError` for an unknown notification type or an argument out of range.
+    :rtype: list
+
+    Example::
+
+        >>> validate_notifications([
+        ...     {
+        ...         "name": "notification 1",
+        ...         "type": NotificationType.PUSHBYTECHULUS,
+        ...         "pushAPIKey": "123456789"
+        ...     },
+        ...     {
+        ...         "name": "notification 2",
+        ...         "type": NotificationType.PUSHBYTECHULUS
+        ...     }
+        ... ])
+        [(1, TypeError("missing 1 required argument: 'pushAPIKey'"))]
+    """
+    errors = []
+    for index, notification in enumerate(notifications):
+        try:
+            if notification.get("type") is None:
+                raise TypeError("missing 1 required argument: 'type'")
+            validator = get_notification_validator(notification["type"])
+            validator.validate(notification)
+        except (TypeError, ValueError) as e:
+            errors.append((index, e))
+    return errors
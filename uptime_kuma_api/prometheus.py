@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+from typing import Any, Iterable, Iterator, Optional
+
+import requests
+
+from .exceptions import Timeout, UptimeKumaException
+from .monitor_status import MonitorStatus
+
+_monitor_statuses = {member.value: member for member in MonitorStatus}
+
+# metric name -> (key in the result, conversion of the sample value)
+monitor_metrics = {
+    "monitor_status": ("status", lambda value: _monitor_statuses.get(int(value), int(value))),
+    "monitor_response_time": ("response_time", lambda value: value if value >= 0 else None),
+    "monitor_cert_days_remaining": ("cert_days_remaining", int),
+    "monitor_cert_is_valid": ("cert_is_valid", lambda value: value == 1),
+}
+
+_label_keys = ("monitor_name", "monitor_type", "monitor_url", "monitor_hostname", "monitor_port")
+
+_escapes = {"\\": "\\", '"': '"', "n": "\n"}
+
+
+def _parse_labels(text: str, pos: int) -> tuple[dict, int]:
+    # parses the labels after "{" and returns them and the position after "}"
+    labels = {}
+    length = len(text)
+    while pos < length:
+        if text[pos] in ", ":
+            pos += 1
+            continue
+        if text[pos] == "}":
+            return labels, pos + 1
+        eq = text.index("=", pos)
+        name = text[pos:eq].strip()
+        pos = eq + 1
+        if text[pos] != '"':
+            raise ValueError(f"Invalid label value in line: {text}")
+        pos += 1
+        value = []
+        while True:
+            char = text[pos]
+            if char == "\\":
+                value.append(_escapes.get(text[pos + 1], text[pos + 1]))
+                pos += 2
+            elif char == '"':
+                pos += 1
+                break
+            else:
+                end = pos
+                while end < length and text[end] not in '\\"':
+                    end += 1
+                value.append(text[pos:end])
+                pos = end
+        labels[name] = "".join(value)
+    raise ValueError(f"Unterminated labels in line: {text}")
+
+
+def parse_metrics(lines: Iterable[Any], names: Iterable[str] = None) -> Iterator[tuple[str, dict, float]]:
+    """
+    Parses the Prometheus text format line by line.
+
+    :param lines: The lines as str or bytes, e.g. ``response.iter_lines()``, so the response does not have to be
+                  loaded completely.
+    :param names: Only parse samples of these metric names, defaults to all metrics.
+    :return: Generator of ``(name, labels, value)`` tuples.
+    :rtype: iterator
+    """
+    names = frozenset(names) if names is not None else None
+    for line in lines:
+        if isinstance(line, bytes):
+            line = line.decode("utf-8")
+        if not line or line[0] == "#":
+            continue
+        end = 0
+        length = len(line)
+        while end < length and line[end] not in "{ ":
+            end += 1
+        name = line[:end]
+        if names is not None and name not in names:
+            continue
+        labels = {}
+        pos = end
+        if pos < length and line[pos] == "{":
+            labels, pos = _parse_labels(line, pos + 1)
+        fields = line[pos:].split()
+        if not fields:
+            raise ValueError(f"Missing sample value in line: {line}")
+        yield name, labels, float(fields[0])
+
+
+def _label_value(value: Optional[str]) -> Optional[str]:
+    # prom-client renders missing values as "null"
+    return None if value in (None, "null", "") else value
+
+
+def _monitor_key(labels: dict) -> tuple:
+    return tuple(_label_value(labels.get(key)) for key in _label_keys)
+
+
+def fetch_monitor_metrics(
+    session: requests.Session,
+    url: str,
+    api_key: str,
+    timeout: float = 10,
+) -> dict:
+    """
+    Fetches ``/metrics`` and collects the monitor metrics by monitor labels.
+
+    :param requests.Session session: The session, its connection pool is reused.
+    :param str url: The url of the Uptime Kuma instance.
+    :param str api_key: An API key (see :meth:`~.UptimeKumaApi.add_api_key`).
+    :param float, optional timeout: Seconds to wait for the response, defaults to ``10``.
+    :return: The metrics by ``(name, type, url, hostname, port)`` of the monitors.
+    :rtype: dict
+    :raises UptimeKumaException: If the API key is invalid.
+    :raises Timeout: If the server does not respond in time.
+    """
+    try:
+        r = session.get(f"{url.rstrip('/')}/metrics", auth=("", api_key), timeout=timeout, stream=True)
+    except requests.exceptions.Timeout as e:
+        raise Timeout(e)
+    with r:
+        if r.status_code == 401:
+            raise UptimeKumaException("Invalid API key")
+        if not r.ok:
+            raise UptimeKumaException(f"Unexpected response with status code {r.status_code}")
+        monitors = {}
+        for name, labels, value in parse_metrics(r.iter_lines(chunk_size=65536), monitor_metrics):
+            key, convert = monitor_metrics[name]
+            monitor = monitors.get(_monitor_key(labels))
+            if monitor is None:
+                monitor = monitors[_monitor_key(labels)] = {
+                    "status": None,
+                    "response_time": None,
+                    "cert_days_remaining": None,
+                    "cert_is_valid": None,
+                }
+            monitor[key] = convert(value)
+    return monitors
+
+
+def map_monitor_ids(metrics: dict, monitors: Iterable[dict]) -> dict:
+    """
+    Assigns the metrics of :func:`fetch_monitor_metrics` to monitor ids.
+
+    The metrics only contain the name, type, url, hostname and port of a monitor. Monitors whose labels match several
+    monitors are skipped.
+
+    :param dict metrics: The metrics by monitor labels.
+    :param monitors: The monitors, e.g. the values of the monitor list.
+    :return: The metrics by monitor id.
+    :rtype: dict
+    """
+    ids: dict = {}
+    for monitor in monitors:
+        key = (monitor.get("name"), monitor.get("type"), monitor.get("url"), monitor.get("hostname"))
+        port = monitor.get("port")
+        key += (str(port) if port is not None else None,)
+        key = tuple(_label_value(i) if isinstance(i, str) or i is None else str(i) for i in key)
+        ids[key] = None if key in ids else monitor["id"]
+    r = {}
+    for key, value in metrics.items():
+        monitor_id = ids.get(key)
+        if monitor_id is not None:
+            r[monitor_id] = value
+    return r
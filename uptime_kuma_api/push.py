@@ -0,0 +1,405 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Union
+
+import requests
+
+from .exceptions import Timeout, UptimeKumaException
+from .instrumentation import LatencyHistogram
+from .monitor_status import MonitorStatus
+
+
+def _status_value(status: Union[str, bool, MonitorStatus]) -> str:
+    # the push endpoint treats every value except "up" as down
+    if status is True or status == MonitorStatus.UP:
+        return "up"
+    if status is False or status == MonitorStatus.DOWN:
+        return "down"
+    if status in ["up", "down"]:
+        return status
+    raise ValueError(f"Unknown status value: {status}")
+
+
+def _push_args(push: Union[str, dict, tuple]) -> dict:
+    # accepts a token, a dict of push arguments or a tuple (token, status, msg, ping)
+    if isinstance(push, str):
+        return {"token": push}
+    if isinstance(push, dict):
+        return push
+    if isinstance(push, (list, tuple)):
+        return dict(zip(["token", "status", "msg", "ping"], push))
+    raise TypeError(f"Unknown push type: {type(push).__name__}")
+
+
+class PushClient(object):
+    """Sends the status of :attr:`~.MonitorType.PUSH` monitors to ``/api/push/<pushToken>``.
+
+    The requests share a pool of keep-alive connections, so one client can push for many monitors concurrently,
+    e.g. as a sidecar for all batch jobs of a host. The client does not need a login.
+
+    Example::
+
+        >>> with PushClient('INSERT_URL') as client:
+        ...     client.push("INSERT_PUSH_TOKEN", status="up", msg="OK", ping=12)
+        ...     client.push_many([
+        ...         ("INSERT_PUSH_TOKEN_1", "up", "OK", 10),
+        ...         {"token": "INSERT_PUSH_TOKEN_2", "status": "down", "msg": "job failed"}
+        ...     ])
+        ...     client.snapshot()
+        {
+            'sent': 3,
+            'errors': 0,
+            'timeouts': 0,
+            'per_second': 45.2,
+            'latency': {
+                'count': 3,
+                ...
+            }
+        }
+
+    :param str url: The url of the Uptime Kuma instance, e.g. ``http://127.0.0.1:3001``
+    :param float, optional timeout: Seconds to wait for a response, defaults to ``10``.
+    :param int, optional pool_size: Number of kept connections and default number of concurrent pushes,
+                                    defaults to ``16``.
+    :param bool, optional ssl_verify: ``False`` to skip the verification of SSL certificates, defaults to ``True``.
+    """
+
+    def __init__(self, url: str, timeout: float = 10, pool_size: int = 16, ssl_verify: bool = True) -> None:
+        self.url = url.rstrip("/")
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self.session = requests.Session()
+        self.session.verify = ssl_verify
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._latency = LatencyHistogram()
+        self._lock = threading.Lock()
+        self._started = time.monotonic()
+
+    def __enter__(self) -> PushClient:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Closes the connections.
+        """
+        self.session.close()
+
+    def _observe(self, start: float, outcome: str) -> None:
+        with self._lock:
+            self._latency.observe(time.perf_counter() - start, outcome)
+
+    def push(
+        self,
+        token: str,
+        status: Union[str, bool, MonitorStatus] = "up",
+        msg: str = "OK",
+        ping: Optional[float] = None,
+    ) -> dict:
+        """
+        Pushes the status of a monitor.
+
+        :param str token: The push token of the monitor.
+        :param status: ``"up"``, ``"down"``, a :class:`~.MonitorStatus` or a bool, defaults to ``"up"``.
+        :param str, optional msg: The message of the heartbeat, defaults to ``"OK"``.
+        :param float, optional ping: The response time in milliseconds, defaults to ``None``.
+        :return: The server response.
+        :rtype: dict
+        :raises UptimeKumaException: If the monitor does not exist or is not active.
+        :raises Timeout: If the server does not respond in time.
+        """
+        params = {"status": _status_value(status), "msg": msg}
+        if ping is not None:
+            params["ping"] = ping
+        start = time.perf_counter()
+        try:
+            r = self.session.get(f"{self.url}/api/push/{token}", params=params, timeout=self.timeout)
+        except requests.exceptions.Timeout as e:
+            self._observe(start, "timeout")
+            raise Timeout(e)
+        except Exception:
+            self._observe(start, "error")
+            raise
+        try:
+            data = r.json()
+        except ValueError:
+            data = {"ok": False, "msg": f"Unexpected response with status code {r.status_code}"}
+        if not data.get("ok"):
+            self._observe(start, "error")
+            raise UptimeKumaException(data.get("msg"))
+        self._observe(start, "ok")
+        data.pop("ok")
+        return data
+
+    def push_many(self, pushes: list, max_workers: int = None, return_exceptions: bool = False) -> list:
+        """
+        Pushes the status of many monitors concurrently.
+
+        :param list pushes: Push tokens, dicts with the arguments of :meth:`push` or tuples
+                            ``(token, status, msg, ping)``.
+        :param int, optional max_workers: Maximum number of concurrent pushes, defaults to the pool size.
+        :param bool, optional return_exceptions: ``True`` to return the exception of a failed push in its place
+                                                 instead of raising it, defaults to False.
+        :return: The server responses in the order of the pushes.
+        :rtype: list
+        :raises UptimeKumaException: If a push fails and ``return_exceptions`` is False.
+        """
+        pushes = [_push_args(push) for push in pushes]
+        if not pushes:
+            return []
+
+        def run(kwargs):
+            try:
+                return self.push(**kwargs)
+            except Exception as e:
+                if return_exceptions:
+                    return e
+                raise
+
+        max_workers = max(1, min(max_workers or self.pool_size, len(pushes)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(run, kwargs) for kwargs in pushes]
+            return [future.result() for future in futures]
+
+    def snapshot(self) -> dict:
+        """
+        Returns the throughput and error metrics.
+
+        :return: The number of sent pushes, failed pushes, timeouts, the average pushes per second since the client
+                 was created and the latency histogram (see :meth:`~.Instrumentation.snapshot`).
+        :rtype: dict
+        """
+        with self._lock:
+            latency = self._latency.snapshot()
+        elapsed = time.monotonic() - self._started
+        return {
+            "sent": latency["count"],
+            "errors": latency["errors"],
+            "timeouts": latency["timeouts"],
+            "per_second": latency["count"] / elapsed if elapsed > 0 else 0.0,
+            "latency": latency,
+        }
+
+    def reset(self) -> None:
+        """
+        Resets the metrics.
+        """
+        with self._lock:
+            self._latency = LatencyHistogram()
+            self._started = time.monotonic()
+
+
+class AsyncPushClient(object):
+    """asyncio variant of :class:`PushClient`.
+
+    The pushes are sent by the connection pool of a :class:`PushClient` in a thread pool, so no additional
+    dependencies are needed and the event loop is not blocked.
+
+    Example::
+
+        >>> async with AsyncPushClient('INSERT_URL') as client:
+        ...     await client.push("INSERT_PUSH_TOKEN", status="up", msg="OK", ping=12)
+        ...     await client.push_many(["INSERT_PUSH_TOKEN_1", "INSERT_PUSH_TOKEN_2"])
+
+    :param str url: The url of the Uptime Kuma instance, e.g. ``http://127.0.0.1:3001``
+    :param float, optional timeout: Seconds to wait for a response, defaults to ``10``.
+    :param int, optional pool_size: Number of kept connections and concurrent pushes, defaults to ``16``.
+    :param bool, optional ssl_verify: ``False`` to skip the verification of SSL certificates, defaults to ``True``.
+    """
+
+    def __init__(self, url: str, timeout: float = 10, pool_size: int = 16, ssl_verify: bool = True) -> None:
+        self.client = PushClient(url, timeout=timeout, pool_size=pool_size, ssl_verify=ssl_verify)
+        self._executor = ThreadPoolExecutor(max_workers=pool_size)
+
+    async def __aenter__(self) -> AsyncPushClient:
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Closes the connections and the thread pool.
+        """
+        self._executor.shutdown(wait=True)
+        self.client.close()
+
+    async def push(
+        self,
+        token: str,
+        status: Union[str, bool, MonitorStatus] = "up",
+        msg: str = "OK",
+        ping: Optional[float] = None,
+    ) -> dict:
+        """
+        Pushes the status of a monitor, see :meth:`PushClient.push`.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, lambda: self.client.push(token, status, msg, ping))
+
+    async def push_many(self, pushes: list, return_exceptions: bool = False) -> list:
+        """
+        Pushes the status of many monitors concurrently, see :meth:`PushClient.push_many`.
+        """
+        pushes = [_push_args(push) for push in pushes]
+        return await asyncio.gather(*[self.push(**kwargs) for kwargs in pushes], return_exceptions=return_exceptions)
+
+    def snapshot(self) -> dict:
+        """
+        Returns the throughput and error metrics, see :meth:`PushClient.snapshot`.
+        """
+        return self.client.snapshot()
+
+
+class PushQueue(object):
+    """Collects pushes from many threads and sends them in batches in a background thread.
+
+    A batch is sent when it contains ``batch_size`` pushes or ``flush_interval`` seconds after its first push.
+    With ``coalesce`` only the last push of each token in a batch is sent, since Uptime Kuma only needs the latest
+    status of a push monitor per interval. Failed pushes are counted in the metrics of the client and are not
+    repeated.
+
+    Example::
+
+        >>> client = PushClient('INSERT_URL')
+        >>> with PushQueue(client) as queue:
+        ...     for job in jobs:
+        ...         queue.put(job.push_token, status="up" if job.ok else "down", msg=job.message)
+
+    :param PushClient client: The client that sends the pushes.
+    :param int, optional batch_size: Maximum number of pushes per batch, defaults to ``100``.
+    :param float, optional flush_interval: Maximum seconds a push waits in the queue, defaults to ``1``.
+    :param bool, optional coalesce: Send only the last push of each token in a batch, defaults to ``True``.
+    """
+
+    def __init__(
+        self,
+        client: PushClient,
+        batch_size: int = 100,
+        flush_interval: float = 1,
+        coalesce: bool = True,
+    ) -> None:
+        self.client = client
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.coalesce = coalesce
+        self.coalesced = 0
+        self._pending: list = []
+        self._first_put: Optional[float] = None
+        self._condition = threading.Condition()
+        self._closed = False
+        self._sending = 0
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> PushQueue:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def put(
+        self,
+        token: str,
+        status: Union[str, bool, MonitorStatus] = "up",
+        msg: str = "OK",
+        ping: Optional[float] = None,
+    ) -> None:
+        """
+        Adds a push to the queue. The arguments are the same as in :meth:`PushClient.push`.
+
+        :raises UptimeKumaException: If the queue is closed.
+        """
+        _status_value(status)
+        with self._condition:
+            if self._closed:
+                raise UptimeKumaException("The push queue is closed")
+            if not self._pending:
+                self._first_put = time.monotonic()
+            self._pending.append({"token": token, "status": status, "msg": msg, "ping": ping})
+            if len(self._pending) >= self.batch_size:
+                self._condition.notify_all()
+
+    def _take_batch(self) -> list:
+        batch = self._pending[:self.batch_size]
+        del self._pending[:self.batch_size]
+        self._first_put = time.monotonic() if self._pending else None
+        if self.coalesce:
+            latest = {push["token"]: push for push in batch}
+            self.coalesced += len(batch) - len(latest)
+            batch = list(latest.values())
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._closed and (
+                    not self._pending
+                    or (
+                        len(self._pending) < self.batch_size
+                        and time.monotonic() - self._first_put < self.flush_interval
+                    )
+                ):
+                    timeout = None
+                    if self._pending:
+                        timeout = self.flush_interval - (time.monotonic() - self._first_put)
+                    self._condition.wait(timeout)
+                if self._closed and not self._pending:
+                    return
+                batch = self._take_batch()
+                self._sending += 1
+            try:
+                self.client.push_many(batch, return_exceptions=True)
+            finally:
+                with self._condition:
+                    self._sending -= 1
+                    self._condition.notify_all()
+
+    def flush(self, timeout: float = None) -> bool:
+        """
+        Sends the queued pushes now and waits until they are sent.
+
+        :param float, optional timeout: Maximum seconds to wait, defaults to ``None`` (no limit).
+        :return: ``True`` if all pushes were sent.
+        :rtype: bool
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        with self._condition:
+            if self._pending:
+                self._first_put = time.monotonic() - self.flush_interval
+                self._condition.notify_all()
+            while self._pending or self._sending:
+                remaining = deadline - time.monotonic() if deadline is not None else None
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+        return True
+
+    def close(self) -> None:
+        """
+        Sends the remaining pushes and stops the background thread.
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join()
+
+    def snapshot(self) -> dict:
+        """
+        Returns the metrics of the client (see :meth:`PushClient.snapshot`), the queued pushes and the pushes that
+        were replaced by a later push of the same token.
+
+        :rtype: dict
+        """
+        with self._condition:
+            queued = len(self._pending)
+            coalesced = self.coalesced
+        return {**self.client.snapshot(), "queued": queued, "coalesced": coalesced}
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from copy import deepcopy
+from typing import Any
+
+
+def freeze(value: Any) -> Any:
+    """
+    Wraps dicts and lists in read-only views. Other values are returned unchanged.
+
+    The views do not copy the wrapped data. Nested dicts and lists are wrapped when they are accessed.
+    Iterating a view iterates over a snapshot of its keys or items, so the received events can change the data
+    meanwhile. The nested values are still live and can change between accesses.
+
+    :param value: The value to wrap.
+    :return: The read-only view or the value.
+    """
+    if isinstance(value, dict):
+        return ReadOnlyDict(value)
+    if isinstance(value, list):
+        return ReadOnlyList(value)
+    return value
+
+
+class ReadOnlyDict(Mapping):
+    """Read-only view of a dict that is returned in raw mode."""
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: dict) -> None:
+        self._data = data
+
+    def __getitem__(self, key: Any) -> Any:
+        return freeze(self._data[key])
+
+    def __iter__(self):
+        # the event handlers add keys while the view is iterated
+        return iter(tuple(self._data))
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._data
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, ReadOnlyDict):
+            other = other._data
+        return self._data == other
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._data!r})"
+
+    def copy(self) -> dict:
+        """
+        Creates a mutable deep copy.
+
+        :return: The copied dict.
+        :rtype: dict
+        """
+        return deepcopy(self._data)
+
+
+class ReadOnlyList(Sequence):
+    """Read-only view of a list that is returned in raw mode."""
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: list) -> None:
+        self._data = data
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return ReadOnlyList(self._data[index])
+        return freeze(self._data[index])
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __iter__(self):
+        # the event handlers append and remove items while the view is iterated
+        return map(freeze, tuple(self._data))
+
+    def __reversed__(self):
+        return map(freeze, reversed(tuple(self._data)))
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, ReadOnlyList):
+            other = other._data
+        return self._data == other
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._data!r})"
+
+    def copy(self) -> list:
+        """
+        Creates a mutable deep copy.
+
+        :return: The copied list.
+        :rtype: list
+        """
+        return deepcopy(self._data)
+
+
+def json_default(obj: Any) -> Any:
+    """
+    Serializes read-only views without copying them.
+
+    Pass it as ``default`` to :func:`json.dumps` (or ``orjson.dumps``) to forward raw results.
+
+    Example::
+
+        >>> with api.raw():
+        ...     monitors = api.get_monitors()
+        >>> json.dumps(monitors, default=json_default)
+
+    :param obj: The object that is not serializable by default.
+    :return: The wrapped dict or list.
+    :raises TypeError: If the object is not a read-only view.
+    """
+    if isinstance(obj, (ReadOnlyDict, ReadOnlyList)):
+        return obj._data
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
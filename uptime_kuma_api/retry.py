@@ -0,0 +1,300 @@
+from __future__ import annotations
+
+import random
+import threading
+import time
+from typing import Any, Callable, Optional
+
+import socketio
+
+from .event import Event
+
+SAFE = "safe"
+CONDITIONAL = "conditional"
+UNSAFE = "unsafe"
+
+# reads and calls without side effects
+safe_events = frozenset({
+    "checkApprise",
+    "getDatabaseSize",
+    "getGameList",
+    "getMaintenance",
+    "getMaintenanceStatusPage",
+    "getMonitor",
+    "getMonitorBeats",
+    "getMonitorMaintenance",
+    "getSettings",
+    "getStatusPage",
+    "getTags",
+    "login",
+    "loginByToken",
+    "needSetup",
+    "twoFAStatus",
+    "verifyToken",
+})
+
+# calls that set the complete state of an object, repeating them has the same effect
+conditional_events = frozenset({
+    "addMaintenanceStatusPage",
+    "addMonitorMaintenance",
+    "deleteAPIKey",
+    "deleteDockerHost",
+    "deleteMaintenance",
+    "deleteMonitor",
+    "deleteNotification",
+    "deleteProxy",
+    "deleteStatusPage",
+    "deleteTag",
+    "disableAPIKey",
+    "editMaintenance",
+    "editMonitor",
+    "editTag",
+    "enableAPIKey",
+    "pauseMaintenance",
+    "pauseMonitor",
+    "resumeMaintenance",
+    "resumeMonitor",
+    "saveStatusPage",
+    "setSettings",
+})
+
+# events that add an object if the id (second argument) is None and edit it otherwise
+_add_or_edit_events = frozenset({"addNotification", "addProxy", "addDockerHost"})
+
+# error messages of delete calls whose object does not exist
+_not_found_messages = ("not found", "does not exist", "doesn't exist")
+
+
+def _not_found(event: str, r: Any) -> bool:
+    # whether a repeated delete call failed because the first attempt deleted the object
+    if not event.startswith("delete") or not isinstance(r, dict) or r.get("ok", True):
+        return False
+    msg = str(r.get("msg") or "").lower()
+    return any(i in msg for i in _not_found_messages)
+
+
+def classify(event: str, data: Any = None) -> str:
+    """
+    Classifies a socket call by the effect of repeating it.
+
+    - ``safe``: The call has no side effects, e.g. ``getMonitor``.
+    - ``conditional``: The call sends the complete state of an object, repeating it has the same effect,
+      e.g. ``editMonitor`` with the full monitor.
+    - ``unsafe``: Repeating the call has another effect, e.g. ``add`` creates a second monitor.
+
+    Unknown events are unsafe.
+
+    :param str event: The event name.
+    :param data: The call data.
+    :return: ``safe``, ``conditional`` or ``unsafe``.
+    :rtype: str
+    """
+    if event in safe_events:
+        return SAFE
+    if event in conditional_events:
+        return CONDITIONAL
+    if event in _add_or_edit_events and isinstance(data, (list, tuple)) and len(data) > 1 and data[1] is not None:
+        return CONDITIONAL
+    return UNSAFE
+
+
+class _CreatedCheck(object):
+    # finds the object that an unsafe add call created in the list that the server sends after the call
+
+    def __init__(self, event: Event, fields: tuple, payload: Callable, response: Callable) -> None:
+        self.event = event
+        self.fields = fields
+        self.payload = payload
+        self.response = response
+
+    def _items(self, event_data: dict) -> Optional[list]:
+        data = event_data.get(self.event)
+        if data is None:
+            return None
+        return list(data.values()) if isinstance(data, dict) else list(data)
+
+    def snapshot(self, event_data: dict) -> Optional[set]:
+        items = self._items(event_data)
+        if items is None:
+            return None
+        return {item.get("id") for item in items}
+
+    def find(self, event_data: dict, before: set, data: Any) -> Optional[dict]:
+        payload = self.payload(data)
+        for item in self._items(event_data) or []:
+            if item.get("id") in before:
+                continue
+            if all(item.get(field) == payload.get(field) for field in self.fields):
+                return {"ok": True, **self.response(item.get("id"))}
+        return None
+
+
+_created_checks = {
+    "add": _CreatedCheck(
+        Event.MONITOR_LIST, ("type", "name"), lambda data: data,
+        lambda id_: {"msg": "Added Successfully.", "monitorID": id_},
+    ),
+    "addNotification": _CreatedCheck(
+        Event.NOTIFICATION_LIST, ("name",), lambda data: data[0],
+        lambda id_: {"msg": "Saved", "id": id_},
+    ),
+    "addProxy": _CreatedCheck(
+        Event.PROXY_LIST, ("protocol", "host", "port"), lambda data: data[0],
+        lambda id_: {"msg": "Saved", "id": id_},
+    ),
+    "addDockerHost": _CreatedCheck(
+        Event.DOCKER_HOST_LIST, ("name", "dockerType", "dockerDaemon"), lambda data: data[0],
+        lambda id_: {"msg": "Saved", "id": id_},
+    ),
+    "addMaintenance": _CreatedCheck(
+        Event.MAINTENANCE_LIST, ("title",), lambda data: data,
+        lambda id_: {"msg": "Added Successfully.", "maintenanceID": id_},
+    ),
+    "addStatusPage": _CreatedCheck(
+        Event.STATUS_PAGE_LIST, ("slug",), lambda data: {"slug": data[1]},
+        lambda id_: {"msg": "OK!"},
+    ),
+}
+
+
+class RetryPolicy(object):
+    """Retries socket calls that timed out, depending on their classification (see :func:`classify`).
+
+    Safe and conditional calls are repeated. A repeated delete call that fails because the object does not exist
+    succeeds, the first attempt was executed by the server. Unsafe calls that add an object (monitors,
+    notifications, proxies, docker hosts, maintenances and status pages) are only repeated if the object does not
+    appear in the list that the server sends after the call, so a call that was executed by the server despite the
+    timeout does not create a duplicate. Instead, the response is recreated from the list. Before such a call is
+    repeated, the list is watched for ``list_timeout`` seconds (at least the ``wait_events`` of the client), because
+    a stalled server sends it late. Other unsafe calls (e.g. ``postIncident``) are not repeated.
+
+    The delay before attempt ``n`` is a random value between ``0`` and ``min(max_delay, base_delay * 2 ** n)``
+    ("full jitter"), so that many clients do not retry at the same time.
+
+    Pass an instance as ``retry_policy`` to :class:`~.UptimeKumaApi` to enable it.
+
+    Example::
+
+        >>> api = UptimeKumaApi('INSERT_URL', timeout=5, retry_policy=RetryPolicy(max_attempts=4))
+        >>> api.login('INSERT_USERNAME', 'INSERT_PASSWORD')
+        >>> api.add_monitors(monitors)
+        >>> api.retry_policy.snapshot()
+        {
+            'retries': 3,
+            'recovered': 1,
+            'exhausted': 0
+        }
+
+    :param int, optional max_attempts: Maximum number of attempts of a call, defaults to ``3``.
+    :param float, optional base_delay: Base of the exponential backoff in seconds, defaults to ``0.5``.
+    :param float, optional max_delay: Upper bound of the backoff in seconds, defaults to ``10``.
+    :param bool, optional retry_unsafe: ``False`` to never repeat unsafe calls, defaults to ``True``.
+    :param int, optional seed: Seed of the random generator for the jitter, defaults to ``None``.
+    :param float, optional list_timeout: Seconds to wait for the added object in the list before an unsafe call is
+                                         repeated, defaults to ``1``.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 10,
+        retry_unsafe: bool = True,
+        seed: int = None,
+        list_timeout: float = 1,
+    ) -> None:
+        if max_attempts < 1:
+            raise ValueError(f"Unknown max_attempts value: {max_attempts}")
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_unsafe = retry_unsafe
+        self.list_timeout = list_timeout
+        self.retries = 0
+        self.recovered = 0
+        self.exhausted = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def delay(self, attempt: int) -> float:
+        """
+        Returns the jittered delay before the given retry.
+
+        :param int attempt: The number of the failed attempt, starting at ``1``.
+        :return: The delay in seconds.
+        :rtype: float
+        """
+        with self._lock:
+            return self._random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def _wait_created(self, check: _CreatedCheck, event_data: dict, before: set, data: Any,
+                      timeout: float) -> Optional[dict]:
+        # the list that contains the object may arrive after the timeout of the call
+        deadline = time.monotonic() + timeout
+        while True:
+            r = check.find(event_data, before, data)
+            if r is not None or time.monotonic() >= deadline:
+                return r
+            time.sleep(0.01)
+
+    def call(self, func: Callable, event: str, data: Any, event_data: dict, wait_events: float = 0) -> Any:
+        """
+        Calls ``func(event, data)`` and repeats the call if it times out.
+
+        :param callable func: The function that sends the call.
+        :param str event: The event name.
+        :param data: The call data.
+        :param dict event_data: The event data of the client, used to check the outcome of unsafe calls.
+        :param float, optional wait_events: The ``wait_events`` of the client, the minimum time to wait for the list
+                                            before an unsafe call is repeated, defaults to ``0``.
+        :return: The response.
+        :raises socketio.exceptions.TimeoutError: If the last attempt timed out or the call must not be repeated.
+        """
+        kind = classify(event, data)
+        check = None
+        before = None
+        if kind == UNSAFE:
+            check = _created_checks.get(event) if self.retry_unsafe else None
+            if check is not None:
+                before = check.snapshot(event_data)
+            if before is None:
+                # the outcome cannot be checked, the call is sent once
+                return func(event, data)
+
+        attempt = 1
+        while True:
+            try:
+                r = func(event, data)
+            except socketio.exceptions.TimeoutError:
+                if attempt >= self.max_attempts:
+                    self._count("exhausted")
+                    raise
+            else:
+                if attempt > 1 and _not_found(event, r):
+                    self._count("recovered")
+                    return {"ok": True, "msg": "Deleted Successfully."}
+                return r
+            deadline = time.monotonic() + self.delay(attempt)
+            if check is not None:
+                r = self._wait_created(check, event_data, before, data, max(self.list_timeout, wait_events))
+                if r is not None:
+                    self._count("recovered")
+                    return r
+            time.sleep(max(0.0, deadline - time.monotonic()))
+            self._count("retries")
+            attempt += 1
+
+    def snapshot(self) -> dict:
+        """
+        Returns the number of retries, of unsafe calls whose outcome was recovered from the server data and of calls
+        that failed after the last attempt.
+
+        :return: The counts.
+        :rtype: dict
+        """
+        with self._lock:
+            return {"retries": self.retries, "recovered": self.recovered, "exhausted": self.exhausted}
@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+import socketio
+
+from .exceptions import Timeout
+
+
+class TokenBucket(object):
+    """Limits the rate of calls.
+
+    Tokens are added at ``rate`` per second up to ``burst`` tokens. Each call takes one token
+    and waits until the token is available, so calls are never rejected.
+
+    :param float rate: Calls per second.
+    :param int, optional burst: Maximum number of calls without waiting, defaults to ``1``.
+    """
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        if rate <= 0:
+            raise ValueError(f"Unknown rate value: {rate}")
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Takes a token and returns how many seconds the caller has to wait until the token is available.
+
+        :return: The wait time in seconds.
+        :rtype: float
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        """
+        Takes a token and waits until it is available.
+        """
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+
+class AdaptiveConcurrencyLimiter(object):
+    """Limits the number of concurrent calls with additive increase / multiplicative decrease (AIMD).
+
+    Each successful call increases the limit by ``1 / limit``, i.e. by one per round of calls.
+    A timeout or a call that is slower than the latency threshold multiplies the limit by ``backoff``.
+    The limit is decreased at most once per round: calls that were started before the last decrease
+    do not decrease it again.
+
+    Without ``latency_threshold`` a call is too slow if its latency exceeds ``latency_tolerance`` times the
+    lowest smoothed latency that was observed, i.e. when the server starts to queue the calls.
+
+    :param int, optional initial_limit: The initial limit, defaults to ``4``.
+    :param int, optional min_limit: The lowest limit, defaults to ``1``.
+    :param int, optional max_limit: The highest limit, defaults to ``32``.
+    :param float, optional latency_threshold: Latency in seconds above which the limit is decreased,
+                                              defaults to ``None``.
+    :param float, optional latency_tolerance: Factor of the lowest smoothed latency above which the limit is
+                                              decreased if ``latency_threshold`` is not set, defaults to ``3``.
+    :param float, optional backoff: Factor of the decrease, defaults to ``0.5``.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 32,
+        latency_threshold: float = None,
+        latency_tolerance: float = 3,
+        backoff: float = 0.5,
+    ) -> None:
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("The limits must satisfy 1 <= min_limit <= initial_limit <= max_limit")
+        if not 0 < backoff < 1:
+            raise ValueError(f"Unknown backoff value: {backoff}")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_threshold = latency_threshold
+        self.latency_tolerance = latency_tolerance
+        self.backoff = backoff
+        self.limit = float(initial_limit)
+        self.in_flight = 0
+        self.decreases = 0
+        self._smoothed_latency: Optional[float] = None
+        self._min_latency: Optional[float] = None
+        self._last_decrease = 0.0
+        self._condition = threading.Condition()
+
+    def acquire(self) -> float:
+        """
+        Waits until a call may be started.
+
+        :return: The start time of the call that must be passed to :meth:`release`.
+        :rtype: float
+        """
+        with self._condition:
+            while self.in_flight >= int(self.limit):
+                self._condition.wait()
+            self.in_flight += 1
+            return time.monotonic()
+
+    def release(self, start: float, outcome: str = "ok") -> None:
+        """
+        Ends a call and adjusts the limit.
+
+        :param float start: The value returned by :meth:`acquire`.
+        :param str, optional outcome: ``ok``, ``error`` or ``timeout``. Errors do not change the limit.
+        """
+        now = time.monotonic()
+        latency = now - start
+        with self._condition:
+            self.in_flight -= 1
+            if outcome == "timeout" or (outcome == "ok" and self._too_slow(latency)):
+                if start >= self._last_decrease:
+                    self.limit = max(self.min_limit, self.limit * self.backoff)
+                    self._last_decrease = now
+                    self.decreases += 1
+            elif outcome == "ok":
+                self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+            self._condition.notify_all()
+
+    def _too_slow(self, latency: float) -> bool:
+        if self.latency_threshold is not None:
+            return latency > self.latency_threshold
+        if self._smoothed_latency is None:
+            self._smoothed_latency = latency
+        else:
+            self._smoothed_latency += 0.2 * (latency - self._smoothed_latency)
+        if self._min_latency is None or self._smoothed_latency < self._min_latency:
+            self._min_latency = self._smoothed_latency
+        return latency > self._min_latency * self.latency_tolerance
+
+
+class CallScheduler(object):
+    """Schedules the socket calls of :class:`~.UptimeKumaApi` with an optional rate limit and an adaptive
+    concurrency limit.
+
+    Pass an instance as ``scheduler`` to :class:`~.UptimeKumaApi`. All calls of the instance then wait for a token
+    of the rate limit and for a free slot of the concurrency limit. The concurrency limit grows while the server
+    answers quickly and shrinks when calls time out or get slow, so bulk methods like
+    :meth:`~.UptimeKumaApi.add_monitors` use as much concurrency as the server can take.
+
+    Example::
+
+        >>> scheduler = CallScheduler(rate=20, max_concurrency=16)
+        >>> api = UptimeKumaApi('INSERT_URL', scheduler=scheduler)
+        >>> api.login('INSERT_USERNAME', 'INSERT_PASSWORD')
+        >>> api.add_monitors([
+        ...     {"type": MonitorType.HTTP, "name": f"monitor {i}", "url": "https://example.com"}
+        ...     for i in range(100)
+        ... ])
+        >>> scheduler.snapshot()
+        {
+            'limit': 11.3,
+            'in_flight': 0,
+            'calls': 100,
+            'errors': 0,
+            'timeouts': 0,
+            'decreases': 1
+        }
+
+    :param float, optional rate: Maximum calls per second, defaults to ``None`` (unlimited).
+    :param int, optional burst: Calls that may exceed the rate after an idle period, defaults to ``1``.
+    :param int, optional initial_concurrency: The initial concurrency limit, defaults to ``4``.
+    :param int, optional max_concurrency: The highest concurrency limit, defaults to ``32``.
+    :param float, optional latency_threshold: Call latency in seconds above which the concurrency limit is
+                                              decreased, defaults to ``None`` (relative to the lowest latency,
+                                              see :class:`AdaptiveConcurrencyLimiter`).
+    """
+
+    def __init__(
+        self,
+        rate: float = None,
+        burst: int = 1,
+        initial_concurrency: int = 4,
+        max_concurrency: int = 32,
+        latency_threshold: float = None,
+    ) -> None:
+        self.bucket = TokenBucket(rate, burst) if rate else None
+        self.limiter = AdaptiveConcurrencyLimiter(
+            initial_limit=min(initial_concurrency, max_concurrency),
+            max_limit=max_concurrency,
+            latency_threshold=latency_threshold,
+        )
+        self.calls = 0
+        self.errors = 0
+        self.timeouts = 0
+        self._lock = threading.Lock()
+
+    @property
+    def max_concurrency(self) -> int:
+        """The highest concurrency limit."""
+        return self.limiter.max_limit
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """
+        Waits for a token and a free slot and holds the slot for the duration of the ``with`` block.
+
+        A :class:`~.Timeout` or ``socketio.exceptions.TimeoutError`` raised inside the block counts as timeout,
+        other exceptions as errors.
+        """
+        if self.bucket is not None:
+            self.bucket.acquire()
+        start = self.limiter.acquire()
+        outcome = "ok"
+        try:
+            yield
+        except BaseException as e:
+            outcome = "timeout" if isinstance(e, (Timeout, socketio.exceptions.TimeoutError)) else "error"
+            raise
+        finally:
+            self.limiter.release(start, outcome)
+            with self._lock:
+                self.calls += 1
+                if outcome == "error":
+                    self.errors += 1
+                elif outcome == "timeout":
+                    self.timeouts += 1
+
+    def snapshot(self) -> dict:
+        """
+        Returns the current limit and the call counts.
+
+        :return: The state of the scheduler.
+        :rtype: dict
+        """
+        with self._lock:
+            return {
+                "limit": round(self.limiter.limit, 2),
+                "in_flight": self.limiter.in_flight,
+                "calls": self.calls,
+                "errors": self.errors,
+                "timeouts": self.timeouts,
+                "decreases": self.limiter.decreases,
+            }
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import threading
+from copy import deepcopy
+from typing import Any, Callable, Hashable
+
+from .retry import safe_events
+
+# safe calls whose results may be shared, logins are always sent
+coalesced_events = safe_events - {"login", "loginByToken", "verifyToken"}
+
+
+class _Flight(object):
+    __slots__ = ("done", "result", "error", "followers")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.followers = 0
+
+
+class SingleFlight(object):
+    """Coalesces identical concurrent reads into one request.
+
+    While a read is in flight, threads that start the same read (same event and arguments or same REST path)
+    wait for it instead of sending their own request and receive a copy of its result or its exception.
+    Reads that start after the request has finished send a new request, so no results are cached.
+
+    Pass an instance (or ``True``) as ``single_flight`` to :class:`~.UptimeKumaApi` to enable it for the
+    safe socket calls (see :func:`~.retry.classify`) and the REST requests.
+
+    Example::
+
+        >>> api = UptimeKumaApi('INSERT_URL', single_flight=True)
+        >>> api.login('INSERT_USERNAME', 'INSERT_PASSWORD')
+        >>> with ThreadPoolExecutor(8) as executor:
+        ...     monitors = list(executor.map(api.get_monitor, [5] * 8))
+        >>> api.single_flight.snapshot()
+        {
+            'calls': 8,
+            'shared': 7,
+            'hit_rate': 0.875,
+            'events': {
+                'getMonitor': {
+                    'calls': 8,
+                    'shared': 7
+                }
+            }
+        }
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._flights: dict = {}
+        self._stats: dict = {}
+
+    def do(self, key: Hashable, func: Callable[[], Any], name: str = None) -> Any:
+        """
+        Calls ``func`` or waits for the call with the same key that is in flight.
+
+        :param key: The key of the request, e.g. the event and the arguments.
+        :param callable func: The function that sends the request.
+        :param str, optional name: The name of the request in the counters, defaults to the key.
+        :return: The result of the request. Threads that waited receive a deep copy.
+        """
+        name = name if name is not None else str(key)
+        with self._lock:
+            stats = self._stats.get(name)
+            if stats is None:
+                stats = self._stats[name] = [0, 0]
+            stats[0] += 1
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+            else:
+                flight.followers += 1
+                stats[1] += 1
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return deepcopy(flight.result)
+
+        result = None
+        try:
+            result = func()
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            # the caller may modify the result, the followers receive copies of an unmodified copy
+            if flight.error is None and flight.followers:
+                flight.result = deepcopy(result)
+            flight.done.set()
+        return result
+
+    def snapshot(self) -> dict:
+        """
+        Returns the number of reads and of reads that shared the result of another read.
+
+        :return: The counters in total and by event name or REST path.
+        :rtype: dict
+        """
+        with self._lock:
+            calls = sum(i[0] for i in self._stats.values())
+            shared = sum(i[1] for i in self._stats.values())
+            return {
+                "calls": calls,
+                "shared": shared,
+                "hit_rate": shared / calls if calls else 0.0,
+                "events": {name: {"calls": i[0], "shared": i[1]} for name, i in self._stats.items()},
+            }
+
+    def reset(self) -> None:
+        """
+        Resets the counters.
+        """
+        with self._lock:
+            self._stats = {}
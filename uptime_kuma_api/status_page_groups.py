@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+from typing import Callable, Iterable, Optional
+
+
+class GroupRule(object):
+    """A group of a status page and the rule that selects its monitors.
+
+    A monitor is selected if it has the tag (with the value, if given) and the filter returns ``True`` for it.
+    Tag rules are looked up in an index of the monitors by tag name, filters without a tag are called for every
+    monitor.
+
+    Example::
+
+        >>> rules = [
+        ...     GroupRule("Production", tag="env", value="production"),
+        ...     GroupRule("Websites", filter=lambda monitor: monitor["type"] == "http", send_url=True)
+        ... ]
+
+    :param str name: Name of the group.
+    :param str, optional tag: Name of the tag.
+    :param str, optional value: Value of the tag, defaults to any value.
+    :param callable, optional filter: Called with the monitor in the format of the server,
+                                      only monitors for which it returns ``True`` are selected.
+    :param bool, optional send_url: Show the url of newly added monitors on the status page, defaults to ``False``.
+    :raises ValueError: If neither tag nor filter is given.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        tag: str = None,
+        value: str = None,
+        filter: Callable[[dict], bool] = None,
+        send_url: bool = False,
+    ) -> None:
+        if tag is None and filter is None:
+            raise ValueError("A group rule needs a tag or a filter")
+        self.name = name
+        self.tag = tag
+        self.value = value
+        self.filter = filter
+        self.send_url = send_url
+
+    def __repr__(self) -> str:
+        return f"GroupRule({self.name!r}, tag={self.tag!r}, value={self.value!r})"
+
+    def select(self, monitors: list, tag_index: dict) -> list:
+        """
+        Returns the monitors of the group.
+
+        :param list monitors: All monitors.
+        :param dict tag_index: The monitors by tag name, see :func:`index_by_tag`.
+        :return: The selected monitors in the order of ``monitors`` or of the index.
+        :rtype: list
+        """
+        if self.tag is not None:
+            candidates = [
+                monitor for monitor, value in tag_index.get(self.tag, [])
+                if self.value is None or value == self.value
+            ]
+        else:
+            candidates = monitors
+        if self.filter is not None:
+            candidates = [monitor for monitor in candidates if self.filter(monitor)]
+        return candidates
+
+
+def index_by_tag(monitors: Iterable[dict]) -> dict:
+    """
+    Indexes monitors by the names of their tags.
+
+    :param monitors: The monitors in the format of the server or as returned by :meth:`~.UptimeKumaApi.get_monitors`.
+    :return: ``(monitor, tag value)`` tuples by tag name. A monitor is contained once for each value of a tag.
+    :rtype: dict
+    """
+    index = {}
+    for monitor in monitors:
+        for tag in monitor.get("tags") or []:
+            entries = index.setdefault(tag["name"], [])
+            entry = (monitor, tag.get("value") or "")
+            # a monitor can have a tag more than once with different values
+            if not any(i[0] is monitor and i[1] == entry[1] for i in entries):
+                entries.append(entry)
+    return index
+
+
+def build_groups(
+    rules: list[GroupRule],
+    monitors: Iterable[dict],
+    current: Optional[list] = None,
+    keep_other_groups: bool = False,
+    tag_index: dict = None,
+) -> list[dict]:
+    """
+    Builds the ``publicGroupList`` of a status page from group rules.
+
+    Groups and monitors that already exist in ``current`` keep their id, position and ``sendUrl`` setting, new
+    monitors are appended sorted by name. So a status page whose monitors did not change gets the same groups.
+
+    :param list rules: The group rules in the order of the groups.
+    :param monitors: The monitors in the format of the server or as returned by :meth:`~.UptimeKumaApi.get_monitors`.
+    :param list, optional current: The current ``publicGroupList`` of the status page.
+    :param bool, optional keep_other_groups: Keep the groups of ``current`` that have no rule (after the groups of the
+                                             rules), defaults to ``False``.
+    :param dict, optional tag_index: The result of :func:`index_by_tag` for ``monitors``, e.g. to share it between
+                                     status pages.
+    :return: The groups.
+    :rtype: list
+    """
+    monitors = list(monitors)
+    if tag_index is None:
+        tag_index = index_by_tag(monitors)
+    current_groups = {group["name"]: group for group in current or []}
+    groups = []
+    for rule in rules:
+        selected = {monitor["id"]: monitor for monitor in rule.select(monitors, tag_index)}
+        current_group = current_groups.get(rule.name) or {}
+        monitor_list = []
+        for monitor in current_group.get("monitorList") or []:
+            if monitor["id"] in selected:
+                item = {"id": monitor["id"]}
+                if "sendUrl" in monitor:
+                    item["sendUrl"] = bool(monitor["sendUrl"])
+                monitor_list.append(item)
+                del selected[monitor["id"]]
+        for monitor in sorted(selected.values(), key=lambda i: (i.get("name") or "", i["id"])):
+            monitor_list.append({"id": monitor["id"], "sendUrl": rule.send_url})
+        group = {"name": rule.name, "monitorList": monitor_list}
+        if current_group.get("id") is not None:
+            group["id"] = current_group["id"]
+        groups.append(group)
+    if keep_other_groups:
+        names = {rule.name for rule in rules}
+        groups.extend(dict(group) for group in current or [] if group["name"] not in names)
+    return groups
+
+
+def groups_changed(current: Optional[list], groups: list) -> bool:
+    """
+    Returns whether the groups, their order or their monitors differ. Other settings like ``sendUrl`` are ignored.
+
+    :param list current: The current ``publicGroupList``.
+    :param list groups: The new ``publicGroupList``.
+    :rtype: bool
+    """
+    def members(group_list):
+        return [
+            (group["name"], [i["id"] for i in group.get("monitorList") or []])
+            for group in group_list or []
+        ]
+
+    return members(current) != members(groups)
@@ -0,0 +1,283 @@
+from __future__ import annotations
+
+import functools
+import inspect
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+# public methods that return context managers, a span would only cover their creation
+_untraced_methods = {"raw", "wait_for_event"}
+
+
+class Span(object):
+    """A span that is passed to the code inside :meth:`Tracer.span`. The base implementation discards all attributes."""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """
+        Sets an attribute of the span.
+
+        :param str key: The attribute name.
+        :param value: The attribute value.
+        """
+        pass
+
+
+class Tracer(object):
+    """Interface of the tracing hooks of :class:`~.UptimeKumaApi`.
+
+    The client opens a span for each public method and for each underlying socket call and HTTP request.
+    Spans of calls and requests are nested in the span of the method that caused them,
+    e.g. ``edit_monitor`` contains ``get_monitor`` which contains the socket call ``getMonitor``.
+
+    Subclasses override :meth:`span`. The base implementation does nothing.
+    Bulk methods like ``add_monitors`` call the methods of the items in worker threads.
+    Tracers whose current span is bound to a thread also override :meth:`current` and :meth:`attach`
+    to nest these spans in the span of the bulk method.
+
+    Attributes of the spans:
+
+    - ``uptime_kuma.kind``: ``method``, ``call`` or ``http``
+    - ``uptime_kuma.event``: The event name of a socket call.
+    - ``uptime_kuma.request_size``: Size of the JSON encoded call data in bytes.
+    - ``uptime_kuma.response_size``: Size of the JSON encoded call response or of the HTTP response body in bytes.
+    - ``http.url``: The url of an HTTP request.
+    - ``http.status_code``: The status code of an HTTP response.
+    """
+
+    @contextmanager
+    def span(self, name: str, attributes: dict = None) -> Iterator[Span]:
+        """
+        Opens a span for the duration of the ``with`` block.
+
+        If an exception is raised inside the block, the span must be ended and the exception must be re-raised.
+
+        :param str name: The span name, e.g. the method or event name.
+        :param dict, optional attributes: Initial attributes of the span.
+        :return: A context manager that yields the span.
+        """
+        yield Span()
+
+    def current(self) -> Any:
+        """
+        Returns the current span or context of the calling thread, to be passed to :meth:`attach` in another thread.
+
+        :return: The current span or ``None``.
+        """
+        return None
+
+    @contextmanager
+    def attach(self, parent: Any) -> Iterator[None]:
+        """
+        Nests the spans that are opened in the calling thread in ``parent`` for the duration of the ``with`` block.
+
+        :param parent: The result of :meth:`current` in another thread.
+        :return: A context manager.
+        """
+        yield
+
+
+class RecordedSpan(Span):
+    """A span that was recorded by :class:`RecordingTracer`."""
+
+    __slots__ = ("name", "attributes", "start", "end", "error", "children")
+
+    def __init__(self, name: str, attributes: dict = None) -> None:
+        self.name = name
+        self.attributes = dict(attributes or {})
+        self.start = time.perf_counter()
+        self.end = None
+        self.error = None
+        self.children = []
+
+    def __repr__(self) -> str:
+        return f"RecordedSpan({self.name!r}, duration={self.duration!r}, children={len(self.children)})"
+
+    @property
+    def duration(self) -> float:
+        """The duration of the span in seconds or ``None`` if it has not ended yet."""
+        if self.end is None:
+            return None
+        return self.end - self.start
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def to_dict(self) -> dict:
+        """
+        Converts the span and its children to dicts.
+
+        :return: The span.
+        :rtype: dict
+        """
+        return {
+            "name": self.name,
+            "attributes": self.attributes.copy(),
+            "duration": self.duration,
+            "error": repr(self.error) if self.error is not None else None,
+            "children": [child.to_dict() for child in self.children],
+        }
+
+
+class RecordingTracer(Tracer):
+    """Keeps the span trees in memory, e.g. to find out which round trips a method causes.
+
+    Example::
+
+        >>> tracer = RecordingTracer()
+        >>> api = UptimeKumaApi('INSERT_URL', tracer=tracer)
+        >>> api.login('INSERT_USERNAME', 'INSERT_PASSWORD')
+        >>> tracer.clear()
+        >>> api.edit_monitor(1, interval=30)
+        >>> tracer.spans[0].to_dict()
+        {
+            'name': 'edit_monitor',
+            'attributes': {'uptime_kuma.kind': 'method'},
+            'duration': 0.412,
+            'error': None,
+            'children': [
+                {
+                    'name': 'get_monitor',
+                    ...
+                },
+                {
+                    'name': 'editMonitor',
+                    'attributes': {
+                        'uptime_kuma.kind': 'call',
+                        'uptime_kuma.event': 'editMonitor',
+                        'uptime_kuma.request_size': 1854,
+                        'uptime_kuma.response_size': 48
+                    },
+                    ...
+                }
+            ]
+        }
+
+    :param int, optional max_spans: Maximum number of kept root spans. Older spans are discarded. Defaults to ``1000``.
+    """
+
+    def __init__(self, max_spans: int = 1000) -> None:
+        self.max_spans = max_spans
+        self.spans: list[RecordedSpan] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _stack(self) -> list:
+        try:
+            return self._local.stack
+        except AttributeError:
+            self._local.stack = []
+            return self._local.stack
+
+    @contextmanager
+    def span(self, name: str, attributes: dict = None) -> Iterator[RecordedSpan]:
+        stack = self._stack()
+        span = RecordedSpan(name, attributes)
+        if stack:
+            stack[-1].children.append(span)
+        stack.append(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.error = e
+            raise
+        finally:
+            span.end = time.perf_counter()
+            stack.pop()
+            if not stack:
+                with self._lock:
+                    self.spans.append(span)
+                    if len(self.spans) > self.max_spans:
+                        del self.spans[:len(self.spans) - self.max_spans]
+
+    def current(self) -> Any:
+        stack = self._stack()
+        return stack[-1] if stack else None
+
+    @contextmanager
+    def attach(self, parent: Any) -> Iterator[None]:
+        # the parent is recorded by the thread that opened it, the spans of this thread become its children
+        outer = self._stack()
+        self._local.stack = [parent] if parent is not None else []
+        try:
+            yield
+        finally:
+            self._local.stack = outer
+
+    def clear(self) -> None:
+        """
+        Discards all recorded spans.
+        """
+        with self._lock:
+            self.spans = []
+
+
+class OpenTelemetryTracer(Tracer):
+    """Forwards the spans to OpenTelemetry.
+
+    Requires the ``opentelemetry-api`` package. The spans are nested in the current OpenTelemetry span.
+
+    Example::
+
+        >>> from opentelemetry import trace
+        >>> api = UptimeKumaApi('INSERT_URL', tracer=OpenTelemetryTracer(trace.get_tracer("my-app")))
+
+    :param tracer: An OpenTelemetry tracer, defaults to the tracer ``uptime_kuma_api`` of the global tracer provider.
+    :raises ImportError: If OpenTelemetry is not installed.
+    """
+
+    def __init__(self, tracer: Any = None) -> None:
+        if tracer is None:
+            from opentelemetry import trace
+
+            tracer = trace.get_tracer("uptime_kuma_api")
+        self._tracer = tracer
+
+    @contextmanager
+    def span(self, name: str, attributes: dict = None) -> Iterator[Any]:
+        with self._tracer.start_as_current_span(name, attributes=attributes) as span:
+            yield span
+
+    def current(self) -> Any:
+        from opentelemetry import context
+
+        return context.get_current()
+
+    @contextmanager
+    def attach(self, parent: Any) -> Iterator[None]:
+        from opentelemetry import context
+
+        token = context.attach(parent)
+        try:
+            yield
+        finally:
+            context.detach(token)
+
+
+def _traced_method(tracer: Tracer, name: str, method: Any) -> Any:
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        with tracer.span(name, {"uptime_kuma.kind": "method"}):
+            return method(*args, **kwargs)
+
+    return wrapper
+
+
+def trace_methods(obj: Any, tracer: Tracer) -> None:
+    """
+    Replaces the public methods of an object with wrappers that open a span for each call.
+
+    Only the instance is changed, other instances of the class are not traced.
+
+    :param obj: The object, e.g. an :class:`~.UptimeKumaApi` instance.
+    :param Tracer tracer: The tracer.
+    """
+    names = set()
+    for cls in type(obj).__mro__:
+        for name, value in vars(cls).items():
+            if name.startswith("_") or name in _untraced_methods or name in names:
+                continue
+            names.add(name)
+            if inspect.isfunction(value):
+                setattr(obj, name, _traced_method(tracer, name, getattr(obj, name)))